@@ -1,29 +1,88 @@
+from typing import Optional
 from flask import Flask
 from app_state import AppState
 from manager.account_manager import AccountManager
 from manager.transaction_manager import TransactionManager
 from manager.budget_manager import BudgetManager
+from manager.analytics_executor import AnalyticsExecutor
+from manager.job_manager import JobManager, DEFAULT_JOB_EXPORT_RETENTION, DEFAULT_JOB_WORKERS
 from api.routes.account_routes import account_bp
 from api.routes.transaction_routes import transaction_bp
 from api.routes.budget_routes import budget_bp
+from api.routes.system_routes import system_bp, metrics_bp
+from api.routes.job_routes import job_bp
+from api.instrumentation import instrument_app
+from utils.cache import DEFAULT_CACHE_TTL, LRUCache
 
 class ApiConnection:
-    def __init__(self, app_state: AppState):
+    def __init__(
+        self,
+        app_state: AppState,
+        analytics_executor: Optional[AnalyticsExecutor] = None,
+        job_workers: int = DEFAULT_JOB_WORKERS,
+        job_export_retention: float = DEFAULT_JOB_EXPORT_RETENTION,
+        entity_cache_ttl: Optional[float] = DEFAULT_CACHE_TTL,
+    ):
         self.app = Flask(__name__)
         
+        # Entity caches behind the single-item GET endpoints. Writes through
+        # this app evict their entry; writes by other worker processes are
+        # only picked up when the entry expires, so servers running several
+        # workers pass a short entity_cache_ttl
+        caches = {
+            'accounts': LRUCache(ttl=entity_cache_ttl),
+            'transactions': LRUCache(ttl=entity_cache_ttl),
+            'budgets': LRUCache(ttl=entity_cache_ttl),
+            # Statistics, category summary and forecast results
+            'analytics': LRUCache(max_size=256),
+        }
+
         # Store managers in app config for access in routes
-        account_manager = AccountManager(app_state.account_dao)
-        transaction_manager = TransactionManager(app_state.transaction_dao)
-        budget_manager = BudgetManager(app_state.budget_dao)
+        account_manager = AccountManager(app_state.account_dao, caches['accounts'])
+        transaction_manager = TransactionManager(
+            app_state.transaction_dao,
+            app_state.monthly_totals_dao,
+            cache=caches['transactions'],
+            result_cache=caches['analytics'],
+            table_version_dao=app_state.table_version_dao,
+            analytics_executor=analytics_executor,
+        )
+        # Background jobs compute on their own threads, without the analytics
+        # executor's request timeout; their results still fill the cache
+        job_manager = JobManager(
+            app_state.job_dao,
+            TransactionManager(
+                app_state.transaction_dao,
+                app_state.monthly_totals_dao,
+                result_cache=caches['analytics'],
+                table_version_dao=app_state.table_version_dao,
+            ),
+            max_workers=job_workers,
+            export_retention=job_export_retention,
+        )
+        budget_manager = BudgetManager(app_state.budget_dao, app_state.monthly_totals_dao, caches['budgets'])
         
         self.app.config['account_manager'] = account_manager
         self.app.config['transaction_manager'] = transaction_manager
         self.app.config['budget_manager'] = budget_manager
+        self.app.config['job_manager'] = job_manager
+        self.app.config['database'] = app_state.db
+        self.app.config['caches'] = caches
+        self.app.config['table_versions'] = app_state.table_version_dao
+        self.app.config['analytics_executor'] = analytics_executor
         
         # Register blueprints
         self.app.register_blueprint(account_bp, url_prefix='/api')
         self.app.register_blueprint(transaction_bp, url_prefix='/api')
         self.app.register_blueprint(budget_bp, url_prefix='/api')
+        self.app.register_blueprint(system_bp, url_prefix='/api')
+        self.app.register_blueprint(job_bp, url_prefix='/api')
+        self.app.register_blueprint(metrics_bp)
+
+        instrument_app(self.app)
 
-    def run_app(self):
-        self.app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    def run_app(self, debug: bool = False, host: str = '0.0.0.0', port: int = 5000):
+        """Flask's development server: a single process, with the reloader
+        and debugger when ``debug`` is set. Production serving goes through
+        wsgi.py."""
+        self.app.run(debug=debug, host=host, port=port)
\ No newline at end of file
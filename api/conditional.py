@@ -0,0 +1,44 @@
+import functools
+import hashlib
+from typing import Sequence
+from flask import current_app, make_response, request
+
+def compute_etag(tables: Sequence[str]) -> str:
+    """Strong ETag of the current request's representation: the request path
+    and query, the Accept header and the data versions of ``tables``."""
+    versions = current_app.config['table_versions'].read_many(tables)
+    parts = [request.full_path, request.headers.get('Accept', '')]
+    parts.extend(f'{table}={versions[table]}' for table in tables)
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+def conditional_get(*tables: str):
+    """Route decorator for GET endpoints whose response only depends on the
+    request and on the rows of ``tables``.
+
+    A matching If-None-Match is answered with 304 before the view runs, so
+    neither the DAO query nor the statistics code is executed; otherwise the
+    view's 200 response is tagged with the ETag. The versions are read
+    before the view, so a concurrent write can only make the tag older than
+    the body (the next poll downloads again), never newer.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                etag = compute_etag(tables)
+            except Exception:
+                # Versions unavailable: serve the request without a tag
+                return view(*args, **kwargs)
+
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            response.vary.add('Accept')
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,46 @@
+import tempfile
+from typing import Iterable, Sequence
+from flask import Response, send_file
+from manager.ledger_exporter import (
+    csv_chunks,
+    parquet_available,
+    write_parquet,
+)
+
+EXPORT_FORMATS = ('csv', 'parquet')
+CSV_MIMETYPE = 'text/csv'
+PARQUET_MIMETYPE = 'application/vnd.apache.parquet'
+
+def check_export_format(export_format: str, valid_formats: Sequence[str] = EXPORT_FORMATS) -> None:
+    """Raise ValueError with a client-facing message if the format cannot be served."""
+    if export_format not in valid_formats:
+        raise ValueError(f'Invalid format. Valid formats: {list(valid_formats)}')
+    if export_format == 'parquet' and not parquet_available():
+        raise ValueError('Parquet export is not available: the pyarrow package is not installed')
+
+def export_response(
+    columns: Sequence[str],
+    row_batches: Iterable[Sequence],
+    export_format: str,
+    basename: str,
+) -> Response:
+    """Build a download response for the rows in an already checked format.
+
+    CSV is streamed to the client batch by batch. Parquet keeps its footer
+    at the end of the file, so it is written to a temporary file (one row
+    group at a time) and then sent from disk; memory stays constant either way.
+    """
+    download_name = f'{basename}.{export_format}'
+    if export_format == 'csv':
+        response = Response(csv_chunks(columns, row_batches), mimetype=CSV_MIMETYPE)
+        response.headers['Content-Disposition'] = f'attachment; filename={download_name}'
+        return response
+
+    spool = tempfile.TemporaryFile()
+    try:
+        write_parquet(columns, row_batches, spool)
+        spool.seek(0)
+    except Exception:
+        spool.close()
+        raise
+    return send_file(spool, mimetype=PARQUET_MIMETYPE, as_attachment=True, download_name=download_name)
@@ -0,0 +1,28 @@
+import time
+from flask import Flask, g, request
+from utils import metrics
+from utils.metrics import HTTP_REQUEST_DURATION
+
+def instrument_app(app: Flask) -> None:
+    """Time every request into http_request_duration_seconds, labelled with
+    the method, the matched URL rule (not the raw path, to keep the label
+    set bounded) and the response status. Streamed bodies are timed until
+    the response object is returned, not until the last chunk is sent."""
+
+    @app.before_request
+    def start_request_timer():
+        if metrics.enabled():
+            g.request_started = time.perf_counter()
+
+    @app.after_request
+    def observe_request_duration(response):
+        started = g.pop('request_started', None)
+        if started is not None:
+            rule = request.url_rule.rule if request.url_rule is not None else '<unmatched>'
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                request.method,
+                rule,
+                str(response.status_code),
+            )
+        return response
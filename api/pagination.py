@@ -0,0 +1,51 @@
+import base64
+import json
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Encode a keyset position into an opaque, URL-safe cursor token."""
+    payload = json.dumps(list(key), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(token: str, key_parsers: Sequence[Callable[[Any], Any]]) -> Tuple[Any, ...]:
+    """Decode a cursor token and convert each key part with its parser.
+
+    Raises ValueError if the token is malformed or does not match the
+    expected key shape.
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if not isinstance(key, list) or len(key) != len(key_parsers):
+            raise ValueError('unexpected key shape')
+        return tuple(parse(value) for parse, value in zip(key_parsers, key))
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError('Invalid cursor')
+
+def parse_page_args(
+    args: Mapping[str, str],
+    key_parsers: Sequence[Callable[[Any], Any]],
+) -> Tuple[int, Optional[Tuple[Any, ...]]]:
+    """Read the ``limit`` and ``cursor`` query parameters.
+
+    The limit defaults to DEFAULT_PAGE_SIZE and is capped at MAX_PAGE_SIZE.
+    Raises ValueError with a client-facing message on bad input.
+    """
+    limit = DEFAULT_PAGE_SIZE
+    if 'limit' in args:
+        try:
+            limit = int(args['limit'])
+        except (ValueError, TypeError) as e:
+            raise ValueError(f'Invalid limit. Must be a positive integer: {str(e)}')
+        if limit <= 0:
+            raise ValueError('limit must be > 0')
+        limit = min(limit, MAX_PAGE_SIZE)
+
+    after = None
+    if args.get('cursor'):
+        after = decode_cursor(args['cursor'], key_parsers)
+
+    return limit, after
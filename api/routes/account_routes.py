@@ -6,19 +6,37 @@ from exceptions.finance_manager_exception import (
     FinanceManagerException,
 )
 from api.serializers import account_to_dict
+from api.pagination import parse_page_args, encode_cursor
+from api.conditional import conditional_get
+from api.exports import check_export_format, export_response
+from manager.ledger_exporter import ACCOUNT_COLUMNS
 
 account_bp = Blueprint('accounts', __name__)
 
 @account_bp.route('/accounts', methods=['GET'])
+@conditional_get('accounts')
 def list_all_accounts():
     try:
+        # Parse pagination parameters (cursor encodes the last id seen)
+        try:
+            limit, after = parse_page_args(request.args, (int,))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
         account_manager = current_app.config['account_manager']
-        accounts = account_manager.get_all_accounts()
+        accounts, next_id = account_manager.get_accounts_page(
+            limit, after[0] if after is not None else None
+        )
         
         return jsonify({
             'success': True,
             'accounts': [account_to_dict(account) for account in accounts],
-            'count': len(accounts)
+            'count': len(accounts),
+            'limit': limit,
+            'next_cursor': encode_cursor([next_id]) if next_id is not None else None
         }), 200
     except Exception as e:
         return jsonify({
@@ -26,6 +44,28 @@ def list_all_accounts():
             'error': str(e)
         }), 500
 
+@account_bp.route('/accounts/export', methods=['GET'])
+@conditional_get('accounts')
+def export_accounts():
+    """Download every account as CSV (default) or Parquet."""
+    try:
+        export_format = request.args.get('format', 'csv')
+        try:
+            check_export_format(export_format)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+        account_manager = current_app.config['account_manager']
+        return export_response(ACCOUNT_COLUMNS, account_manager.iter_account_rows(), export_format, 'accounts')
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @account_bp.route('/accounts/<int:account_id>', methods=['GET'])
 def get_account_by_id(account_id: int):
     try:
@@ -70,17 +110,14 @@ def create_account():
         
         account_manager = current_app.config['account_manager']
         
-        # Create account using manager
-        account_manager.create_account(
+        # Create account using manager; the stored row comes back from the INSERT
+        account = account_manager.create_account(
             account_id=data['id'],
             name=data['name'],
             account_type=data['account_type'],
             currency=data['currency']
         )
         
-        # Fetch the created account to return using manager method
-        account = account_manager.get_account_by_id(data['id'])
-        
         return jsonify({
             'success': True,
             'message': 'Account created successfully',
@@ -123,10 +160,7 @@ def update_account(account_id: int):
             }), 400
         
         account_manager = current_app.config['account_manager']
-        account_manager.modify_account(account_id, data['name'])
-        
-        # Fetch the updated account to return using manager method
-        account = account_manager.get_account_by_id(account_id)
+        account = account_manager.modify_account(account_id, data['name'])
         
         return jsonify({
             'success': True,
@@ -1,24 +1,84 @@
 from flask import Blueprint, request, jsonify, current_app
+from datetime import date
 from exceptions.finance_manager_exception import (
     DuplicateIDException,
     NotFoundIDException,
 )
-from api.serializers import budget_to_dict
+from api.serializers import budget_to_dict, parse_amount
+from api.pagination import parse_page_args, encode_cursor
+from api.conditional import conditional_get
+from api.exports import check_export_format, export_response
+from manager.ledger_exporter import BUDGET_COLUMNS
 from utils.enums import Category
 
 budget_bp = Blueprint('budgets', __name__)
 
 @budget_bp.route('/budgets', methods=['GET'])
+@conditional_get('budgets')
 def list_all_budgets():
-    """Get all budgets."""
+    """Get one page of budgets, newest month first."""
     try:
+        # Parse pagination parameters (cursor encodes the last (month, id) seen)
+        try:
+            limit, after = parse_page_args(request.args, (str, int))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
         budget_manager = current_app.config['budget_manager']
-        budgets = budget_manager.get_all_budgets()
+        budgets, next_key = budget_manager.get_budgets_page(limit, after)
         
         return jsonify({
             'success': True,
             'budgets': [budget_to_dict(budget) for budget in budgets],
-            'count': len(budgets)
+            'count': len(budgets),
+            'limit': limit,
+            'next_cursor': encode_cursor(next_key) if next_key is not None else None
+        }), 200
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@budget_bp.route('/budgets/vs-actual', methods=['GET'])
+@conditional_get('budgets', 'transactions')
+def get_budget_vs_actual():
+    """Compare each budget of a month with the actual spending in its category."""
+    try:
+        month = request.args.get('month')
+        if not month:
+            return jsonify({
+                'success': False,
+                'error': 'month is required (YYYY-MM)'
+            }), 400
+
+        try:
+            date.fromisoformat(f'{month}-01')
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid month format. Expected YYYY-MM'
+            }), 400
+
+        budget_manager = current_app.config['budget_manager']
+        comparison = budget_manager.get_budget_vs_actual(month)
+
+        return jsonify({
+            'success': True,
+            'month': month,
+            'budgets': [
+                {
+                    **budget_to_dict(budget),
+                    'spent': spent,
+                    'remaining': budget.limit_amount - spent,
+                    'over_budget': spent > budget.limit_amount,
+                }
+                for budget, spent in comparison
+            ],
+            'count': len(comparison)
         }), 200
     except Exception as e:
         return jsonify({
@@ -26,6 +86,28 @@ def list_all_budgets():
             'error': str(e)
         }), 500
 
+@budget_bp.route('/budgets/export', methods=['GET'])
+@conditional_get('budgets')
+def export_budgets():
+    """Download every budget as CSV (default) or Parquet."""
+    try:
+        export_format = request.args.get('format', 'csv')
+        try:
+            check_export_format(export_format)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+        budget_manager = current_app.config['budget_manager']
+        return export_response(BUDGET_COLUMNS, budget_manager.iter_budget_rows(), export_format, 'budgets')
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @budget_bp.route('/budgets/<int:budget_id>', methods=['GET'])
 def get_budget_by_id(budget_id: int):
     """Get a budget by ID."""
@@ -79,19 +161,24 @@ def create_budget():
                 'error': f'Invalid category. Valid categories: {[c.value for c in Category]}'
             }), 400
         
+        try:
+            limit_amount = parse_amount(data['limit_amount'], 'limit_amount')
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
         budget_manager = current_app.config['budget_manager']
         
-        # Create budget using manager
-        budget_manager.create_budget(
+        # Create budget using manager; the stored row comes back from the INSERT
+        budget = budget_manager.create_budget(
             budget_id=data['id'],
             month=data['month'],
             category=category,
-            limit_amount=float(data['limit_amount']),
+            limit_amount=limit_amount,
         )
         
-        # Fetch the created budget to return using manager method
-        budget = budget_manager.get_budget_by_id(data['id'])
-        
         return jsonify({
             'success': True,
             'message': 'Budget created successfully',
@@ -128,15 +215,20 @@ def update_budget(budget_id: int):
                 'error': 'Missing required field: limit_amount'
             }), 400
         
+        try:
+            limit_amount = parse_amount(data['limit_amount'], 'limit_amount')
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
         budget_manager = current_app.config['budget_manager']
-        budget_manager.modify_budget(
+        budget = budget_manager.modify_budget(
             budget_id=budget_id,
-            limit_amount=float(data['limit_amount']),
+            limit_amount=limit_amount,
         )
         
-        # Fetch the updated budget to return using manager method
-        budget = budget_manager.get_budget_by_id(budget_id)
-        
         return jsonify({
             'success': True,
             'message': 'Budget updated successfully',
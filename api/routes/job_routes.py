@@ -0,0 +1,110 @@
+from flask import Blueprint, request, jsonify, current_app, send_file, url_for
+from exceptions.finance_manager_exception import (
+    JobQueueFullException,
+    NotFoundIDException,
+)
+from api.serializers import job_to_dict
+from api.exports import CSV_MIMETYPE, PARQUET_MIMETYPE
+from utils.enums import JobKind
+
+job_bp = Blueprint('jobs', __name__)
+
+@job_bp.route('/jobs', methods=['POST'])
+def submit_job():
+    """Queue a statistics, category_summary, forecast or export job. Answers
+    202 with the queued job; poll its Location for the status and result."""
+    try:
+        data = request.get_json(silent=True)
+
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'Request body is required'
+            }), 400
+
+        if 'kind' not in data:
+            return jsonify({
+                'success': False,
+                'error': f'Missing required field: kind. Valid kinds: {[k.value for k in JobKind]}'
+            }), 400
+
+        try:
+            kind = JobKind(data['kind'])
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': f'Invalid kind. Valid kinds: {[k.value for k in JobKind]}'
+            }), 400
+
+        job_manager = current_app.config['job_manager']
+        try:
+            job = job_manager.submit_job(kind, data.get('params') or {})
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+        return jsonify({
+            'success': True,
+            'job': job_to_dict(job)
+        }), 202, {'Location': url_for('jobs.get_job', job_id=job.id)}
+
+    except JobQueueFullException as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 503, {'Retry-After': '5'}
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@job_bp.route('/jobs/<int:job_id>', methods=['GET'])
+def get_job(job_id: int):
+    """Status, progress and, once finished, the result or error of a job."""
+    try:
+        job_manager = current_app.config['job_manager']
+        job = job_manager.get_job(job_id)
+
+        return jsonify({
+            'success': True,
+            'job': job_to_dict(job)
+        }), 200
+    except NotFoundIDException as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 404
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@job_bp.route('/jobs/<int:job_id>/download', methods=['GET'])
+def download_job_file(job_id: int):
+    """The file written by a succeeded export job."""
+    try:
+        job_manager = current_app.config['job_manager']
+        try:
+            path = job_manager.get_export_path(job_id)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 409
+
+        mimetype = PARQUET_MIMETYPE if path.suffix == '.parquet' else CSV_MIMETYPE
+        return send_file(path, mimetype=mimetype, as_attachment=True, download_name=f'transactions{path.suffix}')
+    except NotFoundIDException as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 404
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
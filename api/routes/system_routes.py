@@ -0,0 +1,67 @@
+from flask import Blueprint, Response, jsonify, current_app
+from utils import metrics
+
+system_bp = Blueprint('system', __name__)
+
+# Registered without the /api prefix, where Prometheus looks by default
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Request, SQL statement and analytics timings of this process in the
+    Prometheus text format."""
+    if not metrics.enabled():
+        return jsonify({
+            'success': False,
+            'error': 'Metrics are disabled (PF_METRICS=0)'
+        }), 404
+    return Response(metrics.REGISTRY.render(), content_type=metrics.CONTENT_TYPE)
+
+@system_bp.route('/system/db-pool', methods=['GET'])
+def get_db_pool_stats():
+    """Get connection pool counters (hits, misses, waits) for sizing."""
+    try:
+        database = current_app.config['database']
+
+        return jsonify({
+            'success': True,
+            'pool': database.pool_stats()
+        }), 200
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@system_bp.route('/system/analytics', methods=['GET'])
+def get_analytics_stats():
+    """Get analytics executor counters (queue wait vs compute time, rejections,
+    timeouts). ``analytics`` is null when analytics run on the request thread."""
+    try:
+        analytics_executor = current_app.config['analytics_executor']
+
+        return jsonify({
+            'success': True,
+            'analytics': analytics_executor.stats() if analytics_executor is not None else None
+        }), 200
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@system_bp.route('/system/cache', methods=['GET'])
+def get_cache_stats():
+    """Get hit/miss/eviction counters of the entity caches."""
+    try:
+        caches = current_app.config['caches']
+
+        return jsonify({
+            'success': True,
+            'caches': {name: cache.stats() for name, cache in caches.items()}
+        }), 200
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
@@ -1,25 +1,133 @@
-from flask import Blueprint, request, jsonify, current_app
+import io
+import json
+from flask import Blueprint, Response, request, jsonify, current_app
 from datetime import date
 from exceptions.finance_manager_exception import (
+    AnalyticsBusyException,
+    AnalyticsTimeoutException,
     DuplicateIDException,
     NotFoundIDException,
 )
-from api.serializers import transaction_to_dict
+from api.serializers import transaction_to_dict, transaction_row_to_dict, dict_to_transaction, parse_amount
+from api.pagination import parse_page_args, encode_cursor
+from api.conditional import conditional_get
+from api.exports import EXPORT_FORMATS, check_export_format, export_response
 from utils.enums import Category, TransactionType
-from manager.statistics_manager import transaction_amount_statistics, transaction_category_summary, monthly_amount_forecast_linear
+from database.transaction_dao import DEFAULT_BATCH_SIZE
+from manager.statement_importer import StatementImporter, IMPORT_BATCH_SIZE
+from manager.ledger_exporter import TRANSACTION_COLUMNS
 
 transaction_bp = Blueprint('transactions', __name__)
 
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+def _wants_ndjson() -> bool:
+    return (
+        request.args.get('format') == 'ndjson'
+        or request.accept_mimetypes.best == NDJSON_MIMETYPE
+    )
+
+def _parse_filter_args():
+    """Parse the optional start_date, end_date and transaction_type query
+    parameters. Raises ValueError with a client-facing message."""
+    start_date = None
+    end_date = None
+    transaction_type = None
+
+    if 'start_date' in request.args:
+        try:
+            start_date = date.fromisoformat(request.args['start_date'])
+        except (ValueError, TypeError) as e:
+            raise ValueError(f'Invalid start_date format. Expected ISO format (YYYY-MM-DD): {str(e)}')
+
+    if 'end_date' in request.args:
+        try:
+            end_date = date.fromisoformat(request.args['end_date'])
+        except (ValueError, TypeError) as e:
+            raise ValueError(f'Invalid end_date format. Expected ISO format (YYYY-MM-DD): {str(e)}')
+
+    if 'transaction_type' in request.args:
+        try:
+            transaction_type = TransactionType(request.args['transaction_type'])
+        except (ValueError, KeyError):
+            raise ValueError(f'Invalid transaction_type. Valid types: {[t.value for t in TransactionType]}')
+
+    if start_date is not None and end_date is not None and start_date > end_date:
+        raise ValueError('start_date must be before or equal to end_date')
+
+    return start_date, end_date, transaction_type
+
+def _analytics_unavailable(e):
+    """503 with Retry-After when the analytics queue is full, 504 when the
+    computation did not finish in time."""
+    if isinstance(e, AnalyticsBusyException):
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 503, {'Retry-After': '1'}
+    return jsonify({
+        'success': False,
+        'error': str(e)
+    }), 504
+
+def _ndjson_lines(row_batches):
+    # One chunk per page: constant memory, few write calls
+    for rows in row_batches:
+        yield ''.join(
+            json.dumps(transaction_row_to_dict(row), separators=(',', ':')) + '\n'
+            for row in rows
+        )
+
+def _stream_transactions(download_name=None) -> Response:
+    start_date, end_date, transaction_type = _parse_filter_args()
+    transaction_manager = current_app.config['transaction_manager']
+    row_batches = transaction_manager.iter_filtered_transaction_pages(
+        start_date=start_date,
+        end_date=end_date,
+        transaction_type=transaction_type
+    )
+
+    response = Response(_ndjson_lines(row_batches), mimetype=NDJSON_MIMETYPE)
+    if download_name is not None:
+        response.headers['Content-Disposition'] = f'attachment; filename={download_name}'
+    return response
+
 @transaction_bp.route('/transactions', methods=['GET'])
+@conditional_get('transactions')
 def list_all_transactions():
     try:
+        # Streaming mode: every matching row as NDJSON, no pagination
+        if _wants_ndjson():
+            try:
+                return _stream_transactions()
+            except ValueError as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 400
+
+        # Parse pagination parameters (cursor encodes the last (date, id) seen)
+        try:
+            limit, after = parse_page_args(request.args, (date.fromisoformat, int))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
         transaction_manager = current_app.config['transaction_manager']
-        transactions = transaction_manager.get_all_transactions()
+        transactions, next_key = transaction_manager.get_transactions_page(limit, after)
+
+        next_cursor = None
+        if next_key is not None:
+            next_cursor = encode_cursor([next_key[0].isoformat(), next_key[1]])
 
         return jsonify({
             'success': True,
             'transactions': [transaction_to_dict(transaction) for transaction in transactions],
-            'count': len(transactions)
+            'count': len(transactions),
+            'limit': limit,
+            'next_cursor': next_cursor
         }), 200
     except Exception as e:
         return jsonify({
@@ -27,6 +135,36 @@ def list_all_transactions():
             'error': str(e)
         }), 500
 
+@transaction_bp.route('/transactions/export', methods=['GET'])
+@conditional_get('transactions')
+def export_transactions():
+    """Download every (optionally filtered) transaction as NDJSON, CSV or Parquet."""
+    try:
+        try:
+            export_format = request.args.get('format', 'ndjson')
+            check_export_format(export_format, ('ndjson',) + EXPORT_FORMATS)
+            if export_format == 'ndjson':
+                return _stream_transactions(download_name='transactions.ndjson')
+
+            start_date, end_date, transaction_type = _parse_filter_args()
+            transaction_manager = current_app.config['transaction_manager']
+            row_batches = transaction_manager.iter_filtered_transaction_pages(
+                start_date=start_date,
+                end_date=end_date,
+                transaction_type=transaction_type
+            )
+            return export_response(TRANSACTION_COLUMNS, row_batches, export_format, 'transactions')
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @transaction_bp.route('/transactions/<int:transaction_id>', methods=['GET'])
 def get_transaction_by_id(transaction_id: int):
     try:
@@ -98,22 +236,27 @@ def create_transaction():
                     'error': f'Invalid transaction_type. Valid types: {[t.value for t in TransactionType]}'
                 }), 400
         
+        try:
+            amount = parse_amount(data['amount'])
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
         transaction_manager = current_app.config['transaction_manager']
         
-        # Create transaction using manager
-        transaction_manager.create_transaction(
+        # Create transaction using manager; the stored row comes back from the INSERT
+        transaction = transaction_manager.create_transaction(
             transaction_id=data['id'],
             account_id=data['account_id'],
             trx_date=trx_date,
-            amount=float(data['amount']),
+            amount=amount,
             description=data.get('description', ''),
             category=category,
             transaction_type=transaction_type,
         )
         
-        # Fetch the created transaction to return using manager method
-        transaction = transaction_manager.get_transaction_by_id(data['id'])
-        
         return jsonify({
             'success': True,
             'message': 'Transaction created successfully',
@@ -132,6 +275,138 @@ def create_transaction():
             'error': str(e)
         }), 500
 
+@transaction_bp.route('/transactions/bulk', methods=['POST'])
+def create_transactions_bulk():
+    """Create many transactions from a JSON array in a single database transaction."""
+    try:
+        data = request.get_json()
+
+        if not isinstance(data, list) or not data:
+            return jsonify({
+                'success': False,
+                'error': 'Request body must be a non-empty JSON array of transactions'
+            }), 400
+
+        batch_size = DEFAULT_BATCH_SIZE
+        if 'batch_size' in request.args:
+            try:
+                batch_size = int(request.args['batch_size'])
+                if batch_size <= 0:
+                    raise ValueError('must be > 0')
+            except (ValueError, TypeError) as e:
+                return jsonify({
+                    'success': False,
+                    'error': f'Invalid batch_size. Must be a positive integer: {str(e)}'
+                }), 400
+
+        # Validate every row first; invalid rows are reported, not inserted
+        errors = []
+        transactions = []
+        positions = []
+        for index, item in enumerate(data):
+            try:
+                transactions.append(dict_to_transaction(item))
+                positions.append(index)
+            except ValueError as e:
+                errors.append({
+                    'index': index,
+                    'id': item.get('id') if isinstance(item, dict) else None,
+                    'error': str(e)
+                })
+
+        transaction_manager = current_app.config['transaction_manager']
+        failures = transaction_manager.create_transactions_bulk(transactions, batch_size)
+
+        for position, error in failures:
+            errors.append({
+                'index': positions[position],
+                'id': transactions[position].id,
+                'error': error
+            })
+        errors.sort(key=lambda e: e['index'])
+
+        inserted = len(data) - len(errors)
+        if not errors:
+            status = 201
+        elif inserted > 0:
+            status = 207
+        else:
+            status = 400
+
+        return jsonify({
+            'success': not errors,
+            'inserted': inserted,
+            'failed': len(errors),
+            'errors': errors
+        }), status
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@transaction_bp.route('/transactions/import', methods=['POST'])
+def import_transactions():
+    """Import a CSV bank statement uploaded as multipart/form-data (field ``file``)."""
+    try:
+        upload = request.files.get('file')
+        if upload is None:
+            return jsonify({
+                'success': False,
+                'error': "A CSV file is required in the 'file' form field"
+            }), 400
+
+        batch_size = IMPORT_BATCH_SIZE
+        if 'batch_size' in request.args:
+            try:
+                batch_size = int(request.args['batch_size'])
+                if batch_size <= 0:
+                    raise ValueError('must be > 0')
+            except (ValueError, TypeError) as e:
+                return jsonify({
+                    'success': False,
+                    'error': f'Invalid batch_size. Must be a positive integer: {str(e)}'
+                }), 400
+
+        importer = StatementImporter(
+            current_app.config['transaction_manager'],
+            batch_size,
+            request.args.get('date_format'),
+        )
+        # Parse straight from the upload stream instead of reading it into memory
+        stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+        try:
+            report = importer.import_csv(stream)
+        except (ValueError, UnicodeDecodeError) as e:
+            return jsonify({
+                'success': False,
+                'error': f'Invalid statement: {str(e)}'
+            }), 400
+
+        if not report.errors:
+            status = 201
+        elif report.inserted > 0:
+            status = 207
+        else:
+            status = 400
+
+        return jsonify({
+            'success': not report.errors,
+            'rows_read': report.rows_read,
+            'inserted': report.inserted,
+            'failed': len(report.errors),
+            'errors': [{'line': line, 'error': error} for line, error in report.errors],
+            'elapsed_seconds': report.elapsed,
+            'rows_per_second': report.rows_per_second
+        }), status
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @transaction_bp.route('/transactions/<int:transaction_id>', methods=['PUT'])
 def update_transaction(transaction_id: int):
     try:
@@ -173,16 +448,13 @@ def update_transaction(transaction_id: int):
                 }), 400
         
         transaction_manager = current_app.config['transaction_manager']
-        transaction_manager.modify_transaction(
+        transaction = transaction_manager.modify_transaction(
             transaction_id=transaction_id,
             description=data['description'],
             category=category,
             transaction_type=transaction_type,
         )
         
-        # Fetch the updated transaction to return using manager method
-        transaction = transaction_manager.get_transaction_by_id(transaction_id)
-        
         return jsonify({
             'success': True,
             'message': 'Transaction updated successfully',
@@ -225,6 +497,7 @@ def delete_transaction(transaction_id: int):
         }), 500
 
 @transaction_bp.route('/transactions/statistics', methods=['GET'])
+@conditional_get('transactions')
 def get_transaction_statistics():
     try:
         # Parse query parameters
@@ -268,16 +541,13 @@ def get_transaction_statistics():
         
         transaction_manager = current_app.config['transaction_manager']
         
-        # Get filtered transactions
-        transactions = transaction_manager.get_filtered_transactions(
+        # Aggregated in SQL; no rows are loaded into Python
+        statistics = transaction_manager.get_amount_statistics(
             start_date=start_date,
             end_date=end_date,
             transaction_type=transaction_type
         )
         
-        # Calculate statistics
-        statistics = transaction_amount_statistics(transactions)
-        
         return jsonify({
             'success': True,
             'statistics': statistics,
@@ -286,9 +556,12 @@ def get_transaction_statistics():
                 'end_date': end_date.isoformat() if end_date else None,
                 'transaction_type': transaction_type.value if transaction_type else None,
             },
-            'transaction_count': len(transactions)
+            'transaction_count': statistics['count']
         }), 200
     
+    except (AnalyticsBusyException, AnalyticsTimeoutException) as e:
+        return _analytics_unavailable(e)
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -296,6 +569,7 @@ def get_transaction_statistics():
         }), 500
 
 @transaction_bp.route('/transactions/category-summary', methods=['GET'])
+@conditional_get('transactions')
 def get_transaction_category_summary():
     try:
         # Parse query parameters
@@ -329,16 +603,12 @@ def get_transaction_category_summary():
         
         transaction_manager = current_app.config['transaction_manager']
         
-        # Get filtered transactions
-        transactions = transaction_manager.get_filtered_transactions(
+        # Grouped in SQL; no rows are loaded into Python
+        category_summary, transaction_count = transaction_manager.get_category_summary(
             start_date=start_date,
-            end_date=end_date,
-            transaction_type=None
+            end_date=end_date
         )
         
-        # Calculate category summary
-        category_summary = transaction_category_summary(transactions)
-        
         return jsonify({
             'success': True,
             'category_summary': category_summary,
@@ -346,9 +616,12 @@ def get_transaction_category_summary():
                 'start_date': start_date.isoformat() if start_date else None,
                 'end_date': end_date.isoformat() if end_date else None,
             },
-            'transaction_count': len(transactions)
+            'transaction_count': transaction_count
         }), 200
     
+    except (AnalyticsBusyException, AnalyticsTimeoutException) as e:
+        return _analytics_unavailable(e)
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -356,6 +629,7 @@ def get_transaction_category_summary():
         }), 500
 
 @transaction_bp.route('/transactions/monthly-forecast', methods=['GET'])
+@conditional_get('transactions')
 def get_monthly_forecast():
     try:
         # Parse query parameters
@@ -424,18 +698,12 @@ def get_monthly_forecast():
         
         transaction_manager = current_app.config['transaction_manager']
         
-        # Get filtered transactions (filter by transaction_type since it's required for forecast)
-        transactions = transaction_manager.get_filtered_transactions(
+        # Fitted on monthly totals aggregated in SQL (rollup for whole months)
+        forecast_result, transaction_count = transaction_manager.get_monthly_forecast(
+            transaction_type=transaction_type,
+            months_to_predict=months_to_predict,
             start_date=start_date,
-            end_date=end_date,
-            transaction_type=transaction_type
-        )
-        
-        # Calculate monthly forecast
-        forecast_result = monthly_amount_forecast_linear(
-            transactions,
-            transaction_type,
-            months_to_predict
+            end_date=end_date
         )
         
         return jsonify({
@@ -447,9 +715,12 @@ def get_monthly_forecast():
                 'transaction_type': transaction_type.value,
             },
             'months_to_predict': months_to_predict,
-            'transaction_count': len(transactions)
+            'transaction_count': transaction_count
         }), 200
     
+    except (AnalyticsBusyException, AnalyticsTimeoutException) as e:
+        return _analytics_unavailable(e)
+    
     except ValueError as e:
         return jsonify({
             'success': False,
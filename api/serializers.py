@@ -1,8 +1,11 @@
-from typing import Dict, Any
+from typing import Dict, Any, Mapping
 from datetime import date
 from model.account import Account
 from model.transaction import Transaction
 from model.budget import Budget
+from model.job import Job
+from utils.enums import Category, JobKind, JobStatus, TransactionType
+from database.row_decoders import to_cents
 
 def account_to_dict(account: Account) -> Dict[str, Any]:
     """Convert an Account object to a dictionary for JSON serialization."""
@@ -32,6 +35,19 @@ def transaction_to_dict(transaction: Transaction) -> Dict[str, Any]:
         'transaction_type': transaction.transaction_type.value,
     }
 
+def transaction_row_to_dict(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """Convert a raw transactions row to the same dictionary as transaction_to_dict,
+    skipping the Transaction object (used by the streaming endpoints)."""
+    return {
+        'id': row['id'],
+        'account_id': row['account_id'],
+        'date': row['date'],
+        'amount': row['amount'],
+        'description': row['description'] or '',
+        'category': row['category'],
+        'transaction_type': row['transaction_type'],
+    }
+
 def budget_to_dict(budget: Budget) -> Dict[str, Any]:
     """Convert a Budget object to a dictionary for JSON serialization."""
     return {
@@ -41,6 +57,24 @@ def budget_to_dict(budget: Budget) -> Dict[str, Any]:
         'limit_amount': budget.limit_amount,
     }
 
+def job_to_dict(job: Job) -> Dict[str, Any]:
+    """Convert a Job object to a dictionary for JSON serialization."""
+    result = {
+        'id': job.id,
+        'kind': job.kind.value,
+        'params': job.params,
+        'status': job.status.value,
+        'progress': job.progress,
+        'created_at': job.created_at,
+        'started_at': job.started_at,
+        'finished_at': job.finished_at,
+        'result': job.result,
+        'error': job.error,
+    }
+    if job.kind is JobKind.EXPORT and job.status is JobStatus.SUCCEEDED:
+        result['download'] = f'/api/jobs/{job.id}/download'
+    return result
+
 def dict_to_account_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Convert dictionary data to account creation parameters."""
     return {
@@ -50,3 +84,62 @@ def dict_to_account_data(data: Dict[str, Any]) -> Dict[str, Any]:
         'currency': data['currency']
     }
 
+def parse_amount(value: Any, field: str = 'amount') -> float:
+    """A money amount from a JSON payload. Raises ValueError with a
+    client-facing message unless it is a finite number in storable range."""
+    try:
+        amount = float(value)
+    except (ValueError, TypeError):
+        raise ValueError(f'Invalid {field}. Must be a number')
+    try:
+        to_cents(amount)
+    except ValueError as e:
+        raise ValueError(f'Invalid {field}. {e}')
+    return amount
+
+def dict_to_transaction(data: Mapping[str, Any]) -> Transaction:
+    """Validate a transaction payload and build the Transaction.
+
+    Applies the same rules as POST /api/transactions and raises ValueError
+    with a client-facing message on the first problem found.
+    """
+    if not isinstance(data, Mapping):
+        raise ValueError('Each transaction must be a JSON object')
+
+    required_fields = ['id', 'account_id', 'date', 'amount', 'category']
+    missing_fields = [field for field in required_fields if field not in data]
+    if missing_fields:
+        raise ValueError(f'Missing required fields: {", ".join(missing_fields)}')
+
+    for field in ('id', 'account_id'):
+        if not isinstance(data[field], int) or isinstance(data[field], bool):
+            raise ValueError(f'Invalid {field}. Must be an integer')
+
+    try:
+        trx_date = date.fromisoformat(data['date'])
+    except (ValueError, TypeError) as e:
+        raise ValueError(f'Invalid date format. Expected ISO format (YYYY-MM-DD): {str(e)}')
+
+    try:
+        category = Category(data['category'])
+    except ValueError:
+        raise ValueError(f'Invalid category. Valid categories: {[c.value for c in Category]}')
+
+    transaction_type = TransactionType.EXPENSE
+    if 'transaction_type' in data:
+        try:
+            transaction_type = TransactionType(data['transaction_type'])
+        except ValueError:
+            raise ValueError(f'Invalid transaction_type. Valid types: {[t.value for t in TransactionType]}')
+
+    amount = parse_amount(data['amount'])
+
+    return Transaction(
+        data['id'],
+        data['account_id'],
+        trx_date,
+        amount,
+        data.get('description', ''),
+        category,
+        transaction_type,
+    )
@@ -1,11 +1,42 @@
-from database import DatabaseConnection, AccountDAO, TransactionDAO, BudgetDAO
+from database import (
+    DatabaseConnection,
+    AccountDAO,
+    TransactionDAO,
+    BudgetDAO,
+    MonthlyTotalsDAO,
+    TableVersionDAO,
+    JobDAO,
+    MigrationRunner,
+)
+from database.connection_pool import DEFAULT_POOL_SIZE
 
 class AppState:
-    def __init__(self):
-        # Database connection
-        self._db = DatabaseConnection()
+    def __init__(self, db_path=None, pool_size: int = DEFAULT_POOL_SIZE, pragmas=None, migrate: bool = True):
+        # Database connection pool shared by every DAO
+        self._db = DatabaseConnection(db_path, pool_size=pool_size, pragmas=pragmas)
+
+        # Bring the schema up to date before any DAO touches it. Processes
+        # started by a server that already migrated only verify the version
+        if migrate:
+            MigrationRunner(self._db).run()
+        else:
+            try:
+                MigrationRunner(self._db).check()
+            except Exception:
+                self._db.close()
+                raise
 
         # DAO objects
         self.account_dao = AccountDAO(self._db)
         self.transaction_dao = TransactionDAO(self._db)
-        self.budget_dao = BudgetDAO(self._db)
\ No newline at end of file
+        self.budget_dao = BudgetDAO(self._db)
+        self.monthly_totals_dao = MonthlyTotalsDAO(self._db)
+        self.table_version_dao = TableVersionDAO(self._db)
+        self.job_dao = JobDAO(self._db)
+
+    @property
+    def db(self) -> DatabaseConnection:
+        return self._db
+
+    def close(self) -> None:
+        self._db.close()
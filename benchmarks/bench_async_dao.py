@@ -0,0 +1,122 @@
+"""Concurrent statistics and list requests: sync DAOs vs async DAOs.
+
+Seeds a temporary database and issues ``--requests`` calls that alternate
+between TransactionDAO.aggregate_amounts (the statistics query) and
+read_page(100) (the list query), with ``--concurrency`` in flight:
+
+  sync serial    one thread runs them back to back (one sync worker thread)
+  sync threads   a thread per in-flight request (gthread-style workers)
+  async          one event loop, AsyncTransactionDAO coroutines
+
+Usage:
+    python -m benchmarks.bench_async_dao [--rows 200000] [--requests 400] [--concurrency 1 8 32]
+"""
+import argparse
+import asyncio
+import shutil
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import List
+
+from app_state import AppState
+from benchmarks.bench_materialize import seed
+from database import AsyncDatabaseConnection, AsyncTransactionDAO, TransactionDAO
+from utils.enums import TransactionType
+
+START, END = date(2020, 6, 1), date(2023, 6, 30)
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def sync_request(dao: TransactionDAO, i: int) -> float:
+    started = time.perf_counter()
+    if i % 2:
+        dao.read_page(100)
+    else:
+        dao.aggregate_amounts(START, END, TransactionType.EXPENSE)
+    return time.perf_counter() - started
+
+async def async_request(dao: AsyncTransactionDAO, i: int) -> float:
+    started = time.perf_counter()
+    if i % 2:
+        await dao.read_page(100)
+    else:
+        await dao.aggregate_amounts(START, END, TransactionType.EXPENSE)
+    return time.perf_counter() - started
+
+def run_sync_serial(dao: TransactionDAO, requests: int, concurrency: int) -> List[float]:
+    # A single worker thread: queued requests wait for the ones ahead of
+    # them, so latency counts from when the whole batch of `concurrency` arrived
+    latencies = []
+    for start in range(0, requests, concurrency):
+        arrived = time.perf_counter()
+        for i in range(start, min(start + concurrency, requests)):
+            sync_request(dao, i)
+            latencies.append(time.perf_counter() - arrived)
+    return latencies
+
+def run_sync_threads(dao: TransactionDAO, requests: int, concurrency: int) -> List[float]:
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(lambda i: sync_request(dao, i), range(requests)))
+
+async def run_async(dao: AsyncTransactionDAO, requests: int, concurrency: int) -> List[float]:
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> float:
+        async with gate:
+            return await async_request(dao, i)
+
+    return await asyncio.gather(*(one(i) for i in range(requests)))
+
+def report(label: str, latencies: List[float], elapsed: float) -> None:
+    latencies = sorted(latencies)
+    print(
+        f"  {label:<14} {len(latencies) / elapsed:>8.0f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:>8.2f} ms  "
+        f"p99 {percentile(latencies, 0.99) * 1000:>8.2f} ms"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp())
+    pool_size = max(args.concurrency)
+    app_state = AppState(workdir / "bench.db", pool_size=pool_size)
+    try:
+        seed(app_state, args.rows)
+        sync_dao = TransactionDAO(app_state.db)
+        async_db = AsyncDatabaseConnection(db=app_state.db)
+        async_dao = AsyncTransactionDAO(async_db)
+        sync_dao.aggregate_amounts(START, END, TransactionType.EXPENSE)
+
+        print(f"{args.rows} rows, {args.requests} requests (statistics / list, alternating)")
+        for concurrency in args.concurrency:
+            print(f"concurrency {concurrency}")
+            started = time.perf_counter()
+            latencies = run_sync_serial(sync_dao, args.requests, concurrency)
+            report("sync serial", latencies, time.perf_counter() - started)
+
+            started = time.perf_counter()
+            latencies = run_sync_threads(sync_dao, args.requests, concurrency)
+            report("sync threads", latencies, time.perf_counter() - started)
+
+            started = time.perf_counter()
+            latencies = asyncio.run(run_async(async_dao, args.requests, concurrency))
+            report("async", latencies, time.perf_counter() - started)
+
+        asyncio.run(async_db.close())
+    finally:
+        app_state.db.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Category summary: pandas groupby over loaded rows vs SQL GROUP BY.
+
+Seeds a fresh database per size and times both paths for
+/api/transactions/category-summary, checking that they agree. The pandas
+column reproduces the original implementation (Transaction objects, then
+a dict per row, then a DataFrame).
+
+Usage:
+    python -m benchmarks.bench_category_summary [--sizes 10000 100000 1000000]
+"""
+import argparse
+import math
+import random
+import shutil
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from app_state import AppState
+from database.row_decoders import to_day
+import pandas as pd
+
+from manager.transaction_manager import TransactionManager
+from utils.enums import Category, TransactionType
+
+def seed(app_state: AppState, rows: int) -> None:
+    categories = [c.value for c in Category]
+    types = [t.value for t in TransactionType]
+    start_day = to_day(date(2020, 1, 1))
+    rng = random.Random(42)
+    with app_state.db as conn:
+        conn.executemany(
+            """
+            INSERT INTO transactions (id, account_id, day, amount_cents, description, category, transaction_type)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    i,
+                    i % 10,
+                    start_day + i % 1500,
+                    round(rng.uniform(1, 500) * 100),
+                    "bench",
+                    categories[i % len(categories)],
+                    types[rng.randrange(len(types))],
+                )
+                for i in range(1, rows + 1)
+            ),
+        )
+        conn.execute("ANALYZE")
+
+def pandas_category_summary(transactions):
+    df = pd.DataFrame([
+        {"category": t.category.name, "type": t.transaction_type.name, "amount": t.amount}
+        for t in transactions
+    ])
+    grouped = df.groupby(["category", "type"])["amount"].sum().unstack(fill_value=0)
+    return {
+        category: {"Income": float(row.get("INCOME", 0)), "Expense": float(row.get("EXPENSE", 0))}
+        for category, row in grouped.iterrows()
+    }
+
+def timed(fn, repeat: int = 3):
+    best = math.inf
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def same_summary(a, b) -> bool:
+    return a.keys() == b.keys() and all(
+        math.isclose(a[k][t], b[k][t], rel_tol=1e-9) for k in a for t in ("Income", "Expense")
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'pandas ms':>12} {'sql ms':>10} {'speedup':>8}  match")
+    for rows in args.sizes:
+        workdir = Path(tempfile.mkdtemp())
+        app_state = AppState(workdir / "bench.db")
+        seed(app_state, rows)
+        manager = TransactionManager(app_state.transaction_dao)
+
+        pandas_time, pandas_result = timed(
+            lambda: pandas_category_summary(manager.get_filtered_transactions())
+        )
+        sql_time, (sql_result, _) = timed(manager.get_category_summary)
+
+        match = same_summary(pandas_result, sql_result)
+        print(
+            f"{rows:>10} {pandas_time * 1000:>12.1f} {sql_time * 1000:>10.1f} "
+            f"{pandas_time / sql_time:>7.1f}x  {match}"
+        )
+        app_state.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
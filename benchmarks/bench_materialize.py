@@ -0,0 +1,95 @@
+"""Memory and throughput of materializing Transaction objects.
+
+Seeds a temporary database, fetches the rows once, then times turning
+them into Transaction objects with decode_transaction (the path behind
+TransactionDAO.read_all / read_filtered). The memory the resulting list
+holds is measured with tracemalloc in a separate, untimed pass. Row
+fetching is not measured.
+
+Usage:
+    python -m benchmarks.bench_materialize [--rows 1000000] [--repeat 3]
+"""
+import argparse
+import gc
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+from app_state import AppState
+from database.row_decoders import decode_transaction, to_day, tuple_cursor
+from utils.enums import Category, TransactionType
+
+def seed(app_state: AppState, rows: int) -> None:
+    categories = [c.value for c in Category]
+    types = [t.value for t in TransactionType]
+    start_day = to_day(date(2020, 1, 1))
+    rng = random.Random(42)
+    with app_state.db as conn:
+        conn.executemany(
+            """
+            INSERT INTO transactions (id, account_id, day, amount_cents, description, category, transaction_type)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    i,
+                    i % 10,
+                    start_day + i % 1500,
+                    round(rng.uniform(1, 500) * 100),
+                    "bench",
+                    categories[i % len(categories)],
+                    types[rng.randrange(len(types))],
+                )
+                for i in range(1, rows + 1)
+            ),
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp())
+    app_state = AppState(workdir / "bench.db")
+    try:
+        seed(app_state, args.rows)
+        with app_state.db as conn:
+            rows = tuple_cursor(conn).execute(
+                "SELECT id, account_id, day, amount_cents, description, category, transaction_type FROM transactions"
+            ).fetchall()
+
+        elapsed = None
+        for _ in range(args.repeat):
+            transactions = None
+            gc.collect()
+            started = time.perf_counter()
+            transactions = [decode_transaction(row) for row in rows]
+            run = time.perf_counter() - started
+            elapsed = run if elapsed is None else min(elapsed, run)
+
+        transactions = None
+        gc.collect()
+        tracemalloc.start()
+        transactions = [decode_transaction(row) for row in rows]
+        held, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        count = len(transactions)
+        print(f"rows                {count:>12}")
+        print(f"materialize         {elapsed:>11.2f}s  ({count / elapsed:,.0f} objects/s, best of {args.repeat})")
+        print(f"held by the list    {held / 2**20:>10.1f} MiB  ({held / count:.0f} B/transaction)")
+        print(f"peak while building {peak / 2**20:>10.1f} MiB")
+        print(f"instance size       {sys.getsizeof(transactions[0]):>12} B  "
+              f"(__dict__: {'yes' if hasattr(transactions[0], '__dict__') else 'no'})")
+    finally:
+        app_state.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Cost of statement instrumentation on DAO calls: metrics on vs off.
+
+Seeds a temporary database and times three calls through TransactionDAO,
+each on a connection opened with metrics enabled (InstrumentedConnection)
+and disabled (plain sqlite3.Connection):
+
+  read           point lookup by id (statement overhead dominates)
+  read_page      one page of 100 transactions (per-fetch overhead)
+  aggregate      the statistics query over the whole range (one row out)
+
+Usage:
+    python -m benchmarks.bench_metrics [--rows 100000] [--calls 20000]
+"""
+import argparse
+import shutil
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+from app_state import AppState
+from benchmarks.bench_materialize import seed
+from database import DatabaseConnection, TransactionDAO
+from utils import metrics
+from utils.enums import TransactionType
+
+START, END = date(2020, 1, 1), date(2030, 12, 31)
+
+def per_call(fn: Callable[[int], object], calls: int) -> float:
+    fn(1)
+    started = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - started) / calls
+
+def measure(db_path: Path, enabled: bool, rows: int, calls: int) -> dict:
+    metrics.set_enabled(enabled)
+    db = DatabaseConnection(db_path, pool_size=1)
+    try:
+        dao = TransactionDAO(db)
+        return {
+            "read": per_call(lambda i: dao.read(i % rows + 1), calls),
+            "read_page": per_call(lambda i: dao.read_page(100), max(calls // 10, 1)),
+            "aggregate": per_call(
+                lambda i: dao.aggregate_amounts(START, END, TransactionType.EXPENSE),
+                max(calls // 1000, 1),
+            ),
+        }
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp())
+    db_path = workdir / "bench.db"
+    app_state = AppState(db_path)
+    try:
+        seed(app_state, args.rows)
+        app_state.db.close()
+
+        off = measure(db_path, False, args.rows, args.calls)
+        on = measure(db_path, True, args.rows, args.calls)
+        print(f"{args.rows} rows")
+        for name in off:
+            overhead = on[name] - off[name]
+            print(
+                f"  {name:<10} off {off[name] * 1e6:>10.1f} us  on {on[name] * 1e6:>10.1f} us  "
+                f"overhead {overhead * 1e6:>+7.1f} us ({overhead / off[name]:+.1%})"
+            )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Row decoding: sqlite3.Row + Enum constructors vs tuple rows + lookup dicts.
+
+Seeds a temporary database and times fetching and decoding every
+transaction two ways: the previous decoder (name-based sqlite3.Row
+access, date.fromisoformat and Enum(value) per row) and the shared
+decoder in database/row_decoders.py (plain tuples of the integer day and
+cents columns, value -> member dicts, memoized day -> date). Also reports
+the memory the decoded list holds.
+
+Usage:
+    python -m benchmarks.bench_row_decoding [--rows 1000000] [--repeat 3]
+"""
+import argparse
+import gc
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+from app_state import AppState
+from benchmarks.bench_materialize import seed
+from database.row_decoders import decode_transaction, tuple_cursor
+from model.transaction import Transaction
+from utils.enums import Category, TransactionType
+
+# The previous decoder reads the generated TEXT date / REAL amount columns
+# (migration 0007), so its time includes computing them
+LEGACY_QUERY = "SELECT id, account_id, date, amount, description, category, transaction_type FROM transactions"
+QUERY = "SELECT id, account_id, day, amount_cents, description, category, transaction_type FROM transactions"
+
+def legacy_row_to_transaction(row) -> Transaction:
+    return Transaction(
+        row["id"],
+        row["account_id"],
+        date.fromisoformat(row["date"]),
+        float(row["amount"]),
+        row["description"] or "",
+        Category(row["category"]),
+        TransactionType(row["transaction_type"]),
+    )
+
+def legacy_read(conn):
+    return [legacy_row_to_transaction(r) for r in conn.execute(LEGACY_QUERY).fetchall()]
+
+def tuple_read(conn):
+    return [decode_transaction(r) for r in tuple_cursor(conn).execute(QUERY).fetchall()]
+
+def measure(app_state: AppState, read, repeat: int):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        with app_state.db as conn:
+            started = time.perf_counter()
+            transactions = read(conn)
+            elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+        transactions = None
+
+    gc.collect()
+    tracemalloc.start()
+    with app_state.db as conn:
+        transactions = read(conn)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, held, transactions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp())
+    app_state = AppState(workdir / "bench.db")
+    try:
+        seed(app_state, args.rows)
+        legacy_time, legacy_held, legacy = measure(app_state, legacy_read, args.repeat)
+        tuple_time, tuple_held, decoded = measure(app_state, tuple_read, args.repeat)
+
+        same = all(
+            (a.id, a.account_id, a.date, a.amount, a.description, a.category, a.transaction_type)
+            == (b.id, b.account_id, b.date, b.amount, b.description, b.category, b.transaction_type)
+            for a, b in zip(legacy, decoded)
+        ) and len(legacy) == len(decoded)
+
+        print(f"{'decoder':<22} {'fetch+decode s':>15} {'rows/s':>12} {'held MiB':>10}")
+        for name, elapsed, held in (
+            ("Row + Enum(value)", legacy_time, legacy_held),
+            ("tuple + lookup dicts", tuple_time, tuple_held),
+        ):
+            print(f"{name:<22} {elapsed:>15.2f} {len(decoded) / elapsed:>12,.0f} {held / 2**20:>10.1f}")
+        print(f"speedup {legacy_time / tuple_time:.2f}x, same objects: {same}")
+    finally:
+        app_state.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Startup cost of the application: importing main.py in a fresh interpreter.
+
+Each run starts a new Python process (so nothing is cached in
+sys.modules), times ``import main`` inside it and the whole process
+wall time around it, and reports which heavy optional packages the
+import pulled in. The cost of importing the sklearn forecast backend,
+which is now only paid on first use, is measured the same way.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 10]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("pandas", "scipy", "sklearn")
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"import": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def probe(module: str) -> dict:
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=PROJECT_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process"] = time.perf_counter() - started
+    return result
+
+def report(label: str, module: str, runs: int) -> None:
+    results = [probe(module) for _ in range(runs)]
+    imports = [r["import"] * 1000 for r in results]
+    processes = [r["process"] * 1000 for r in results]
+    loaded = ", ".join(results[-1]["loaded"]) or "none"
+    print(
+        f"{label:<28} import {statistics.median(imports):>8.1f} ms (min {min(imports):.1f})  "
+        f"process {statistics.median(processes):>8.1f} ms  heavy modules: {loaded}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    report("import main", "main", args.runs)
+    report("import sklearn.linear_model", "sklearn.linear_model", args.runs)
+
+if __name__ == "__main__":
+    main()
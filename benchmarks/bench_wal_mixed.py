@@ -0,0 +1,99 @@
+"""Read throughput under a mixed read/write workload, per pragma profile.
+
+One writer thread inserts transactions continuously while several reader
+threads run the same filtered query used by /api/transactions/statistics.
+Each profile runs against a fresh copy of the database, migrated to the
+current schema first.
+
+Usage:
+    python -m benchmarks.bench_wal_mixed [--readers 4] [--seconds 5]
+"""
+import argparse
+import shutil
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from database import DatabaseConnection, MigrationRunner, TransactionDAO
+from database.db_connection import DB_PATH
+from model.transaction import Transaction
+from utils.enums import Category, TransactionType
+
+def run_profile(profile: str, readers: int, seconds: float) -> dict:
+    workdir = Path(tempfile.mkdtemp())
+    db_path = workdir / "bench.db"
+    shutil.copy(DB_PATH, db_path)
+
+    db = DatabaseConnection(db_path, pool_size=readers + 1, pragmas=profile)
+    # The shipped database file may predate the latest migrations
+    MigrationRunner(db).run()
+    dao = TransactionDAO(db)
+    stop = threading.Event()
+    reads = [0] * readers
+    writes = [0]
+    errors = []
+
+    def until_stopped(step):
+        # A failing query would otherwise just show up as 0 ops/s
+        try:
+            while not stop.is_set():
+                step()
+        except Exception as e:
+            errors.append(e)
+            stop.set()
+
+    def writer():
+        next_id = [10_000_000]
+        day = date(2025, 1, 1)
+
+        def write():
+            dao.create(Transaction(
+                next_id[0], 1, day + timedelta(days=next_id[0] % 365), 10.0,
+                "bench", Category.OTHER, TransactionType.EXPENSE,
+            ))
+            next_id[0] += 1
+            writes[0] += 1
+        until_stopped(write)
+
+    def reader(slot: int):
+        def read():
+            dao.read_filtered(date(2025, 1, 1), date(2025, 6, 30), TransactionType.EXPENSE)
+            reads[slot] += 1
+        until_stopped(read)
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    try:
+        for t in threads:
+            t.start()
+        stop.wait(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+    finally:
+        db.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if errors:
+        raise RuntimeError(f"Profile '{profile}' failed: {errors[0]!r}") from errors[0]
+    return {
+        "profile": profile,
+        "reads_per_s": sum(reads) / seconds,
+        "writes_per_s": writes[0] / seconds,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} {'reads/s':>10} {'writes/s':>10}")
+    for profile in ("rollback", "wal"):
+        result = run_profile(profile, args.readers, args.seconds)
+        print(f"{result['profile']:<10} {result['reads_per_s']:>10.1f} {result['writes_per_s']:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Write throughput of the create/update paths.
+
+Compares, per operation, the old three-step flow (existence check or read,
+write, read-back: three pool checkouts and three statements) with the
+single INSERT/UPDATE ... RETURNING statement the managers use now, then
+measures POST/PUT requests per second through the Flask test client.
+Runs against a temporary copy of the database.
+
+Usage:
+    python -m benchmarks.bench_writes [--ops 5000]
+"""
+import argparse
+import shutil
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from api import ApiConnection
+from app_state import AppState
+from database.db_connection import DB_PATH
+from model.transaction import Transaction
+from utils.enums import Category, TransactionType
+
+FIRST_ID = 20_000_000
+
+def _transaction(transaction_id: int) -> Transaction:
+    return Transaction(
+        transaction_id, 1, date(2025, 1, 1 + transaction_id % 28), 10.0,
+        "bench", Category.OTHER, TransactionType.EXPENSE,
+    )
+
+def _rate(ops: int, elapsed: float) -> float:
+    return ops / elapsed if elapsed > 0 else 0.0
+
+def bench_dao(app_state: AppState, ops: int) -> None:
+    dao = app_state.transaction_dao
+
+    started = time.perf_counter()
+    for i in range(ops):
+        transaction = _transaction(FIRST_ID + i)
+        if not dao.exists(transaction.id):
+            dao.create(transaction)
+        dao.read(transaction.id)
+    three_step_create = _rate(ops, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for i in range(ops):
+        dao.create(_transaction(FIRST_ID + ops + i))
+    returning_create = _rate(ops, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for i in range(ops):
+        transaction = dao.read(FIRST_ID + i)
+        transaction.description = f"updated {i}"
+        dao.update(transaction)
+        dao.read(transaction.id)
+    three_step_update = _rate(ops, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for i in range(ops):
+        dao.update_details(FIRST_ID + i, f"again {i}", Category.FOOD)
+    returning_update = _rate(ops, time.perf_counter() - started)
+
+    print(f"{'operation':<10} {'3-step ops/s':>14} {'RETURNING ops/s':>16} {'speedup':>8}")
+    print(f"{'create':<10} {three_step_create:>14.0f} {returning_create:>16.0f} {returning_create / three_step_create:>7.2f}x")
+    print(f"{'update':<10} {three_step_update:>14.0f} {returning_update:>16.0f} {returning_update / three_step_update:>7.2f}x")
+
+def bench_http(app_state: AppState, ops: int) -> None:
+    client = ApiConnection(app_state).app.test_client()
+    first_id = FIRST_ID + 10 * ops
+
+    started = time.perf_counter()
+    for i in range(ops):
+        client.post("/api/transactions", json={
+            "id": first_id + i, "account_id": 1, "date": "2025-02-01",
+            "amount": 12.5, "category": "Food",
+        })
+    post_rate = _rate(ops, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for i in range(ops):
+        client.put(f"/api/transactions/{first_id + i}", json={
+            "description": "edited", "category": "Health",
+        })
+    put_rate = _rate(ops, time.perf_counter() - started)
+
+    print(f"POST /api/transactions       {post_rate:>8.0f} req/s")
+    print(f"PUT  /api/transactions/<id>  {put_rate:>8.0f} req/s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=5000)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp())
+    db_path = workdir / "bench.db"
+    shutil.copy(DB_PATH, db_path)
+    app_state = AppState(db_path)
+    try:
+        bench_dao(app_state, args.ops)
+        bench_http(app_state, args.ops)
+    finally:
+        app_state.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""HTTP load test: requests per second and latency percentiles per endpoint.
+
+Sends GET requests to a running server from ``--concurrency`` client
+threads (one keep-alive connection each) for ``--seconds`` per endpoint,
+then reports throughput, p50/p99 latency and errors. Run it against a
+server on a copy of the database, e.g.:
+
+    PF_DB_PATH=/tmp/copy.db gunicorn -c gunicorn.conf.py "wsgi:create_app()"
+
+Usage:
+    python -m benchmarks.load_test [--url http://127.0.0.1:5000] [--concurrency 16] [--seconds 10]
+                                   [--endpoint /api/transactions ...]
+"""
+import argparse
+import http.client
+import statistics
+import threading
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_ENDPOINTS = (
+    "/api/accounts",
+    "/api/transactions?limit=100",
+    "/api/transactions/1",
+    "/api/transactions/statistics?transaction_type=Expense",
+    "/api/transactions/category-summary",
+    "/api/transactions/monthly-forecast?transaction_type=Expense&months_to_predict=3",
+    "/api/budgets",
+)
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+class Client:
+    """One keep-alive connection; reconnects after a failure."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self._host = host
+        self._port = port
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def get(self, path: str) -> int:
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection(self._host, self._port, timeout=30)
+        try:
+            self._conn.request("GET", path)
+            response = self._conn.getresponse()
+            response.read()
+            return response.status
+        except (OSError, http.client.HTTPException):
+            self._conn.close()
+            self._conn = None
+            raise
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+
+def run_endpoint(host: str, port: int, path: str, concurrency: int, seconds: float) -> Tuple[List[float], int, float]:
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def worker() -> None:
+        client = Client(host, port)
+        local: List[float] = []
+        failed = 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status = client.get(path)
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                continue
+            if status >= 500:
+                failed += 1
+            else:
+                local.append(time.perf_counter() - started)
+        client.close()
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors[0], time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--endpoint", action="append", dest="endpoints",
+                        help="Path to request (repeatable); defaults to a mix of list, item and analytics GETs")
+    args = parser.parse_args()
+
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+    endpoints = args.endpoints or DEFAULT_ENDPOINTS
+
+    print(f"{args.url}  concurrency={args.concurrency}  {args.seconds:g}s per endpoint")
+    print(f"{'endpoint':<80} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for path in endpoints:
+        latencies, errors, elapsed = run_endpoint(host, port, path, args.concurrency, args.seconds)
+        latencies.sort()
+        rate = len(latencies) / elapsed if elapsed > 0 else 0.0
+        p50 = statistics.median(latencies) * 1000 if latencies else float("nan")
+        p99 = percentile(latencies, 0.99) * 1000
+        print(f"{path:<80} {rate:>9.0f} {p50:>8.2f} {p99:>8.2f} {errors:>7}")
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,28 @@ from database.db_connection import DatabaseConnection
 from database.account_dao import AccountDAO
 from database.transaction_dao import TransactionDAO
 from database.budget_dao import BudgetDAO
+from database.monthly_totals_dao import MonthlyTotalsDAO
+from database.table_version_dao import TableVersionDAO
+from database.job_dao import JobDAO
+from database.migration_runner import MigrationRunner
+from database.async_dao import (
+    AsyncDatabaseConnection,
+    AsyncAccountDAO,
+    AsyncTransactionDAO,
+    AsyncBudgetDAO,
+)
 
 __all__ = [
     'DatabaseConnection',
     'AccountDAO',
     'TransactionDAO',
     'BudgetDAO',
+    'MonthlyTotalsDAO',
+    'TableVersionDAO',
+    'JobDAO',
+    'MigrationRunner',
+    'AsyncDatabaseConnection',
+    'AsyncAccountDAO',
+    'AsyncTransactionDAO',
+    'AsyncBudgetDAO',
 ]
\ No newline at end of file
@@ -1,32 +1,45 @@
-from typing import List, Optional
+import sqlite3
+from typing import Iterator, List, Optional
 from model.account import Account
-from model.bank_account import BankAccount
-from model.wallet_account import WalletAccount
-from model.savings_account import SavingsAccount
 from utils.enums import AccountType, Currency
-from database.db_connection import DatabaseConnection
+from database.db_connection import DatabaseConnection, is_primary_key_violation
+from exceptions.finance_manager_exception import DuplicateIDException
+from database.table_version_dao import bump_table_version
+from database.transaction_dao import DEFAULT_FETCH_SIZE
+from database.row_decoders import decode_account, tuple_cursor
 
 class AccountDAO:
     
     def __init__(self, db: DatabaseConnection):
         self.db = db
 
-    def create(self, account: Account) -> None:
+    def create(self, account: Account) -> Account:
+        """Insert the account and return it as stored, in one statement.
+        Raises DuplicateIDException if the id is taken."""
         account_type = account.accountType.value if hasattr(account, "accountType") else AccountType.BANK.value
         currency = account.currency.value if hasattr(account, "currency") else Currency.USD.value
 
         with self.db as conn:
-            conn.execute(
-                """
-                INSERT INTO accounts (id, name, account_type, currency)
-                VALUES (?, ?, ?, ?)
-                """,
-                (account.id, account.name, account_type, currency),
-            )
+            try:
+                row = conn.execute(
+                    """
+                    INSERT INTO accounts (id, name, account_type, currency)
+                    VALUES (?, ?, ?, ?)
+                    RETURNING id, name, account_type, currency
+                    """,
+                    (account.id, account.name, account_type, currency),
+                ).fetchall()[0]
+            except sqlite3.IntegrityError as e:
+                if is_primary_key_violation(e):
+                    raise DuplicateIDException(account.id) from e
+                raise
+            bump_table_version(conn, "accounts")
+
+        return decode_account(row)
 
     def read(self, account_id: int) -> Optional[Account]:
         with self.db as conn:
-            cur = conn.execute(
+            cur = tuple_cursor(conn).execute(
                 """
                 SELECT id, name, account_type, currency
                 FROM accounts
@@ -38,11 +51,11 @@ class AccountDAO:
 
         if row is None:
             return None
-        return self._row_to_account(row)
+        return decode_account(row)
 
     def read_all(self) -> List[Account]:
         with self.db as conn:
-            cur = conn.execute(
+            cur = tuple_cursor(conn).execute(
                 """
                 SELECT id, name, account_type, currency
                 FROM accounts
@@ -51,7 +64,53 @@ class AccountDAO:
             )
             rows = cur.fetchall()
 
-        return [self._row_to_account(r) for r in rows]
+        return [decode_account(r) for r in rows]
+
+    def read_page(self, limit: int, after: Optional[int] = None) -> List[Account]:
+        """Read up to ``limit`` accounts in id order, starting strictly after
+        the account id ``after``."""
+        with self.db as conn:
+            if after is None:
+                cur = tuple_cursor(conn).execute(
+                    """
+                    SELECT id, name, account_type, currency
+                    FROM accounts
+                    ORDER BY id
+                    LIMIT ?
+                    """,
+                    (limit,),
+                )
+            else:
+                cur = tuple_cursor(conn).execute(
+                    """
+                    SELECT id, name, account_type, currency
+                    FROM accounts
+                    WHERE id > ?
+                    ORDER BY id
+                    LIMIT ?
+                    """,
+                    (after, limit),
+                )
+            rows = cur.fetchall()
+
+        return [decode_account(r) for r in rows]
+
+    def iter_rows(self, fetch_size: int = DEFAULT_FETCH_SIZE) -> Iterator[List[sqlite3.Row]]:
+        """Yield every account row in id order, in batches of ``fetch_size``
+        straight from the cursor (see TransactionDAO.iter_filtered_rows)."""
+        with self.db as conn:
+            cur = conn.execute(
+                """
+                SELECT id, name, account_type, currency
+                FROM accounts
+                ORDER BY id
+                """
+            )
+            while True:
+                rows = cur.fetchmany(fetch_size)
+                if not rows:
+                    break
+                yield rows
 
     def update(self, account: Account) -> None:
         account_type = account.accountType.value if hasattr(account, "accountType") else AccountType.BANK.value
@@ -68,29 +127,35 @@ class AccountDAO:
             )
             if cur.rowcount == 0:
                 raise ValueError(f"Account with ID {account.id} not found")
+            bump_table_version(conn, "accounts")
+
+    def rename(self, account_id: int, name: str) -> Optional[Account]:
+        """Set the account's name and return the updated account, or None
+        if the id is unknown."""
+        with self.db as conn:
+            rows = conn.execute(
+                """
+                UPDATE accounts
+                SET name = ?
+                WHERE id = ?
+                RETURNING id, name, account_type, currency
+                """,
+                (name, account_id),
+            ).fetchall()
+            if not rows:
+                return None
+            bump_table_version(conn, "accounts")
+
+        return decode_account(rows[0])
 
     def delete(self, account_id: int) -> None:
         with self.db as conn:
             cur = conn.execute("DELETE FROM accounts WHERE id = ?", (account_id,))
             if cur.rowcount == 0:
                 raise ValueError(f"Account with ID {account_id} not found")
+            bump_table_version(conn, "accounts")
 
     def exists(self, account_id: int) -> bool:
         with self.db as conn:
             cur = conn.execute("SELECT 1 FROM accounts WHERE id = ?", (account_id,))
             return cur.fetchone() is not None
-
-    def _row_to_account(self, row) -> Account:
-        account_id = row["id"]
-        name = row["name"]
-        account_type = AccountType(row["account_type"])
-        currency = Currency(row["currency"])
-
-        if account_type == AccountType.BANK:
-            return BankAccount(account_id, name, currency)
-        elif account_type == AccountType.WALLET:
-            return WalletAccount(account_id, name, currency)
-        elif account_type == AccountType.SAVINGS:
-            return SavingsAccount(account_id, name, currency)
-        else:
-            return BankAccount(account_id, name, currency)
\ No newline at end of file
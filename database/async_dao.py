@@ -0,0 +1,123 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar, Union
+
+from database.account_dao import AccountDAO
+from database.budget_dao import BudgetDAO
+from database.connection_pool import DEFAULT_POOL_SIZE, DEFAULT_POOL_TIMEOUT
+from database.db_connection import DatabaseConnection
+from database.transaction_dao import TransactionDAO
+
+T = TypeVar("T")
+
+class AsyncDatabaseConnection:
+    """asyncio front end for a DatabaseConnection.
+
+    Each call runs on a dedicated thread pool, sized to the connection pool
+    so a call never queues for a connection, while the event loop keeps
+    serving other coroutines. sqlite3 releases the GIL while a statement
+    runs, so queries from concurrent coroutines overlap.
+
+    Wraps an existing DatabaseConnection (e.g. the one in AppState, to share
+    its pool with the sync stack) or opens its own from the same arguments
+    DatabaseConnection takes. ``close`` only closes a connection it opened.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_timeout: float = DEFAULT_POOL_TIMEOUT,
+        pragmas: Optional[Union[str, Dict[str, Any]]] = None,
+        db: Optional[DatabaseConnection] = None,
+    ):
+        self._owns_db = db is None
+        if db is None:
+            db = DatabaseConnection(db_path, pool_size=pool_size, pool_timeout=pool_timeout, pragmas=pragmas)
+        self.db = db
+        self._executor = ThreadPoolExecutor(max_workers=db.pool_size, thread_name_prefix="async-db")
+
+    async def run(self, fn: Callable[..., T], /, *args, **kwargs) -> T:
+        """Run a blocking database call on the executor and await its result.
+        The whole call (and any ``with db`` block inside it) stays on one
+        thread, so it keeps one pooled connection and one transaction."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return self.db.pool_stats()
+
+    async def close(self) -> None:
+        # Let running calls finish, off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        if self._owns_db:
+            self.db.close()
+
+def _offload(method: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    # async twin of a sync DAO method; keeps its name, docstring and signature
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self.db.run(method, self.dao, *args, **kwargs)
+    return wrapper
+
+class AsyncAccountDAO:
+    """AccountDAO with ``async def`` methods. The streaming ``iter_rows``
+    stays sync-only: its connection is bound to the thread iterating it."""
+
+    def __init__(self, db: AsyncDatabaseConnection):
+        self.db = db
+        self.dao = AccountDAO(db.db)
+
+    create = _offload(AccountDAO.create)
+    read = _offload(AccountDAO.read)
+    read_all = _offload(AccountDAO.read_all)
+    read_page = _offload(AccountDAO.read_page)
+    update = _offload(AccountDAO.update)
+    rename = _offload(AccountDAO.rename)
+    delete = _offload(AccountDAO.delete)
+    exists = _offload(AccountDAO.exists)
+
+class AsyncTransactionDAO:
+    """TransactionDAO with ``async def`` methods. The streaming
+    ``iter_filtered_rows`` stays sync-only, like AsyncAccountDAO.iter_rows."""
+
+    def __init__(self, db: AsyncDatabaseConnection):
+        self.db = db
+        self.dao = TransactionDAO(db.db)
+
+    create = _offload(TransactionDAO.create)
+    create_many = _offload(TransactionDAO.create_many)
+    read = _offload(TransactionDAO.read)
+    read_all = _offload(TransactionDAO.read_all)
+    read_page = _offload(TransactionDAO.read_page)
+    read_by_account = _offload(TransactionDAO.read_by_account)
+    read_filtered = _offload(TransactionDAO.read_filtered)
+    count_filtered = _offload(TransactionDAO.count_filtered)
+    aggregate_amounts = _offload(TransactionDAO.aggregate_amounts)
+    sum_by_category_and_type = _offload(TransactionDAO.sum_by_category_and_type)
+    sum_by_month = _offload(TransactionDAO.sum_by_month)
+    update = _offload(TransactionDAO.update)
+    update_details = _offload(TransactionDAO.update_details)
+    delete = _offload(TransactionDAO.delete)
+    existing_ids = _offload(TransactionDAO.existing_ids)
+    exists = _offload(TransactionDAO.exists)
+
+class AsyncBudgetDAO:
+    """BudgetDAO with ``async def`` methods (``iter_rows`` stays sync-only)."""
+
+    def __init__(self, db: AsyncDatabaseConnection):
+        self.db = db
+        self.dao = BudgetDAO(db.db)
+
+    create = _offload(BudgetDAO.create)
+    read = _offload(BudgetDAO.read)
+    read_all = _offload(BudgetDAO.read_all)
+    read_page = _offload(BudgetDAO.read_page)
+    read_by_month = _offload(BudgetDAO.read_by_month)
+    read_by_category = _offload(BudgetDAO.read_by_category)
+    update = _offload(BudgetDAO.update)
+    update_limit = _offload(BudgetDAO.update_limit)
+    delete = _offload(BudgetDAO.delete)
+    exists = _offload(BudgetDAO.exists)
@@ -1,30 +1,46 @@
-from typing import List, Optional
+import sqlite3
+from typing import Iterator, List, Optional, Tuple
 from model.budget import Budget
 from utils.enums import Category
-from database.db_connection import DatabaseConnection
+from database.db_connection import DatabaseConnection, is_primary_key_violation
+from exceptions.finance_manager_exception import DuplicateIDException
+from database.table_version_dao import bump_table_version
+from database.transaction_dao import DEFAULT_FETCH_SIZE
+from database.row_decoders import decode_budget, tuple_cursor
 
 class BudgetDAO:
     def __init__(self, db: DatabaseConnection):
         self.db = db
 
-    def create(self, budget: Budget) -> None:
+    def create(self, budget: Budget) -> Budget:
+        """Insert the budget and return it as stored, in one statement.
+        Raises DuplicateIDException if the id is taken."""
         with self.db as conn:
-            conn.execute(
-                """
-                INSERT INTO budgets (id, month, category, limit_amount)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    budget.id,
-                    budget.month,
-                    budget.category.value,
-                    budget.limit_amount,
-                ),
-            )
+            try:
+                row = conn.execute(
+                    """
+                    INSERT INTO budgets (id, month, category, limit_amount)
+                    VALUES (?, ?, ?, ?)
+                    RETURNING id, month, category, limit_amount
+                    """,
+                    (
+                        budget.id,
+                        budget.month,
+                        budget.category.value,
+                        budget.limit_amount,
+                    ),
+                ).fetchall()[0]
+            except sqlite3.IntegrityError as e:
+                if is_primary_key_violation(e):
+                    raise DuplicateIDException(budget.id) from e
+                raise
+            bump_table_version(conn, "budgets")
+
+        return decode_budget(row)
 
     def read(self, budget_id: int) -> Optional[Budget]:
         with self.db as conn:
-            cur = conn.execute(
+            cur = tuple_cursor(conn).execute(
                 """
                 SELECT id, month, category, limit_amount
                 FROM budgets
@@ -36,11 +52,11 @@ class BudgetDAO:
 
         if row is None:
             return None
-        return self._row_to_budget(row)
+        return decode_budget(row)
 
     def read_all(self) -> List[Budget]:
         with self.db as conn:
-            cur = conn.execute(
+            cur = tuple_cursor(conn).execute(
                 """
                 SELECT id, month, category, limit_amount
                 FROM budgets
@@ -49,11 +65,61 @@ class BudgetDAO:
             )
             rows = cur.fetchall()
 
-        return [self._row_to_budget(r) for r in rows]
+        return [decode_budget(r) for r in rows]
 
-    def read_by_month(self, month: str) -> List[Budget]:
+    def read_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> List[Budget]:
+        """Read up to ``limit`` budgets in (month DESC, id DESC) order,
+        starting strictly after the ``(month, id)`` keyset position ``after``."""
+        with self.db as conn:
+            if after is None:
+                cur = tuple_cursor(conn).execute(
+                    """
+                    SELECT id, month, category, limit_amount
+                    FROM budgets
+                    ORDER BY month DESC, id DESC
+                    LIMIT ?
+                    """,
+                    (limit,),
+                )
+            else:
+                cur = tuple_cursor(conn).execute(
+                    """
+                    SELECT id, month, category, limit_amount
+                    FROM budgets
+                    WHERE (month, id) < (?, ?)
+                    ORDER BY month DESC, id DESC
+                    LIMIT ?
+                    """,
+                    (after[0], after[1], limit),
+                )
+            rows = cur.fetchall()
+
+        return [decode_budget(r) for r in rows]
+
+    def iter_rows(self, fetch_size: int = DEFAULT_FETCH_SIZE) -> Iterator[List[sqlite3.Row]]:
+        """Yield every budget row, newest month first, in batches of
+        ``fetch_size`` straight from the cursor."""
         with self.db as conn:
             cur = conn.execute(
+                """
+                SELECT id, month, category, limit_amount
+                FROM budgets
+                ORDER BY month DESC, id DESC
+                """
+            )
+            while True:
+                rows = cur.fetchmany(fetch_size)
+                if not rows:
+                    break
+                yield rows
+
+    def read_by_month(self, month: str) -> List[Budget]:
+        with self.db as conn:
+            cur = tuple_cursor(conn).execute(
                 """
                 SELECT id, month, category, limit_amount
                 FROM budgets
@@ -64,11 +130,11 @@ class BudgetDAO:
             )
             rows = cur.fetchall()
 
-        return [self._row_to_budget(r) for r in rows]
+        return [decode_budget(r) for r in rows]
 
     def read_by_category(self, category: Category) -> List[Budget]:
         with self.db as conn:
-            cur = conn.execute(
+            cur = tuple_cursor(conn).execute(
                 """
                 SELECT id, month, category, limit_amount
                 FROM budgets
@@ -79,7 +145,7 @@ class BudgetDAO:
             )
             rows = cur.fetchall()
 
-        return [self._row_to_budget(r) for r in rows]
+        return [decode_budget(r) for r in rows]
 
     def update(self, budget: Budget) -> None:
         with self.db as conn:
@@ -98,22 +164,35 @@ class BudgetDAO:
             )
             if cur.rowcount == 0:
                 raise ValueError(f"Budget with ID {budget.id} not found")
+            bump_table_version(conn, "budgets")
+
+    def update_limit(self, budget_id: int, limit_amount: float) -> Optional[Budget]:
+        """Set the budget's limit and return the updated budget, or None if
+        the id is unknown."""
+        with self.db as conn:
+            rows = conn.execute(
+                """
+                UPDATE budgets
+                SET limit_amount = ?
+                WHERE id = ?
+                RETURNING id, month, category, limit_amount
+                """,
+                (limit_amount, budget_id),
+            ).fetchall()
+            if not rows:
+                return None
+            bump_table_version(conn, "budgets")
+
+        return decode_budget(rows[0])
 
     def delete(self, budget_id: int) -> None:
         with self.db as conn:
             cur = conn.execute("DELETE FROM budgets WHERE id = ?", (budget_id,))
             if cur.rowcount == 0:
                 raise ValueError(f"Budget with ID {budget_id} not found")
+            bump_table_version(conn, "budgets")
 
     def exists(self, budget_id: int) -> bool:
         with self.db as conn:
             cur = conn.execute("SELECT 1 FROM budgets WHERE id = ?", (budget_id,))
             return cur.fetchone() is not None
-
-    def _row_to_budget(self, row) -> Budget:
-        budget_id = row["id"]
-        month = row["month"]
-        category = Category(row["category"])
-        limit_amount = row["limit_amount"]
-
-        return Budget(budget_id, month, category, limit_amount)
\ No newline at end of file
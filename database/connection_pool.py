@@ -0,0 +1,189 @@
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from exceptions.finance_manager_exception import PoolTimeoutException
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_POOL_TIMEOUT = 5.0
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+
+class ConnectionPool:
+    """Bounded pool of reusable SQLite connections.
+
+    Idle connections are kept in a LIFO queue so the most recently used (and
+    therefore warmest) connection is handed out first. New connections are
+    only opened while fewer than ``max_size`` exist; after that callers wait
+    up to ``timeout`` seconds for one to be released.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], sqlite3.Connection],
+        max_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_POOL_TIMEOUT,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be > 0")
+
+        self._factory = factory
+        self._max_size = max_size
+        self._timeout = timeout
+        self._health_check_interval = health_check_interval
+
+        # Items are (connection, last_released_at)
+        self._idle: "queue.LifoQueue[tuple]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._in_use = 0
+        self._closed = False
+
+        # Counters
+        self._hits = 0
+        self._misses = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._discarded = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        try:
+            conn, released_at = self._idle.get_nowait()
+            hit = True
+        except queue.Empty:
+            conn = self._try_create()
+            released_at = None
+            hit = False
+            if conn is None:
+                conn, released_at = self._wait_for_idle()
+
+        if released_at is not None and not self._is_healthy(conn, released_at):
+            conn = self._replace(conn)
+
+        with self._lock:
+            self._in_use += 1
+            if hit:
+                self._hits += 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._in_use -= 1
+            closed = self._closed
+
+        if closed:
+            self._close_quietly(conn)
+            with self._lock:
+                self._created -= 1
+            return
+
+        if conn.in_transaction:
+            # Its transaction could not be ended (even the rollback failed);
+            # the next user would inherit it and its locks
+            self._close_quietly(conn)
+            with self._lock:
+                self._created -= 1
+                self._discarded += 1
+            return
+
+        self._idle.put((conn, time.monotonic()))
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close_quietly(conn)
+            with self._lock:
+                self._created -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = self._waits
+            return {
+                "max_size": self._max_size,
+                "size": self._created,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "hits": self._hits,
+                "misses": self._misses,
+                "waits": waits,
+                "timeouts": self._timeouts,
+                "discarded": self._discarded,
+                "total_wait_time": self._total_wait_time,
+                "avg_wait_time": self._total_wait_time / waits if waits else 0.0,
+                "max_wait_time": self._max_wait_time,
+            }
+
+    def _try_create(self):
+        with self._lock:
+            if self._created >= self._max_size:
+                return None
+            self._created += 1
+            self._misses += 1
+
+        try:
+            return self._factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _wait_for_idle(self) -> tuple:
+        started = time.perf_counter()
+        try:
+            item = self._idle.get(timeout=self._timeout)
+        except queue.Empty:
+            with self._lock:
+                self._timeouts += 1
+            raise PoolTimeoutException(self._timeout)
+
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._waits += 1
+            self._total_wait_time += waited
+            self._max_wait_time = max(self._max_wait_time, waited)
+        return item
+
+    def _is_healthy(self, conn: sqlite3.Connection, released_at: float) -> bool:
+        if time.monotonic() - released_at < self._health_check_interval:
+            return True
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _replace(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        self._close_quietly(conn)
+        with self._lock:
+            self._discarded += 1
+
+        try:
+            return self._factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    @staticmethod
+    def _close_quietly(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
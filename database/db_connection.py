@@ -1,30 +1,141 @@
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+from database.query_metrics import InstrumentedConnection
+from utils import metrics
+from database.connection_pool import (
+    ConnectionPool,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_POOL_TIMEOUT,
+)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DB_PATH = BASE_DIR / "personalfinance.db"
+
+# Pragma profiles applied once to every pooled connection when it is opened.
+# "wal" lets readers run concurrently with a writer; "rollback" is SQLite's
+# stock behaviour and is kept for comparison and for filesystems without
+# shared-memory support (e.g. network shares).
+PRAGMA_PROFILES: Dict[str, Dict[str, Any]] = {
+    "wal": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -16000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    "rollback": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+    },
+}
+DEFAULT_PRAGMA_PROFILE = "wal"
+
+def is_primary_key_violation(error: sqlite3.IntegrityError) -> bool:
+    """True if the insert failed because the id is already taken."""
+    name = getattr(error, "sqlite_errorname", None)
+    if name is not None:
+        return name == "SQLITE_CONSTRAINT_PRIMARYKEY"
+    # Python < 3.11 does not expose the extended error code
+    return str(error).startswith("UNIQUE constraint failed:") and str(error).endswith(".id")
+
 class DatabaseConnection:
+    """Pooled access to the SQLite database.
+
+    Used as a context manager by the DAOs: ``with db as conn`` checks a
+    connection out of the pool for the current thread, commits (or rolls
+    back) on exit and hands it back. Nested ``with`` blocks on the same
+    thread share the outer connection and transaction.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_timeout: float = DEFAULT_POOL_TIMEOUT,
+        pragmas: Optional[Union[str, Dict[str, Any]]] = None,
+    ):
+        self.db_path = Path(db_path) if db_path is not None else DB_PATH
+        if pragmas is None:
+            pragmas = DEFAULT_PRAGMA_PROFILE
+        if isinstance(pragmas, str):
+            if pragmas not in PRAGMA_PROFILES:
+                raise ValueError(
+                    f"Unknown pragma profile '{pragmas}'. Valid profiles: {list(PRAGMA_PROFILES)}"
+                )
+            pragmas = PRAGMA_PROFILES[pragmas]
+        self.pragmas = dict(pragmas)
+        self._pool = ConnectionPool(
+            self._connect,
+            max_size=pool_size,
+            timeout=pool_timeout,
+        )
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Statement timing costs a few microseconds per call; with metrics
+        # disabled connections are plain sqlite3 ones
+        factory = InstrumentedConnection if metrics.enabled() else sqlite3.Connection
+        connection = sqlite3.connect(self.db_path, check_same_thread=False, factory=factory)
+        connection.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+        return connection
 
-    def __init__(self):
-        self.db_path = DB_PATH
-        self._connection = None
-    
-    def get_connection(self) -> sqlite3.Connection: 
-        if self._connection is None:
-            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
-            self._connection.row_factory = sqlite3.Row
-        return self._connection
-    
     def __enter__(self):
-        return self.get_connection()
-    
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self._local.connection = self._pool.acquire()
+        self._local.depth = depth + 1
+        return self._local.connection
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        conn = self._connection
-        if conn is not None:
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return False
+
+        conn = self._local.connection
+        self._local.connection = None
+        try:
             if exc_type is None:
-                conn.commit()
+                try:
+                    conn.commit()
+                except BaseException:
+                    # e.g. SQLITE_BUSY: the transaction is still open and must
+                    # not be handed to the next user of the connection
+                    # (release discards it if the rollback fails too)
+                    try:
+                        conn.rollback()
+                    except sqlite3.Error:
+                        pass
+                    raise
             else:
                 conn.rollback()
-            conn.close()
-            self._connection = None
-        return False
\ No newline at end of file
+        finally:
+            self._pool.release(conn)
+        return False
+
+    @contextmanager
+    def snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Like ``with db as conn``, but every statement in the block reads
+        the same snapshot of the database: the block runs in one (read)
+        transaction, or in the enclosing block's transaction if nested."""
+        with self as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            yield conn
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool.max_size
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return self._pool.stats()
+
+    def close(self) -> None:
+        self._pool.close()
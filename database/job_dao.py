@@ -0,0 +1,100 @@
+import json
+from typing import Any, Callable, Dict, Optional
+from model.job import Job
+from utils.enums import JobKind, JobStatus
+from database.db_connection import DatabaseConnection
+from database.row_decoders import decode_job, tuple_cursor
+
+# Column order of decode_job
+_COLUMNS = "id, kind, params, status, progress, result, error, created_at, started_at, finished_at"
+
+_NOW = "strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
+
+class JobDAO:
+    """Persistence of background jobs (see migration 0008). Status changes
+    are guarded by the current status, so a job only moves forward:
+    queued -> running -> succeeded | failed."""
+
+    def __init__(self, db: DatabaseConnection):
+        self.db = db
+
+    def create(self, kind: JobKind, params: Dict[str, Any], owner_pid: int) -> Job:
+        """Insert a queued job and return it with its assigned id."""
+        with self.db as conn:
+            row = tuple_cursor(conn).execute(
+                f"""
+                INSERT INTO jobs (kind, params, owner_pid)
+                VALUES (?, ?, ?)
+                RETURNING {_COLUMNS}
+                """,
+                (kind.value, json.dumps(params), owner_pid),
+            ).fetchall()[0]
+        return decode_job(row)
+
+    def read(self, job_id: int) -> Optional[Job]:
+        with self.db as conn:
+            row = tuple_cursor(conn).execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        return decode_job(row) if row is not None else None
+
+    def mark_running(self, job_id: int) -> bool:
+        with self.db as conn:
+            cur = conn.execute(
+                f"""
+                UPDATE jobs
+                SET status = 'running', started_at = {_NOW}
+                WHERE id = ? AND status = 'queued'
+                """,
+                (job_id,),
+            )
+            return cur.rowcount == 1
+
+    def update_progress(self, job_id: int, progress: float) -> None:
+        with self.db as conn:
+            conn.execute(
+                "UPDATE jobs SET progress = ? WHERE id = ? AND status = 'running'",
+                (progress, job_id),
+            )
+
+    def mark_succeeded(self, job_id: int, result: Any) -> None:
+        with self.db as conn:
+            conn.execute(
+                f"""
+                UPDATE jobs
+                SET status = 'succeeded', progress = 1, result = ?, finished_at = {_NOW}
+                WHERE id = ? AND status = 'running'
+                """,
+                (json.dumps(result), job_id),
+            )
+
+    def mark_failed(self, job_id: int, error: str) -> None:
+        """Fail a queued or running job."""
+        with self.db as conn:
+            conn.execute(
+                f"""
+                UPDATE jobs
+                SET status = 'failed', error = ?, finished_at = {_NOW}
+                WHERE id = ? AND status IN ('queued', 'running')
+                """,
+                (error, job_id),
+            )
+
+    def fail_orphaned(self, is_alive: Callable[[int], bool], error: str) -> int:
+        """Fail the queued and running jobs whose owner process is gone.
+        Returns the number of jobs failed."""
+        with self.db as conn:
+            rows = conn.execute(
+                "SELECT id, owner_pid FROM jobs WHERE status IN ('queued', 'running')"
+            ).fetchall()
+            orphaned = [(error, row["id"]) for row in rows if not is_alive(row["owner_pid"])]
+            conn.executemany(
+                f"""
+                UPDATE jobs
+                SET status = 'failed', error = ?, finished_at = {_NOW}
+                WHERE id = ? AND status IN ('queued', 'running')
+                """,
+                orphaned,
+            )
+        return len(orphaned)
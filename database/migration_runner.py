@@ -0,0 +1,141 @@
+import re
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, NamedTuple
+
+from database.db_connection import DatabaseConnection
+from exceptions.finance_manager_exception import SchemaOutOfDateException
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+_MIGRATION_FILE = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    path: Path
+
+class MigrationRunner:
+    """Applies the versioned SQL scripts in ``database/migrations`` in order.
+
+    The current version is tracked in the ``schema_version`` table. Each
+    migration runs inside its own ``BEGIN IMMEDIATE`` transaction together
+    with its version bump, so a failing script leaves the schema untouched
+    and concurrent runners apply it once. Server workers should not race
+    for it, though: a long migration holds the write lock for longer than
+    their busy timeout. The production server migrates once before it
+    forks the workers, which only ``check`` the version.
+    """
+
+    def __init__(self, db: DatabaseConnection, migrations_dir: Path = MIGRATIONS_DIR):
+        self.db = db
+        self.migrations_dir = migrations_dir
+
+    def discover(self) -> List[Migration]:
+        migrations = []
+        for path in self.migrations_dir.glob("*.sql"):
+            match = _MIGRATION_FILE.match(path.name)
+            if match is None:
+                continue
+            migrations.append(Migration(int(match.group(1)), match.group(2), path))
+
+        migrations.sort(key=lambda m: m.version)
+        versions = [m.version for m in migrations]
+        if len(versions) != len(set(versions)):
+            raise ValueError(f"Duplicate migration versions in {self.migrations_dir}")
+        return migrations
+
+    def current_version(self) -> int:
+        with self.db as conn:
+            self._ensure_version_table(conn)
+            row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        return row[0] or 0
+
+    def pending(self) -> List[Migration]:
+        """Migrations not applied yet. Read-only: does not create the
+        version table on a new database."""
+        with self.db as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+            ).fetchone()
+            applied = set()
+            if exists is not None:
+                applied = {row[0] for row in conn.execute("SELECT version FROM schema_version")}
+        return [m for m in self.discover() if m.version not in applied]
+
+    def check(self) -> None:
+        """Raise SchemaOutOfDateException if any migration is pending."""
+        pending = self.pending()
+        if pending:
+            raise SchemaOutOfDateException([f"{m.version:04d}_{m.name}" for m in pending])
+
+    def run(self) -> List[Migration]:
+        applied = []
+        for migration in self.discover():
+            if self._apply(migration):
+                applied.append(migration)
+        return applied
+
+    def _apply(self, migration: Migration) -> bool:
+        statements = _split_statements(migration.path.read_text(encoding="utf-8"))
+
+        with self.db as conn:
+            # Inside a caller's `with db` block the connection is shared;
+            # committing for BEGIN IMMEDIATE would commit the caller's work
+            if conn.in_transaction:
+                raise RuntimeError("Migrations cannot run inside an open transaction")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._ensure_version_table(conn)
+                row = conn.execute(
+                    "SELECT 1 FROM schema_version WHERE version = ?",
+                    (migration.version,),
+                ).fetchone()
+                if row is not None:
+                    conn.rollback()
+                    return False
+
+                for statement in statements:
+                    conn.execute(statement)
+                conn.execute(
+                    "INSERT INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)",
+                    (
+                        migration.version,
+                        migration.name,
+                        datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    ),
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return True
+
+    @staticmethod
+    def _ensure_version_table(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TEXT NOT NULL
+            )
+            """
+        )
+
+def _split_statements(script: str) -> List[str]:
+    """Split a SQL script into complete statements (trigger bodies included)."""
+    statements = []
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        stripped = line.strip()
+        if not buffer and (not stripped or stripped.startswith("--")):
+            continue
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ""
+
+    if buffer.strip():
+        raise ValueError(f"Incomplete SQL statement at end of script: {buffer.strip()[:80]}")
+    return statements
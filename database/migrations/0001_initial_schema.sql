@@ -0,0 +1,26 @@
+-- Baseline schema. Uses IF NOT EXISTS so databases created before the
+-- migration runner existed are adopted as-is.
+CREATE TABLE IF NOT EXISTS accounts (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    account_type TEXT NOT NULL,
+    currency TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    account_id INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    amount REAL NOT NULL,
+    description TEXT DEFAULT '',
+    category TEXT NOT NULL,
+    transaction_type TEXT,
+    FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS budgets (
+    id INTEGER PRIMARY KEY,
+    month TEXT NOT NULL,
+    category TEXT NOT NULL,
+    limit_amount REAL NOT NULL
+);
@@ -0,0 +1,29 @@
+-- Secondary indexes matching the DAO query shapes, so the
+-- ORDER BY date DESC, id DESC / month / category queries are index-ordered
+-- scans instead of full scans with a temp B-tree sort.
+
+-- TransactionDAO.read_all / read_filtered (date range)
+CREATE INDEX IF NOT EXISTS idx_transactions_date
+    ON transactions (date DESC, id DESC);
+
+-- TransactionDAO.read_by_account
+CREATE INDEX IF NOT EXISTS idx_transactions_account_date
+    ON transactions (account_id, date DESC, id DESC);
+
+-- TransactionDAO.read_filtered (transaction_type + date range)
+CREATE INDEX IF NOT EXISTS idx_transactions_type_date
+    ON transactions (transaction_type, date DESC, id DESC);
+
+-- BudgetDAO.read_all
+CREATE INDEX IF NOT EXISTS idx_budgets_month_id
+    ON budgets (month DESC, id DESC);
+
+-- BudgetDAO.read_by_month
+CREATE INDEX IF NOT EXISTS idx_budgets_month_category
+    ON budgets (month, category);
+
+-- BudgetDAO.read_by_category
+CREATE INDEX IF NOT EXISTS idx_budgets_category_month
+    ON budgets (category, month DESC);
+
+ANALYZE;
@@ -0,0 +1,16 @@
+-- Indexes for TransactionDAO.aggregate_amounts.
+-- (.., amount) orders the median's ORDER BY amount LIMIT/OFFSET walk, and the
+-- (.., date, amount) pairs make date-range aggregates covering index scans.
+CREATE INDEX IF NOT EXISTS idx_transactions_amount
+    ON transactions (amount);
+
+CREATE INDEX IF NOT EXISTS idx_transactions_type_amount
+    ON transactions (transaction_type, amount);
+
+CREATE INDEX IF NOT EXISTS idx_transactions_date_amount
+    ON transactions (date, amount);
+
+CREATE INDEX IF NOT EXISTS idx_transactions_type_date_amount
+    ON transactions (transaction_type, date, amount);
+
+ANALYZE;
@@ -0,0 +1,7 @@
+-- Covering index for TransactionDAO.sum_by_category_and_type: the
+-- GROUP BY category, transaction_type becomes an in-order index scan
+-- instead of a full table scan into a temp B-tree.
+CREATE INDEX IF NOT EXISTS idx_transactions_category_type_amount
+    ON transactions (category, transaction_type, amount);
+
+ANALYZE;
@@ -0,0 +1,92 @@
+-- Monthly rollup of the ledger, kept in sync by triggers in the same SQL
+-- transaction as every insert/update/delete on transactions. Analytics read
+-- these few hundred rows instead of scanning the ledger.
+-- Rebuild from scratch with: python manage.py rebuild-rollups
+CREATE TABLE IF NOT EXISTS monthly_totals (
+    month TEXT NOT NULL,
+    account_id INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    transaction_type TEXT NOT NULL,
+    total REAL NOT NULL,
+    count INTEGER NOT NULL,
+    sum_sq REAL NOT NULL,
+    PRIMARY KEY (month, account_id, category, transaction_type)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_monthly_totals_type_month
+    ON monthly_totals (transaction_type, month);
+
+CREATE TRIGGER IF NOT EXISTS trg_monthly_totals_insert
+AFTER INSERT ON transactions
+WHEN NEW.transaction_type IS NOT NULL
+BEGIN
+    INSERT INTO monthly_totals (month, account_id, category, transaction_type, total, count, sum_sq)
+    VALUES (substr(NEW.date, 1, 7), NEW.account_id, NEW.category, NEW.transaction_type,
+            NEW.amount, 1, NEW.amount * NEW.amount)
+    ON CONFLICT (month, account_id, category, transaction_type) DO UPDATE SET
+        total = total + excluded.total,
+        count = count + 1,
+        sum_sq = sum_sq + excluded.sum_sq;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_monthly_totals_delete
+AFTER DELETE ON transactions
+WHEN OLD.transaction_type IS NOT NULL
+BEGIN
+    UPDATE monthly_totals
+    SET total = total - OLD.amount,
+        count = count - 1,
+        sum_sq = sum_sq - OLD.amount * OLD.amount
+    WHERE month = substr(OLD.date, 1, 7)
+      AND account_id = OLD.account_id
+      AND category = OLD.category
+      AND transaction_type = OLD.transaction_type;
+
+    DELETE FROM monthly_totals
+    WHERE month = substr(OLD.date, 1, 7)
+      AND account_id = OLD.account_id
+      AND category = OLD.category
+      AND transaction_type = OLD.transaction_type
+      AND count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_monthly_totals_update_old
+AFTER UPDATE OF account_id, date, amount, category, transaction_type ON transactions
+WHEN OLD.transaction_type IS NOT NULL
+BEGIN
+    UPDATE monthly_totals
+    SET total = total - OLD.amount,
+        count = count - 1,
+        sum_sq = sum_sq - OLD.amount * OLD.amount
+    WHERE month = substr(OLD.date, 1, 7)
+      AND account_id = OLD.account_id
+      AND category = OLD.category
+      AND transaction_type = OLD.transaction_type;
+
+    DELETE FROM monthly_totals
+    WHERE month = substr(OLD.date, 1, 7)
+      AND account_id = OLD.account_id
+      AND category = OLD.category
+      AND transaction_type = OLD.transaction_type
+      AND count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_monthly_totals_update_new
+AFTER UPDATE OF account_id, date, amount, category, transaction_type ON transactions
+WHEN NEW.transaction_type IS NOT NULL
+BEGIN
+    INSERT INTO monthly_totals (month, account_id, category, transaction_type, total, count, sum_sq)
+    VALUES (substr(NEW.date, 1, 7), NEW.account_id, NEW.category, NEW.transaction_type,
+            NEW.amount, 1, NEW.amount * NEW.amount)
+    ON CONFLICT (month, account_id, category, transaction_type) DO UPDATE SET
+        total = total + excluded.total,
+        count = count + 1,
+        sum_sq = sum_sq + excluded.sum_sq;
+END;
+
+INSERT INTO monthly_totals (month, account_id, category, transaction_type, total, count, sum_sq)
+SELECT substr(date, 1, 7), account_id, category, transaction_type,
+       TOTAL(amount), COUNT(*), TOTAL(amount * amount)
+FROM transactions
+WHERE transaction_type IS NOT NULL
+GROUP BY substr(date, 1, 7), account_id, category, transaction_type;
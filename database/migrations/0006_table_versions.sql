@@ -0,0 +1,14 @@
+-- Per-table data versions, bumped by the DAO write paths in the same SQL
+-- transaction as the write. The API derives ETags from them and the
+-- analytics result cache keys on the transactions version.
+-- Versions start at the migration's Unix time so a recreated database does
+-- not hand out ETags that match copies cached from an older one.
+CREATE TABLE IF NOT EXISTS table_versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO table_versions (name, version)
+VALUES ('accounts', CAST(strftime('%s', 'now') AS INTEGER)),
+       ('transactions', CAST(strftime('%s', 'now') AS INTEGER)),
+       ('budgets', CAST(strftime('%s', 'now') AS INTEGER));
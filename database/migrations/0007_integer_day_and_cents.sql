@@ -0,0 +1,160 @@
+-- Store transaction dates as integer day numbers (days since 1970-01-01)
+-- and amounts as integer cents. Range filters, ORDER BY and the indexes
+-- then compare small integers instead of ISO strings, and SQL sums over
+-- cents are exact. The old TEXT date and REAL amount stay available as
+-- virtual generated columns, so ad-hoc queries and exports keep their shape;
+-- they are read-only, so writers set day and amount_cents.
+-- Amounts are rounded to the cent on the way in.
+CREATE TABLE transactions_new (
+    id INTEGER PRIMARY KEY,
+    account_id INTEGER NOT NULL,
+    date TEXT GENERATED ALWAYS AS (date(day + 2440587.5)) VIRTUAL,
+    amount REAL GENERATED ALWAYS AS (amount_cents / 100.0) VIRTUAL,
+    description TEXT DEFAULT '',
+    category TEXT NOT NULL,
+    transaction_type TEXT,
+    day INTEGER NOT NULL,
+    amount_cents INTEGER NOT NULL,
+    FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE
+);
+
+-- An unparseable date gives NULL day and aborts the migration
+INSERT INTO transactions_new (id, account_id, description, category, transaction_type, day, amount_cents)
+SELECT id, account_id, description, category, transaction_type,
+       CAST(julianday(date) - 2440587.5 AS INTEGER),
+       CAST(round(amount * 100) AS INTEGER)
+FROM transactions;
+
+-- Also drops the old indexes and the rollup triggers
+DROP TABLE transactions;
+
+ALTER TABLE transactions_new RENAME TO transactions;
+
+-- Indexes from 0002-0004 on the integer columns
+
+-- TransactionDAO.read_all / read_filtered (date range)
+CREATE INDEX idx_transactions_day
+    ON transactions (day DESC, id DESC);
+
+-- TransactionDAO.read_by_account
+CREATE INDEX idx_transactions_account_day
+    ON transactions (account_id, day DESC, id DESC);
+
+-- TransactionDAO.read_filtered (transaction_type + date range)
+CREATE INDEX idx_transactions_type_day
+    ON transactions (transaction_type, day DESC, id DESC);
+
+-- TransactionDAO.aggregate_amounts (median walk, covering range aggregates)
+CREATE INDEX idx_transactions_amount_cents
+    ON transactions (amount_cents);
+
+CREATE INDEX idx_transactions_type_amount_cents
+    ON transactions (transaction_type, amount_cents);
+
+CREATE INDEX idx_transactions_day_amount_cents
+    ON transactions (day, amount_cents);
+
+CREATE INDEX idx_transactions_type_day_amount_cents
+    ON transactions (transaction_type, day, amount_cents);
+
+-- TransactionDAO.sum_by_category_and_type
+CREATE INDEX idx_transactions_category_type_amount_cents
+    ON transactions (category, transaction_type, amount_cents);
+
+-- Monthly rollup (0005) with exact integer totals
+DROP TABLE monthly_totals;
+
+CREATE TABLE monthly_totals (
+    month TEXT NOT NULL,
+    account_id INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    transaction_type TEXT NOT NULL,
+    total_cents INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    -- Squares of cents can exceed 64 bits when summed
+    sum_sq REAL NOT NULL,
+    PRIMARY KEY (month, account_id, category, transaction_type)
+) WITHOUT ROWID;
+
+CREATE INDEX idx_monthly_totals_type_month
+    ON monthly_totals (transaction_type, month);
+
+CREATE TRIGGER trg_monthly_totals_insert
+AFTER INSERT ON transactions
+WHEN NEW.transaction_type IS NOT NULL
+BEGIN
+    INSERT INTO monthly_totals (month, account_id, category, transaction_type, total_cents, count, sum_sq)
+    VALUES (substr(NEW.date, 1, 7), NEW.account_id, NEW.category, NEW.transaction_type,
+            NEW.amount_cents, 1, NEW.amount_cents * NEW.amount_cents)
+    ON CONFLICT (month, account_id, category, transaction_type) DO UPDATE SET
+        total_cents = total_cents + excluded.total_cents,
+        count = count + 1,
+        sum_sq = sum_sq + excluded.sum_sq;
+END;
+
+CREATE TRIGGER trg_monthly_totals_delete
+AFTER DELETE ON transactions
+WHEN OLD.transaction_type IS NOT NULL
+BEGIN
+    UPDATE monthly_totals
+    SET total_cents = total_cents - OLD.amount_cents,
+        count = count - 1,
+        sum_sq = sum_sq - OLD.amount_cents * OLD.amount_cents
+    WHERE month = substr(OLD.date, 1, 7)
+      AND account_id = OLD.account_id
+      AND category = OLD.category
+      AND transaction_type = OLD.transaction_type;
+
+    DELETE FROM monthly_totals
+    WHERE month = substr(OLD.date, 1, 7)
+      AND account_id = OLD.account_id
+      AND category = OLD.category
+      AND transaction_type = OLD.transaction_type
+      AND count <= 0;
+END;
+
+CREATE TRIGGER trg_monthly_totals_update_old
+AFTER UPDATE OF account_id, day, amount_cents, category, transaction_type ON transactions
+WHEN OLD.transaction_type IS NOT NULL
+BEGIN
+    UPDATE monthly_totals
+    SET total_cents = total_cents - OLD.amount_cents,
+        count = count - 1,
+        sum_sq = sum_sq - OLD.amount_cents * OLD.amount_cents
+    WHERE month = substr(OLD.date, 1, 7)
+      AND account_id = OLD.account_id
+      AND category = OLD.category
+      AND transaction_type = OLD.transaction_type;
+
+    DELETE FROM monthly_totals
+    WHERE month = substr(OLD.date, 1, 7)
+      AND account_id = OLD.account_id
+      AND category = OLD.category
+      AND transaction_type = OLD.transaction_type
+      AND count <= 0;
+END;
+
+CREATE TRIGGER trg_monthly_totals_update_new
+AFTER UPDATE OF account_id, day, amount_cents, category, transaction_type ON transactions
+WHEN NEW.transaction_type IS NOT NULL
+BEGIN
+    INSERT INTO monthly_totals (month, account_id, category, transaction_type, total_cents, count, sum_sq)
+    VALUES (substr(NEW.date, 1, 7), NEW.account_id, NEW.category, NEW.transaction_type,
+            NEW.amount_cents, 1, NEW.amount_cents * NEW.amount_cents)
+    ON CONFLICT (month, account_id, category, transaction_type) DO UPDATE SET
+        total_cents = total_cents + excluded.total_cents,
+        count = count + 1,
+        sum_sq = sum_sq + excluded.sum_sq;
+END;
+
+INSERT INTO monthly_totals (month, account_id, category, transaction_type, total_cents, count, sum_sq)
+SELECT substr(date, 1, 7), account_id, category, transaction_type,
+       SUM(amount_cents), COUNT(*), TOTAL(amount_cents * amount_cents)
+FROM transactions
+WHERE transaction_type IS NOT NULL
+GROUP BY substr(date, 1, 7), account_id, category, transaction_type;
+
+-- Cached analytics and ETags computed from the old representation
+UPDATE table_versions SET version = version + 1 WHERE name = 'transactions';
+
+ANALYZE;
@@ -0,0 +1,21 @@
+-- Background jobs (POST /api/jobs). params and result are JSON text;
+-- owner_pid is the process running the job, so a restarted server can
+-- fail the jobs whose process is gone instead of leaving them running.
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+    progress REAL NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    owner_pid INTEGER,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')),
+    started_at TEXT,
+    finished_at TEXT
+);
+
+-- Only unfinished jobs are looked up by status
+CREATE INDEX IF NOT EXISTS idx_jobs_unfinished ON jobs(status)
+    WHERE status IN ('queued', 'running');
@@ -0,0 +1,100 @@
+from typing import List, Optional, Tuple
+from utils.enums import Category, TransactionType
+from database.db_connection import DatabaseConnection
+
+class MonthlyTotalsDAO:
+    """Reads the ``monthly_totals`` rollup maintained by the triggers on
+    ``transactions`` (see migrations 0005 and 0007). Months are ``YYYY-MM``
+    strings, both ends of a month range are inclusive, and totals are kept
+    in integer cents."""
+
+    def __init__(self, db: DatabaseConnection):
+        self.db = db
+
+    def rebuild(self) -> int:
+        """Recompute the whole rollup from the ledger. Returns the number of
+        rollup rows written."""
+        with self.db as conn:
+            conn.execute("DELETE FROM monthly_totals")
+            cur = conn.execute(
+                """
+                INSERT INTO monthly_totals (month, account_id, category, transaction_type, total_cents, count, sum_sq)
+                SELECT substr(date, 1, 7), account_id, category, transaction_type,
+                       SUM(amount_cents), COUNT(*), TOTAL(amount_cents * amount_cents)
+                FROM transactions
+                WHERE transaction_type IS NOT NULL
+                GROUP BY substr(date, 1, 7), account_id, category, transaction_type
+                """
+            )
+            return cur.rowcount
+
+    def sum_by_month(
+        self,
+        start_month: Optional[str] = None,
+        end_month: Optional[str] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> List[Tuple[str, float, int]]:
+        """(month, total, count) per month, oldest first."""
+        where, params = self._filter_clause(start_month, end_month, transaction_type)
+        with self.db as conn:
+            cur = conn.execute(
+                f"""
+                SELECT month, SUM(total_cents), SUM(count)
+                FROM monthly_totals
+                {where}
+                GROUP BY month
+                ORDER BY month
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+
+        return [(r[0], r[1] / 100, r[2]) for r in rows]
+
+    def sum_by_category_and_type(
+        self,
+        start_month: Optional[str] = None,
+        end_month: Optional[str] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> List[Tuple[Category, TransactionType, float, int]]:
+        """Same shape as TransactionDAO.sum_by_category_and_type."""
+        where, params = self._filter_clause(start_month, end_month, transaction_type)
+        with self.db as conn:
+            cur = conn.execute(
+                f"""
+                SELECT category, transaction_type, SUM(total_cents), SUM(count)
+                FROM monthly_totals
+                {where}
+                GROUP BY category, transaction_type
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+
+        return [
+            (Category(r[0]), TransactionType(r[1]), r[2] / 100, r[3])
+            for r in rows
+        ]
+
+    def _filter_clause(
+        self,
+        start_month: Optional[str],
+        end_month: Optional[str],
+        transaction_type: Optional[TransactionType],
+    ) -> Tuple[str, tuple]:
+        clause = "WHERE 1=1"
+        params = []
+
+        if start_month is not None:
+            clause += " AND month >= ?"
+            params.append(start_month)
+
+        if end_month is not None:
+            clause += " AND month <= ?"
+            params.append(end_month)
+
+        if transaction_type is not None:
+            clause += " AND transaction_type = ?"
+            params.append(transaction_type.value)
+
+        return clause, tuple(params)
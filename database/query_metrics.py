@@ -0,0 +1,116 @@
+"""SQLite connection and cursor that time every statement.
+
+DatabaseConnection opens its pooled connections with InstrumentedConnection
+while metrics are enabled. A statement's duration covers ``execute`` plus
+every ``fetchone`` / ``fetchmany`` / ``fetchall`` on its cursor (SQLite
+produces rows lazily, so most of a SELECT runs while fetching), but not the
+caller's own work between fetches. It is recorded when the rows are used
+up, when the cursor runs its next statement, or when the cursor is closed
+or dropped. Rows read by iterating the cursor directly (e.g.
+``for row in cursor``) are neither timed nor counted.
+"""
+import re
+import sqlite3
+import time
+from functools import lru_cache
+from typing import Tuple
+
+from utils import metrics
+from utils.metrics import DB_STATEMENT_DURATION, DB_STATEMENT_ROWS
+
+# First table named after FROM / INTO / UPDATE / TABLE / INDEX ... ON
+_TABLE = re.compile(
+    r"\b(?:FROM|INTO|UPDATE|TABLE(?:\s+IF\s+NOT\s+EXISTS)?|ON)\s+([A-Za-z_]\w*)",
+    re.IGNORECASE,
+)
+
+@lru_cache(maxsize=1024)
+def statement_labels(sql: str) -> Tuple[str, str]:
+    """(operation, table) of a statement, e.g. ("SELECT", "transactions")."""
+    words = sql.split(None, 1)
+    operation = words[0].upper() if words else ""
+    match = _TABLE.search(sql)
+    return operation, match.group(1).lower() if match else ""
+
+class InstrumentedCursor(sqlite3.Cursor):
+    # Current statement: its (operation, table), time so far and rows so far
+    _labels = None
+    _elapsed = 0.0
+    _rows = 0
+
+    def execute(self, sql, parameters=()):
+        return self._run(super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self._run(super().executemany, sql, seq_of_parameters)
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(started, 0 if row is None else 1, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        started = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._fetched(started, len(rows), not rows)
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(started, len(rows), True)
+        return rows
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+    def _run(self, method, sql, parameters):
+        self._finish()
+        if not metrics.enabled():
+            return method(sql, parameters)
+
+        started = time.perf_counter()
+        method(sql, parameters)
+        self._labels = statement_labels(sql)
+        self._elapsed = time.perf_counter() - started
+        self._rows = 0
+        if self.description is None:
+            # No result rows to fetch: a write, DDL or PRAGMA without output
+            self._rows = max(self.rowcount, 0)
+            self._finish()
+        return self
+
+    def _fetched(self, started: float, rows: int, exhausted: bool) -> None:
+        if self._labels is None:
+            return
+        self._elapsed += time.perf_counter() - started
+        self._rows += rows
+        if exhausted:
+            self._finish()
+
+    def _finish(self) -> None:
+        labels = self._labels
+        if labels is None:
+            return
+        self._labels = None
+        DB_STATEMENT_DURATION.observe(self._elapsed, *labels)
+        if self._rows:
+            DB_STATEMENT_ROWS.inc(self._rows, *labels)
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Hands out InstrumentedCursors, also from the ``execute`` shortcuts
+    (which would otherwise bypass ``cursor()``)."""
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
@@ -0,0 +1,128 @@
+"""Row -> model decoding shared by the DAOs.
+
+Decoders take rows positionally, in the column order of the DAOs' SELECT
+and RETURNING lists, so they work on the plain tuples of a cursor from
+tuple_cursor() as well as on sqlite3.Row. Enum members are looked up in
+precomputed value -> member dicts instead of calling the Enum
+constructor. Transactions are stored as integer day numbers and cents
+(migration 0007); day_to_date is memoized, so rows with the same day
+share one date object, and to_day / to_cents are the write-side
+counterparts.
+"""
+import json
+import math
+import sqlite3
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from model.account import Account
+from model.bank_account import BankAccount
+from model.budget import Budget
+from model.job import Job
+from model.savings_account import SavingsAccount
+from model.transaction import Transaction
+from model.wallet_account import WalletAccount
+from utils.enums import AccountType, Category, Currency, JobKind, JobStatus, TransactionType
+
+DATE_CACHE_SIZE = 8192
+EPOCH_ORDINAL = 719163  # date(1970, 1, 1).toordinal()
+# Largest |amount_cents| accepted; keeps SUM(amount_cents) far from SQLite's
+# 64-bit integer overflow
+MAX_CENTS = 10**15
+
+CATEGORY_BY_VALUE = {category.value: category for category in Category}
+TRANSACTION_TYPE_BY_VALUE = {transaction_type.value: transaction_type for transaction_type in TransactionType}
+CURRENCY_BY_VALUE = {currency.value: currency for currency in Currency}
+ACCOUNT_CLASS_BY_TYPE = {
+    AccountType.BANK.value: BankAccount,
+    AccountType.WALLET.value: WalletAccount,
+    AccountType.SAVINGS.value: SavingsAccount,
+}
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def day_to_date(day: int) -> date:
+    return date.fromordinal(day + EPOCH_ORDINAL)
+
+def to_day(value: date) -> int:
+    """Days since 1970-01-01, as stored in transactions.day."""
+    return value.toordinal() - EPOCH_ORDINAL
+
+def to_cents(amount: float) -> int:
+    """Amount in integer cents, as stored in transactions.amount_cents.
+    Half-cents round away from zero on the amount as written (12.345 ->
+    1235), not on its binary float value. Raises ValueError for NaN,
+    infinities and amounts too large to store."""
+    if not math.isfinite(amount):
+        raise ValueError("Amount must be a finite number")
+    # abs(amount) <= MAX_CENTS keeps the Decimal within its default precision
+    cents = MAX_CENTS + 1
+    if abs(amount) <= MAX_CENTS:
+        cents = int((Decimal(str(amount)) * 100).to_integral_value(ROUND_HALF_UP))
+    if abs(cents) > MAX_CENTS:
+        raise ValueError(f"Amount must be between -{MAX_CENTS // 100} and {MAX_CENTS // 100}")
+    return cents
+
+def tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor returning plain tuples instead of the connection's sqlite3.Row."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur
+
+def decode_transaction(row) -> Transaction:
+    """(id, account_id, day, amount_cents, description, category, transaction_type)"""
+    transaction_id, account_id, day, amount_cents, description, category, transaction_type = row
+    try:
+        category = CATEGORY_BY_VALUE[category]
+        transaction_type = TRANSACTION_TYPE_BY_VALUE[transaction_type]
+    except KeyError:
+        # Let the Enum raise its usual ValueError
+        category = Category(category)
+        transaction_type = TransactionType(transaction_type)
+
+    return Transaction(
+        transaction_id,
+        account_id,
+        day_to_date(day),
+        amount_cents / 100,
+        description or "",
+        category,
+        transaction_type,
+    )
+
+def decode_account(row) -> Account:
+    """(id, name, account_type, currency)"""
+    account_id, name, account_type, currency = row
+    try:
+        account_class = ACCOUNT_CLASS_BY_TYPE[account_type]
+        currency = CURRENCY_BY_VALUE[currency]
+    except KeyError:
+        account_class = ACCOUNT_CLASS_BY_TYPE.get(AccountType(account_type).value, BankAccount)
+        currency = Currency(currency)
+
+    return account_class(account_id, name, currency)
+
+def decode_budget(row) -> Budget:
+    """(id, month, category, limit_amount)"""
+    budget_id, month, category, limit_amount = row
+    try:
+        category = CATEGORY_BY_VALUE[category]
+    except KeyError:
+        category = Category(category)
+
+    return Budget(budget_id, month, category, float(limit_amount))
+
+def decode_job(row) -> Job:
+    """(id, kind, params, status, progress, result, error, created_at, started_at, finished_at)"""
+    job_id, kind, params, status, progress, result, error, created_at, started_at, finished_at = row
+    return Job(
+        job_id,
+        JobKind(kind),
+        json.loads(params),
+        JobStatus(status),
+        progress,
+        json.loads(result) if result is not None else None,
+        error,
+        created_at,
+        started_at,
+        finished_at,
+    )
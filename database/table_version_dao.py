@@ -0,0 +1,42 @@
+import sqlite3
+from typing import Dict, Sequence
+from database.db_connection import DatabaseConnection
+
+def bump_table_version(conn: sqlite3.Connection, table: str) -> None:
+    """Increment ``table``'s version on the caller's connection, inside the
+    same SQL transaction as the write it records."""
+    conn.execute(
+        "UPDATE table_versions SET version = version + 1 WHERE name = ?",
+        (table,),
+    )
+
+class TableVersionDAO:
+    """Reads the per-table data versions (see migration 0006)."""
+
+    def __init__(self, db: DatabaseConnection):
+        self.db = db
+
+    def read(self, table: str) -> int:
+        with self.db as conn:
+            row = conn.execute(
+                "SELECT version FROM table_versions WHERE name = ?",
+                (table,),
+            ).fetchone()
+
+        if row is None:
+            raise ValueError(f"Unknown versioned table '{table}'")
+        return row[0]
+
+    def read_many(self, tables: Sequence[str]) -> Dict[str, int]:
+        placeholders = ", ".join("?" * len(tables))
+        with self.db as conn:
+            rows = conn.execute(
+                f"SELECT name, version FROM table_versions WHERE name IN ({placeholders})",
+                tuple(tables),
+            ).fetchall()
+
+        versions = {r[0]: r[1] for r in rows}
+        missing = [table for table in tables if table not in versions]
+        if missing:
+            raise ValueError(f"Unknown versioned tables: {', '.join(missing)}")
+        return versions
@@ -1,36 +1,98 @@
-from typing import List, Optional
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from datetime import date
 from model.transaction import Transaction
 from utils.enums import Category, TransactionType
-from database.db_connection import DatabaseConnection
+from database.db_connection import DatabaseConnection, is_primary_key_violation
+from exceptions.finance_manager_exception import DuplicateIDException
+from database.table_version_dao import bump_table_version
+from database.row_decoders import day_to_date, decode_transaction, to_cents, to_day, tuple_cursor
+
+DEFAULT_FETCH_SIZE = 1000
+DEFAULT_BATCH_SIZE = 1000
+
+# Keeps IN (...) lists well under SQLite's bound-parameter limit
+_ID_CHUNK_SIZE = 500
+
+# Stored columns, in decode_transaction order (integer day and cents, see
+# migration 0007)
+_COLUMNS = "id, account_id, day, amount_cents, description, category, transaction_type"
+
+# Same rows through the generated TEXT date / REAL amount columns, for the
+# streaming exports
+_EXPORT_COLUMNS = "id, account_id, date, amount, description, category, transaction_type"
+
+_INSERT_SQL = f"""
+    INSERT INTO transactions ({_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
 
 class TransactionDAO:
     def __init__(self, db: DatabaseConnection):
         self.db = db
 
-    def create(self, transaction: Transaction) -> None:
+    def create(self, transaction: Transaction) -> Transaction:
+        """Insert the transaction and return it as stored, in one statement.
+        Raises DuplicateIDException if the id is taken."""
         with self.db as conn:
-            conn.execute(
-                """
-                INSERT INTO transactions (id, account_id, date, amount, description, category, transaction_type)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    transaction.id,
-                    transaction.account_id,
-                    transaction.date.isoformat(),
-                    transaction.amount,
-                    transaction.description,
-                    transaction.category.value,
-                    transaction.transaction_type.value,
-                ),
-            )
+            try:
+                row = conn.execute(
+                    f"{_INSERT_SQL} RETURNING {_COLUMNS}",
+                    self._insert_params(transaction),
+                ).fetchall()[0]
+            except sqlite3.IntegrityError as e:
+                if is_primary_key_violation(e):
+                    raise DuplicateIDException(transaction.id) from e
+                raise
+            bump_table_version(conn, "transactions")
+
+        return decode_transaction(row)
+
+    def create_many(
+        self,
+        transactions: Sequence[Transaction],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Tuple[int, str]]:
+        """Insert all transactions in a single SQL transaction and commit.
+
+        Rows are sent with one executemany per batch of ``batch_size``. A row
+        that violates a constraint only aborts its own statement: it is
+        recorded and executemany resumes with the next row (no savepoints,
+        which would make every batch several times slower). Returns
+        (position in ``transactions``, error) for the skipped rows.
+        """
+        failures: List[Tuple[int, str]] = []
+        with self.db as conn:
+            for batch_start in range(0, len(transactions), batch_size):
+                batch_end = min(batch_start + batch_size, len(transactions))
+                next_row = batch_start
+                while next_row < batch_end:
+                    current = [next_row]
+
+                    def params(first=next_row):
+                        for position in range(first, batch_end):
+                            current[0] = position
+                            yield self._insert_params(transactions[position])
+
+                    try:
+                        conn.executemany(_INSERT_SQL, params())
+                        break
+                    except (sqlite3.IntegrityError, ValueError) as e:
+                        # executemany stops on the row it was executing (or
+                        # whose parameters could not be built, e.g. to_cents)
+                        failures.append((current[0], str(e)))
+                        next_row = current[0] + 1
+
+            if len(failures) < len(transactions):
+                bump_table_version(conn, "transactions")
+
+        return failures
 
     def read(self, transaction_id: int) -> Optional[Transaction]:
         with self.db as conn:
-            cur = conn.execute(
-                """
-                SELECT id, account_id, date, amount, description, category, transaction_type
+            cur = tuple_cursor(conn).execute(
+                f"""
+                SELECT {_COLUMNS}
                 FROM transactions
                 WHERE id = ?
                 """,
@@ -40,33 +102,66 @@ class TransactionDAO:
 
         if row is None:
             return None
-        return self._row_to_transaction(row)
+        return decode_transaction(row)
 
     def read_all(self) -> List[Transaction]:
         with self.db as conn:
-            cur = conn.execute(
-                """
-                SELECT id, account_id, date, amount, description, category, transaction_type
+            cur = tuple_cursor(conn).execute(
+                f"""
+                SELECT {_COLUMNS}
                 FROM transactions
-                ORDER BY date DESC, id DESC
+                ORDER BY day DESC, id DESC
                 """
             )
             rows = cur.fetchall()
-        return [self._row_to_transaction(r) for r in rows]
+        return [decode_transaction(r) for r in rows]
+
+    def read_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+    ) -> List[Transaction]:
+        """Read up to ``limit`` transactions in (date DESC, id DESC) order,
+        starting strictly after the ``(date, id)`` keyset position ``after``."""
+        with self.db as conn:
+            if after is None:
+                cur = tuple_cursor(conn).execute(
+                    f"""
+                    SELECT {_COLUMNS}
+                    FROM transactions
+                    ORDER BY day DESC, id DESC
+                    LIMIT ?
+                    """,
+                    (limit,),
+                )
+            else:
+                after_date, after_id = after
+                cur = tuple_cursor(conn).execute(
+                    f"""
+                    SELECT {_COLUMNS}
+                    FROM transactions
+                    WHERE (day, id) < (?, ?)
+                    ORDER BY day DESC, id DESC
+                    LIMIT ?
+                    """,
+                    (to_day(after_date), after_id, limit),
+                )
+            rows = cur.fetchall()
+        return [decode_transaction(r) for r in rows]
 
     def read_by_account(self, account_id: int) -> List[Transaction]:
         with self.db as conn:
-            cur = conn.execute(
-                """
-                SELECT id, account_id, date, amount, description, category, transaction_type
+            cur = tuple_cursor(conn).execute(
+                f"""
+                SELECT {_COLUMNS}
                 FROM transactions
                 WHERE account_id = ?
-                ORDER BY date DESC, id DESC
+                ORDER BY day DESC, id DESC
                 """,
                 (account_id,),
             )
             rows = cur.fetchall()
-        return [self._row_to_transaction(r) for r in rows]
+        return [decode_transaction(r) for r in rows]
 
     def read_filtered(
         self,
@@ -74,44 +169,256 @@ class TransactionDAO:
         end_date: Optional[date] = None,
         transaction_type: Optional[TransactionType] = None,
     ) -> List[Transaction]:
+        query, params = self._filtered_query(start_date, end_date, transaction_type)
+        with self.db as conn:
+            cur = tuple_cursor(conn).execute(query, params)
+            rows = cur.fetchall()
+        return [decode_transaction(r) for r in rows]
+
+    def iter_filtered_rows(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> Iterator[List[sqlite3.Row]]:
+        """Yield the filtered rows in batches of ``fetch_size`` straight from
+        the cursor, without building Transaction objects.
+
+        The pooled connection is held until the generator is exhausted or
+        closed, so memory stays constant regardless of the result size.
+        """
+        query, params = self._filtered_query(start_date, end_date, transaction_type, _EXPORT_COLUMNS)
+        with self.db as conn:
+            cur = conn.execute(query, params)
+            while True:
+                rows = cur.fetchmany(fetch_size)
+                if not rows:
+                    break
+                yield rows
+
+    def iter_filtered_pages(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+        page_size: int = DEFAULT_FETCH_SIZE,
+    ) -> Iterator[List[sqlite3.Row]]:
+        """Yield the same rows as iter_filtered_rows, in pages of
+        ``page_size`` read by keyset on (day, id).
+
+        Each page is a short query of its own, so no connection or read
+        transaction is held while the caller works on a page; in exchange
+        the pages are not one snapshot, and rows written meanwhile may or
+        may not be included.
+        """
+        where, params = self._filter_clause(start_date, end_date, transaction_type)
+        after: tuple = ()
+        while True:
+            keyset = " AND (day, id) < (?, ?)" if after else ""
+            with self.db as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT {_EXPORT_COLUMNS}
+                    FROM transactions
+                    {where}{keyset}
+                    ORDER BY day DESC, id DESC
+                    LIMIT ?
+                    """,
+                    params + after + (page_size,),
+                ).fetchall()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < page_size:
+                return
+            last = rows[-1]
+            after = (to_day(date.fromisoformat(last["date"])), last["id"])
+
+    def count_filtered(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> int:
+        where, params = self._filter_clause(start_date, end_date, transaction_type)
+        with self.db as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM transactions {where}", params).fetchone()[0]
+
+    def aggregate_amounts(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> Dict[str, Any]:
+        """Compute count, sum, min, max, median and the sum of squared
+        deviations from the mean (``m2``) of the filtered amounts inside
+        SQLite, without loading the rows. Sums run over integer cents, so
+        ``sum`` is exact to the cent. All queries read one snapshot, so a
+        concurrent write cannot shift the median between them."""
+        where, params = self._filter_clause(start_date, end_date, transaction_type)
+        with self.db.snapshot() as conn:
+            row = conn.execute(
+                f"""
+                SELECT COUNT(*), SUM(amount_cents), MIN(amount_cents), MAX(amount_cents)
+                FROM transactions
+                {where}
+                """,
+                params,
+            ).fetchone()
+            count = row[0]
+
+            median = None
+            if count > 0:
+                # Middle one (odd count) or two (even count) values by amount
+                middle = conn.execute(
+                    f"""
+                    SELECT amount_cents
+                    FROM transactions
+                    {where}
+                    ORDER BY amount_cents
+                    LIMIT ? OFFSET ?
+                    """,
+                    params + (2 - count % 2, (count - 1) // 2),
+                ).fetchall()
+                median = sum(r[0] for r in middle) / len(middle) / 100
+
+            m2 = 0.0
+            if count > 1:
+                # Corrected two-pass: deviations from the mean of the first
+                # query, instead of sum(x^2) - n * mean^2, which cancels
+                # catastrophically when the amounts are large and close
+                mean_cents = row[1] / count
+                deviations = conn.execute(
+                    f"""
+                    SELECT TOTAL((amount_cents - ?) * (amount_cents - ?)), TOTAL(amount_cents - ?)
+                    FROM transactions
+                    {where}
+                    """,
+                    (mean_cents, mean_cents, mean_cents) + params,
+                ).fetchone()
+                m2 = deviations[0] - deviations[1] * deviations[1] / count
+
+        return {
+            "count": count,
+            "sum": (row[1] or 0) / 100,
+            "m2": m2 / 10000,
+            "min": row[2] / 100 if row[2] is not None else None,
+            "max": row[3] / 100 if row[3] is not None else None,
+            "median": median,
+        }
+
+    def sum_by_category_and_type(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> List[Tuple[Category, TransactionType, float, int]]:
+        """Total amount and row count per (category, transaction_type)."""
+        where, params = self._filter_clause(start_date, end_date, transaction_type)
+        with self.db as conn:
+            cur = conn.execute(
+                f"""
+                SELECT category, transaction_type, SUM(amount_cents), COUNT(*)
+                FROM transactions
+                {where}
+                GROUP BY category, transaction_type
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+
+        return [
+            (Category(r[0]), TransactionType(r[1]), r[2] / 100, r[3])
+            for r in rows
+        ]
+
+    def sum_by_month(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> List[Tuple[str, float, int]]:
+        """(YYYY-MM, total, count) per month from the raw ledger, oldest first.
+        Used when a date range does not fall on whole months; otherwise the
+        monthly_totals rollup answers the same question."""
+        where, params = self._filter_clause(start_date, end_date, transaction_type)
         with self.db as conn:
-            query = """
-                SELECT id, account_id, date, amount, description, category, transaction_type
+            cur = conn.execute(
+                f"""
+                SELECT day, SUM(amount_cents), COUNT(*)
                 FROM transactions
-                WHERE 1=1
-            """
-            params = []
-            
-            if start_date is not None:
-                query += " AND date >= ?"
-                params.append(start_date.isoformat())
-            
-            if end_date is not None:
-                query += " AND date <= ?"
-                params.append(end_date.isoformat())
-            
-            if transaction_type is not None:
-                query += " AND transaction_type = ?"
-                params.append(transaction_type.value)
-            
-            query += " ORDER BY date DESC, id DESC"
-            
-            cur = conn.execute(query, tuple(params))
+                {where}
+                GROUP BY day
+                ORDER BY day
+                """,
+                params,
+            )
             rows = cur.fetchall()
-        return [self._row_to_transaction(r) for r in rows]
+
+        # Grouping on the integer day walks the (.., day, amount_cents)
+        # indexes; folding the few hundred days into months is cheaper here
+        # than deriving a month string for every row in SQL
+        months: Dict[str, List[int]] = {}
+        for day, total_cents, count in rows:
+            month = day_to_date(day).strftime("%Y-%m")
+            totals = months.setdefault(month, [0, 0])
+            totals[0] += total_cents
+            totals[1] += count
+
+        return [(month, total_cents / 100, count) for month, (total_cents, count) in months.items()]
+
+    def _filtered_query(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        transaction_type: Optional[TransactionType],
+        columns: str = _COLUMNS,
+    ) -> Tuple[str, tuple]:
+        where, params = self._filter_clause(start_date, end_date, transaction_type)
+        query = f"""
+            SELECT {columns}
+            FROM transactions
+            {where}
+            ORDER BY day DESC, id DESC
+        """
+        return query, params
+
+    def _filter_clause(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        transaction_type: Optional[TransactionType],
+    ) -> Tuple[str, tuple]:
+        clause = "WHERE 1=1"
+        params = []
+        
+        if start_date is not None:
+            clause += " AND day >= ?"
+            params.append(to_day(start_date))
+        
+        if end_date is not None:
+            clause += " AND day <= ?"
+            params.append(to_day(end_date))
+        
+        if transaction_type is not None:
+            clause += " AND transaction_type = ?"
+            params.append(transaction_type.value)
+        
+        return clause, tuple(params)
 
     def update(self, transaction: Transaction) -> None:
         with self.db as conn:
             cur = conn.execute(
                 """
                 UPDATE transactions
-                SET account_id = ?, date = ?, amount = ?, description = ?, category = ?, transaction_type = ?
+                SET account_id = ?, day = ?, amount_cents = ?, description = ?, category = ?, transaction_type = ?
                 WHERE id = ?
                 """,
                 (
                     transaction.account_id,
-                    transaction.date.isoformat(),
-                    transaction.amount,
+                    to_day(transaction.date),
+                    to_cents(transaction.amount),
                     transaction.description,
                     transaction.category.value,
                     transaction.transaction_type.value,
@@ -120,33 +427,72 @@ class TransactionDAO:
             )
             if cur.rowcount == 0:
                 raise ValueError(f"Transaction with ID {transaction.id} not found")
+            bump_table_version(conn, "transactions")
+
+    def update_details(
+        self,
+        transaction_id: int,
+        description: str,
+        category: Category,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> Optional[Transaction]:
+        """Set description and category (and transaction_type unless None)
+        and return the updated transaction, or None if the id is unknown."""
+        with self.db as conn:
+            rows = conn.execute(
+                f"""
+                UPDATE transactions
+                SET description = ?, category = ?, transaction_type = COALESCE(?, transaction_type)
+                WHERE id = ?
+                RETURNING {_COLUMNS}
+                """,
+                (
+                    description,
+                    category.value,
+                    transaction_type.value if transaction_type is not None else None,
+                    transaction_id,
+                ),
+            ).fetchall()
+            if not rows:
+                return None
+            bump_table_version(conn, "transactions")
+
+        return decode_transaction(rows[0])
 
     def delete(self, transaction_id: int) -> None:
         with self.db as conn:
             cur = conn.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
             if cur.rowcount == 0:
                 raise ValueError(f"Transaction with ID {transaction_id} not found")
+            bump_table_version(conn, "transactions")
+
+    def existing_ids(self, transaction_ids: Iterable[int]) -> Set[int]:
+        """Return which of ``transaction_ids`` are already stored."""
+        ids = list(transaction_ids)
+        found: Set[int] = set()
+        with self.db as conn:
+            for start in range(0, len(ids), _ID_CHUNK_SIZE):
+                chunk = ids[start:start + _ID_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                cur = conn.execute(
+                    f"SELECT id FROM transactions WHERE id IN ({placeholders})",
+                    chunk,
+                )
+                found.update(r[0] for r in cur.fetchall())
+        return found
 
     def exists(self, transaction_id: int) -> bool:
         with self.db as conn:
             cur = conn.execute("SELECT 1 FROM transactions WHERE id = ?", (transaction_id,))
             return cur.fetchone() is not None
 
-    def _row_to_transaction(self, row) -> Transaction:
-        transaction_id = row["id"]
-        account_id = row["account_id"]
-        trx_date = date.fromisoformat(row["date"])
-        amount = row["amount"]
-        description = row["description"] or ""
-        category = Category(row["category"])
-        transaction_type = TransactionType(row["transaction_type"])
-
-        return Transaction(
-            transaction_id,
-            account_id,
-            trx_date,
-            amount,
-            description,
-            category,
-            transaction_type,
-        )
\ No newline at end of file
+    def _insert_params(self, transaction: Transaction) -> tuple:
+        return (
+            transaction.id,
+            transaction.account_id,
+            to_day(transaction.date),
+            to_cents(transaction.amount),
+            transaction.description,
+            transaction.category.value,
+            transaction.transaction_type.value,
+        )
@@ -9,4 +9,32 @@ class DuplicateIDException(FinanceManagerException):
 class NotFoundIDException(FinanceManagerException):
     def __init__(self, item_id):
         super().__init__(f"ID '{item_id}' doesn't exist in the system.")
-        self.item_id = item_id
\ No newline at end of file
+        self.item_id = item_id
+
+class PoolTimeoutException(FinanceManagerException):
+    def __init__(self, timeout):
+        super().__init__(f"No database connection became available within {timeout} seconds.")
+        self.timeout = timeout
+
+class AnalyticsBusyException(FinanceManagerException):
+    def __init__(self, max_pending):
+        super().__init__(f"Analytics queue is full ({max_pending} requests pending). Retry later.")
+        self.max_pending = max_pending
+
+class AnalyticsTimeoutException(FinanceManagerException):
+    def __init__(self, timeout):
+        super().__init__(f"Analytics computation did not finish within {timeout} seconds.")
+        self.timeout = timeout
+
+class JobQueueFullException(FinanceManagerException):
+    def __init__(self, max_pending):
+        super().__init__(f"Job queue is full ({max_pending} jobs pending). Retry later.")
+        self.max_pending = max_pending
+
+class SchemaOutOfDateException(FinanceManagerException):
+    def __init__(self, pending):
+        super().__init__(
+            f"Database schema is out of date ({len(pending)} pending migrations, first: "
+            f"{pending[0]}). Run 'python manage.py migrate' before starting the server."
+        )
+        self.pending = pending
@@ -0,0 +1,53 @@
+"""Gunicorn settings for production serving.
+
+    gunicorn -c gunicorn.conf.py "wsgi:create_app()"
+
+Every value can be overridden from the environment (PF_BIND, PF_WORKERS,
+PF_THREADS, PF_GRACEFUL_TIMEOUT, ...), or on the command line as usual.
+"""
+import multiprocessing
+
+from utils.env import env_int, env_str
+from wsgi import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_THREADS, close_app, migrate_database
+
+bind = env_str("BIND", f"{DEFAULT_HOST}:{DEFAULT_PORT}")
+
+# Processes x threads. SQLite in WAL mode serves concurrent readers from
+# every process; writes are serialized by SQLite itself.
+workers = env_int("WORKERS", min(multiprocessing.cpu_count() * 2 + 1, 8))
+worker_class = "gthread"
+threads = env_int("THREADS", DEFAULT_THREADS)
+
+# The app, and with it the AppState and connection pool, is created by
+# wsgi:create_app() inside each worker after the fork. Preloading would
+# open connections in the master and share them across processes.
+preload_app = False
+
+# On SIGTERM (and on HUP reloads) workers stop accepting connections and
+# get this long to finish the requests in progress
+graceful_timeout = env_int("GRACEFUL_TIMEOUT", 30)
+timeout = env_int("TIMEOUT", 60)
+keepalive = env_int("KEEPALIVE", 5)
+
+# Recycle workers now and then to bound memory growth
+max_requests = env_int("MAX_REQUESTS", 10000)
+max_requests_jitter = env_int("MAX_REQUESTS_JITTER", 1000)
+
+accesslog = env_str("ACCESS_LOG", "-")
+
+def on_starting(server):
+    # Once, in the master before any worker is forked; workers only check
+    # that the schema is current
+    applied = migrate_database()
+    for migration in applied:
+        server.log.info("Applied migration %04d_%s", migration.version, migration.name)
+
+def post_fork(server, worker):
+    server.log.info("Worker %s started; it builds its own AppState and connection pool", worker.pid)
+
+def worker_exit(server, worker):
+    # Runs after the worker has drained; close its SQLite connections
+    app = getattr(worker, "wsgi", None)
+    if app is not None:
+        close_app(app)
+        server.log.info("Worker %s closed its connection pool", worker.pid)
@@ -1,10 +1,18 @@
 from api import ApiConnection
 from app_state import AppState
+from utils import metrics
+from utils.env import env_bool, env_int, env_str
 
 def main():
-    app_state = AppState()
+    metrics.set_enabled(env_bool("METRICS", True))
+    app_state = AppState(db_path=env_str("DB_PATH"))
     api_connection = ApiConnection(app_state)
-    api_connection.run_app()
+    # Development server; PF_DEBUG=1 enables the reloader and debugger
+    api_connection.run_app(
+        debug=env_bool("DEBUG"),
+        host=env_str("HOST", "0.0.0.0"),
+        port=env_int("PORT", 5000),
+    )
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,120 @@
+import argparse
+import time
+from datetime import date
+
+from app_state import AppState
+from database import MigrationRunner
+from manager.transaction_manager import TransactionManager
+from manager.statement_importer import StatementImporter, IMPORT_BATCH_SIZE
+from manager.ledger_exporter import (
+    ACCOUNT_COLUMNS,
+    BUDGET_COLUMNS,
+    TRANSACTION_COLUMNS,
+    parquet_available,
+    write_csv,
+    write_parquet,
+)
+from utils.enums import TransactionType
+
+def migrate(app_state: AppState, args: argparse.Namespace) -> None:
+    # AppState has already applied the pending migrations
+    version = MigrationRunner(app_state.db).current_version()
+    print(f"Database schema is at version {version}")
+
+def rebuild_rollups(app_state: AppState, args: argparse.Namespace) -> None:
+    rows = app_state.monthly_totals_dao.rebuild()
+    print(f"Rebuilt monthly_totals: {rows} rows")
+
+def import_statement(app_state: AppState, args: argparse.Namespace) -> None:
+    transaction_manager = TransactionManager(app_state.transaction_dao, app_state.monthly_totals_dao)
+    importer = StatementImporter(transaction_manager, args.batch_size, args.date_format)
+    with open(args.path, newline="", encoding="utf-8-sig") as stream:
+        report = importer.import_csv(stream)
+
+    for line, error in report.errors:
+        print(f"line {line}: {error}")
+    print(
+        f"Imported {report.inserted} of {report.rows_read} rows "
+        f"({len(report.errors)} rejected) in {report.elapsed:.2f}s, "
+        f"{report.rows_per_second:.0f} rows/s"
+    )
+
+def export_table(app_state: AppState, args: argparse.Namespace) -> None:
+    if args.format == "parquet" and not parquet_available():
+        raise SystemExit("Parquet export requires the pyarrow package")
+
+    if args.table == "transactions":
+        columns = TRANSACTION_COLUMNS
+        row_batches = app_state.transaction_dao.iter_filtered_rows(
+            args.start_date, args.end_date, args.transaction_type
+        )
+    elif args.table == "accounts":
+        columns = ACCOUNT_COLUMNS
+        row_batches = app_state.account_dao.iter_rows()
+    else:
+        columns = BUDGET_COLUMNS
+        row_batches = app_state.budget_dao.iter_rows()
+
+    started = time.perf_counter()
+    if args.format == "parquet":
+        with open(args.path, "wb") as sink:
+            rows = write_parquet(columns, row_batches, sink)
+    else:
+        with open(args.path, "w", newline="", encoding="utf-8") as stream:
+            rows = write_csv(columns, row_batches, stream)
+    elapsed = time.perf_counter() - started
+    print(f"Exported {rows} {args.table} to {args.path} in {elapsed:.2f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Personal Finance Manager maintenance commands")
+    parser.add_argument("--db", help="Path to the SQLite database (defaults to personalfinance.db)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrator = subparsers.add_parser(
+        "migrate",
+        help="Apply pending schema migrations (run before starting a server with several workers)",
+    )
+    migrator.set_defaults(handler=migrate)
+
+    rebuild = subparsers.add_parser(
+        "rebuild-rollups",
+        help="Recompute the monthly_totals rollup from the transactions table",
+    )
+    rebuild.set_defaults(handler=rebuild_rollups)
+
+    importer = subparsers.add_parser(
+        "import",
+        help="Import transactions from a CSV bank statement",
+    )
+    importer.add_argument("path", help="CSV file with a header row")
+    importer.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE,
+                          help="Rows written per database transaction")
+    importer.add_argument("--date-format",
+                          help="strptime format of the date column (defaults to ISO YYYY-MM-DD)")
+    importer.set_defaults(handler=import_statement)
+
+    exporter = subparsers.add_parser(
+        "export",
+        help="Export transactions, accounts or budgets to CSV or Parquet",
+    )
+    exporter.add_argument("table", choices=["transactions", "accounts", "budgets"])
+    exporter.add_argument("path", help="Output file")
+    exporter.add_argument("--format", choices=["csv", "parquet"], default="csv",
+                          help="Parquet requires pyarrow")
+    exporter.add_argument("--start-date", type=date.fromisoformat,
+                          help="Transactions only: first date (YYYY-MM-DD)")
+    exporter.add_argument("--end-date", type=date.fromisoformat,
+                          help="Transactions only: last date (YYYY-MM-DD)")
+    exporter.add_argument("--transaction-type", type=TransactionType,
+                          help="Transactions only: Income or Expense")
+    exporter.set_defaults(handler=export_table)
+
+    args = parser.parse_args()
+    app_state = AppState(args.db)
+    try:
+        args.handler(app_state, args)
+    finally:
+        app_state.close()
+
+if __name__ == "__main__":
+    main()
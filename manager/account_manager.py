@@ -1,19 +1,21 @@
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 from model.account import Account
 from model.bank_account import BankAccount
 from model.savings_account import SavingsAccount
 from model.wallet_account import WalletAccount
 from exceptions.finance_manager_exception import (
-    DuplicateIDException,
     NotFoundIDException,
     FinanceManagerException,
 )
 from utils.enums import AccountType, Currency
 from database.account_dao import AccountDAO
+from utils.cache import LRUCache
 
 class AccountManager:
-    def __init__(self, account_dao: AccountDAO) -> None:
+    def __init__(self, account_dao: AccountDAO, cache: Optional[LRUCache] = None) -> None:
         self._account_dao = account_dao
+        # Read-through cache for get_account_by_id, invalidated on writes
+        self._cache = cache
 
     def create_account(
         self,
@@ -21,10 +23,9 @@ class AccountManager:
         name: str,
         account_type: str,
         currency: str,
-    ) -> None:
-        if self._account_dao.exists(account_id):
-            raise DuplicateIDException(account_id)
-        
+    ) -> Account:
+        """Create the account and return it as stored. The id check is left
+        to the primary key: the DAO raises DuplicateIDException."""
         if account_type == AccountType.BANK.value:
             account = BankAccount(account_id, name, Currency(currency))
         elif account_type == AccountType.SAVINGS.value:
@@ -35,27 +36,51 @@ class AccountManager:
             raise FinanceManagerException(
                 "Unsupported account type. Use 'CashAccount' or 'BankAccount'."
             )
-        self._account_dao.create(account)
+        return self._account_dao.create(account)
 
-    def modify_account(self, account_id: int, name: str) -> None:
-        account = self._account_dao.read(account_id)
+    def modify_account(self, account_id: int, name: str) -> Account:
+        account = self._account_dao.rename(account_id, name)
+        self._invalidate(account_id)
         if account is None:
             raise NotFoundIDException(account_id)
-
-        account.name = name
-        self._account_dao.update(account)
+        return account
 
     def delete_account(self, account_id: int) -> None:
         try:
             self._account_dao.delete(account_id)
         except ValueError:
             raise NotFoundIDException(account_id)
+        finally:
+            self._invalidate(account_id)
 
     def get_all_accounts(self) -> List[Account]:
         return self._account_dao.read_all()
 
+    def get_accounts_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+    ) -> Tuple[List[Account], Optional[int]]:
+        # Fetch one extra row to know whether another page exists
+        accounts = self._account_dao.read_page(limit + 1, after)
+        if len(accounts) <= limit:
+            return accounts, None
+
+        accounts = accounts[:limit]
+        return accounts, accounts[-1].id
+
+    def iter_account_rows(self) -> Iterator[list]:
+        return self._account_dao.iter_rows()
+
     def get_account_by_id(self, account_id: int) -> Account:
-        account = self._account_dao.read(account_id)
+        if self._cache is not None:
+            account = self._cache.get_or_load(account_id, lambda: self._account_dao.read(account_id))
+        else:
+            account = self._account_dao.read(account_id)
         if account is None:
             raise NotFoundIDException(account_id)
-        return account
\ No newline at end of file
+        return account
+
+    def _invalidate(self, account_id: int) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(account_id)
\ No newline at end of file
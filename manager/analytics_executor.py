@@ -0,0 +1,204 @@
+import functools
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from database.db_connection import DatabaseConnection
+from database.monthly_totals_dao import MonthlyTotalsDAO
+from database.transaction_dao import TransactionDAO
+from exceptions.finance_manager_exception import (
+    AnalyticsBusyException,
+    AnalyticsTimeoutException,
+)
+from manager.statistics_manager import DEFAULT_FORECAST_BACKEND
+from manager.transaction_manager import TransactionManager
+
+DEFAULT_ANALYTICS_WORKERS = 2
+DEFAULT_ANALYTICS_MAX_PENDING = 16
+DEFAULT_ANALYTICS_TIMEOUT = 30.0
+
+# TransactionManager methods a worker process may run
+ANALYTICS_METHODS = frozenset({
+    "get_amount_statistics",
+    "get_category_summary",
+    "get_monthly_forecast",
+})
+
+# Set in each worker process by _init_worker
+_worker_manager = None
+
+def _init_worker(db_path: Path, pragmas: Dict[str, Any], forecast_backend: str) -> None:
+    global _worker_manager
+    db = DatabaseConnection(db_path, pool_size=1, pragmas=pragmas)
+    _worker_manager = TransactionManager(
+        TransactionDAO(db),
+        MonthlyTotalsDAO(db),
+        forecast_backend=forecast_backend,
+    )
+
+def _run(method: str, kwargs: Dict[str, Any]) -> tuple:
+    # Wall-clock start, comparable with the submit time taken in the parent
+    started_at = time.time()
+    started = time.perf_counter()
+    result = getattr(_worker_manager, method)(**kwargs)
+    return result, started_at, time.perf_counter() - started
+
+class AnalyticsExecutor:
+    """Runs the TransactionManager analytics in a bounded pool of worker
+    processes, off the request threads and their GIL.
+
+    Each worker opens its own SQLite connection and runs the whole query and
+    computation, so only the filter arguments go in and only the finished
+    result comes back. Processes are spawned (not forked, which is unsafe
+    in a threaded server) on first use.
+
+    At most ``max_pending`` calls are queued or running; beyond that ``run``
+    raises AnalyticsBusyException at once. A caller waits up to ``timeout``
+    seconds and then gets AnalyticsTimeoutException. A call that has already
+    started cannot be stopped, so it keeps its slot until it finishes.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        pragmas: Optional[Dict[str, Any]] = None,
+        max_workers: int = DEFAULT_ANALYTICS_WORKERS,
+        max_pending: int = DEFAULT_ANALYTICS_MAX_PENDING,
+        timeout: float = DEFAULT_ANALYTICS_TIMEOUT,
+        forecast_backend: str = DEFAULT_FORECAST_BACKEND,
+    ) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be > 0")
+        if max_pending < max_workers:
+            raise ValueError("max_pending must be >= max_workers")
+
+        self._initargs = (Path(db_path), pragmas, forecast_backend)
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._timeout = timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+
+        # Counters
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._total_queue_wait = 0.0
+        self._max_queue_wait = 0.0
+        self._total_compute_time = 0.0
+        self._max_compute_time = 0.0
+
+    @classmethod
+    def for_database(cls, db: DatabaseConnection, **kwargs) -> "AnalyticsExecutor":
+        """Executor whose workers open the same database with the same pragmas."""
+        return cls(db.db_path, pragmas=db.pragmas, **kwargs)
+
+    def run(self, method: str, **kwargs) -> Any:
+        """Call ``TransactionManager.<method>(**kwargs)`` in a worker process
+        and return its result. Exceptions raised by the method are re-raised."""
+        if method not in ANALYTICS_METHODS:
+            raise ValueError(f"Unknown analytics method '{method}'")
+
+        future = self._submit(method, kwargs)
+        try:
+            result, _, _ = future.result(timeout=self._timeout)
+        except FutureTimeoutError:
+            # Only succeeds while the call is still queued
+            future.cancel()
+            with self._lock:
+                self._timeouts += 1
+            raise AnalyticsTimeoutException(self._timeout) from None
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            completed = self._completed
+            return {
+                "max_workers": self._max_workers,
+                "max_pending": self._max_pending,
+                "pending": self._pending,
+                "submitted": self._submitted,
+                "completed": completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+                "total_queue_wait": self._total_queue_wait,
+                "avg_queue_wait": self._total_queue_wait / completed if completed else 0.0,
+                "max_queue_wait": self._max_queue_wait,
+                "total_compute_time": self._total_compute_time,
+                "avg_compute_time": self._total_compute_time / completed if completed else 0.0,
+                "max_compute_time": self._max_compute_time,
+            }
+
+    def close(self) -> None:
+        """Stop accepting calls, drop queued ones and wait for running ones."""
+        with self._lock:
+            self._closed = True
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(self, method: str, kwargs: Dict[str, Any]) -> Future:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Analytics executor is closed")
+            if self._pending >= self._max_pending:
+                self._rejected += 1
+                raise AnalyticsBusyException(self._max_pending)
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=self._context,
+                    initializer=_init_worker,
+                    initargs=self._initargs,
+                )
+            pool = self._pool
+            self._pending += 1
+            self._submitted += 1
+
+        submitted_at = time.time()
+        try:
+            future = pool.submit(_run, method, kwargs)
+        except BrokenProcessPool:
+            self._discard_pool(pool)
+            with self._lock:
+                self._pending -= 1
+                self._failed += 1
+            raise
+        future.add_done_callback(functools.partial(self._on_done, pool, submitted_at))
+        return future
+
+    def _on_done(self, pool: ProcessPoolExecutor, submitted_at: float, future: Future) -> None:
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            # A worker died; the next call starts a fresh pool
+            self._discard_pool(pool)
+
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                self._failed += 1
+                return
+            _, started_at, compute_time = future.result()
+            queue_wait = max(0.0, started_at - submitted_at)
+            self._completed += 1
+            self._total_queue_wait += queue_wait
+            self._max_queue_wait = max(self._max_queue_wait, queue_wait)
+            self._total_compute_time += compute_time
+            self._max_compute_time = max(self._max_compute_time, compute_time)
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
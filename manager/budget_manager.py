@@ -1,16 +1,26 @@
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 
 from model.budget import Budget
-from utils.enums import Category
+from utils.enums import Category, TransactionType
 from exceptions.finance_manager_exception import (
-    DuplicateIDException,
     NotFoundIDException,
+    FinanceManagerException,
 )
 from database.budget_dao import BudgetDAO
+from database.monthly_totals_dao import MonthlyTotalsDAO
+from utils.cache import LRUCache
 
 class BudgetManager:
-    def __init__(self, budget_dao: BudgetDAO) -> None:
+    def __init__(
+        self,
+        budget_dao: BudgetDAO,
+        monthly_totals_dao: Optional[MonthlyTotalsDAO] = None,
+        cache: Optional[LRUCache] = None,
+    ) -> None:
         self._budget_dao = budget_dao
+        self._monthly_totals_dao = monthly_totals_dao
+        # Read-through cache for get_budget_by_id, invalidated on writes
+        self._cache = cache
 
     def create_budget(
         self,
@@ -18,36 +28,77 @@ class BudgetManager:
         month: str,
         category: Category,
         limit_amount: float,
-    ) -> None:
-        if self._budget_dao.exists(budget_id):
-            raise DuplicateIDException(budget_id)
-        
+    ) -> Budget:
+        """Create the budget and return it as stored. The DAO raises
+        DuplicateIDException if the id is taken."""
         budget = Budget(budget_id, month, category, limit_amount)
-        self._budget_dao.create(budget)
+        return self._budget_dao.create(budget)
 
     def modify_budget(
         self,
         budget_id: int,
         limit_amount: float,
-    ) -> None:
-        budget = self._budget_dao.read(budget_id)
+    ) -> Budget:
+        budget = self._budget_dao.update_limit(budget_id, limit_amount)
+        self._invalidate(budget_id)
         if budget is None:
             raise NotFoundIDException(budget_id)
-
-        budget.limit_amount = limit_amount
-        self._budget_dao.update(budget)
+        return budget
 
     def delete_budget(self, budget_id: int) -> None:
         try:
             self._budget_dao.delete(budget_id)
         except ValueError:
             raise NotFoundIDException(budget_id)
+        finally:
+            self._invalidate(budget_id)
 
     def get_all_budgets(self) -> List[Budget]:
         return self._budget_dao.read_all()
 
+    def get_budgets_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> Tuple[List[Budget], Optional[Tuple[str, int]]]:
+        # Fetch one extra row to know whether another page exists
+        budgets = self._budget_dao.read_page(limit + 1, after)
+        if len(budgets) <= limit:
+            return budgets, None
+
+        budgets = budgets[:limit]
+        last = budgets[-1]
+        return budgets, (last.month, last.id)
+
+    def iter_budget_rows(self) -> Iterator[list]:
+        return self._budget_dao.iter_rows()
+
     def get_budget_by_id(self, budget_id: int) -> Budget:
-        budget = self._budget_dao.read(budget_id)
+        if self._cache is not None:
+            budget = self._cache.get_or_load(budget_id, lambda: self._budget_dao.read(budget_id))
+        else:
+            budget = self._budget_dao.read(budget_id)
         if budget is None:
             raise NotFoundIDException(budget_id)
-        return budget
\ No newline at end of file
+        return budget
+
+    def get_budget_vs_actual(self, month: str) -> List[Tuple[Budget, float]]:
+        """Each budget of ``month`` (YYYY-MM) with the amount actually spent
+        (Expense transactions) in its category, read from the monthly rollup."""
+        if self._monthly_totals_dao is None:
+            raise FinanceManagerException("Budget comparison requires the monthly totals rollup.")
+
+        spent = {
+            category: total
+            for category, _, total, _ in self._monthly_totals_dao.sum_by_category_and_type(
+                month, month, TransactionType.EXPENSE
+            )
+        }
+        return [
+            (budget, spent.get(budget.category, 0.0))
+            for budget in self._budget_dao.read_by_month(month)
+        ]
+
+    def _invalidate(self, budget_id: int) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(budget_id)
\ No newline at end of file
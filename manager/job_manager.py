@@ -0,0 +1,300 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence
+
+from model.job import Job
+from utils.enums import JobKind, JobStatus, TransactionType
+from exceptions.finance_manager_exception import (
+    JobQueueFullException,
+    NotFoundIDException,
+)
+from database.job_dao import JobDAO
+from manager.transaction_manager import TransactionManager
+from manager.ledger_exporter import (
+    TRANSACTION_COLUMNS,
+    parquet_available,
+    write_csv,
+    write_parquet,
+)
+
+DEFAULT_JOB_WORKERS = 2
+DEFAULT_JOB_MAX_PENDING = 64
+# Seconds an export file is kept for download before it is deleted
+DEFAULT_JOB_EXPORT_RETENTION = 24 * 60 * 60
+JOB_EXPORT_FORMATS = ("csv", "parquet")
+JOB_EXPORT_PATTERN = "job-*-transactions.*"
+
+# Minimum seconds between two progress writes of a running export
+PROGRESS_INTERVAL = 0.5
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if pid is None:
+        return False
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        # os.kill would terminate the process; waitress runs a single
+        # process, so any other owner is a previous run
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def default_export_dir(db_path: Path) -> Path:
+    """Export files of the database at ``db_path``: next to it, so servers
+    on different databases never share (or serve each other's) job files."""
+    return db_path.parent / f"{db_path.stem}-jobs"
+
+def _parse_date(params: Mapping[str, Any], name: str) -> Optional[date]:
+    value = params.get(name)
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f'Invalid {name} format. Expected ISO format (YYYY-MM-DD): {str(e)}')
+
+def _parse_transaction_type(params: Mapping[str, Any], required: bool = False) -> Optional[TransactionType]:
+    value = params.get("transaction_type")
+    if value is None:
+        if required:
+            raise ValueError("transaction_type is required. Valid types: Income, Expense")
+        return None
+    try:
+        return TransactionType(value)
+    except ValueError:
+        raise ValueError(f"Invalid transaction_type. Valid types: {[t.value for t in TransactionType]}")
+
+class JobManager:
+    """Runs long reports (statistics, category summary, forecast, export)
+    outside the request that asked for them.
+
+    Jobs are recorded in the ``jobs`` table and executed by a bounded thread
+    pool, so clients poll for the result instead of holding a request open.
+    Any server process can answer a poll; only the submitting process runs
+    the job. At most ``max_pending`` of this process's jobs are queued or
+    running; beyond that submit_job raises JobQueueFullException.
+
+    Export files are written to ``export_dir`` (by default next to the
+    database, see default_export_dir) and deleted ``export_retention``
+    seconds after they were written; cleanup runs at startup and after
+    every export.
+    """
+
+    def __init__(
+        self,
+        job_dao: JobDAO,
+        transaction_manager: TransactionManager,
+        max_workers: int = DEFAULT_JOB_WORKERS,
+        max_pending: int = DEFAULT_JOB_MAX_PENDING,
+        export_dir: Optional[Path] = None,
+        export_retention: float = DEFAULT_JOB_EXPORT_RETENTION,
+    ) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be > 0")
+
+        self._job_dao = job_dao
+        self._transaction_manager = transaction_manager
+        self._max_pending = max_pending
+        self._export_dir = Path(export_dir) if export_dir is not None else default_export_dir(job_dao.db.db_path)
+        self._export_retention = export_retention
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closing = False
+
+        # Jobs of a process that died (crash, kill after the graceful timeout)
+        # would otherwise stay queued or running forever
+        self._job_dao.fail_orphaned(_pid_alive, "Interrupted: the server process running this job stopped")
+        self.remove_expired_exports()
+
+    def submit_job(self, kind: JobKind, params: Mapping[str, Any]) -> Job:
+        """Validate the parameters, record the job as queued and schedule it.
+        Raises ValueError with a client-facing message for bad parameters."""
+        params = self._normalize_params(kind, params)
+
+        with self._lock:
+            if self._closing:
+                raise RuntimeError("Job manager is closed")
+            if self._pending >= self._max_pending:
+                raise JobQueueFullException(self._max_pending)
+            self._pending += 1
+
+        try:
+            job = self._job_dao.create(kind, params, os.getpid())
+            self._executor.submit(self._run, job)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        return job
+
+    def get_job(self, job_id: int) -> Job:
+        job = self._job_dao.read(job_id)
+        if job is None:
+            raise NotFoundIDException(job_id)
+        return job
+
+    def get_export_path(self, job_id: int) -> Path:
+        """Path of a finished export job's file. Raises NotFoundIDException
+        for unknown jobs and ValueError if the job has no file (yet)."""
+        job = self.get_job(job_id)
+        if job.kind is not JobKind.EXPORT:
+            raise ValueError(f"Job {job_id} is not an export job")
+        if job.status is not JobStatus.SUCCEEDED:
+            raise ValueError(f"Job {job_id} has not succeeded (status: {job.status.value})")
+        path = self._export_dir / job.result["file"]
+        if not path.is_file():
+            raise ValueError(f"The file of job {job_id} is no longer available")
+        return path
+
+    def remove_expired_exports(self) -> int:
+        """Delete the export files older than the retention period and
+        return how many were removed. Their jobs stay; downloading them
+        answers that the file is no longer available."""
+        cutoff = time.time() - self._export_retention
+        removed = 0
+        for path in self._export_dir.glob(JOB_EXPORT_PATTERN):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                # Removed by another server process at the same time
+                pass
+        return removed
+
+    def close(self) -> None:
+        """Fail the queued jobs and wait for the running ones to finish."""
+        with self._lock:
+            self._closing = True
+        self._executor.shutdown(wait=True)
+
+    def _run(self, job: Job) -> None:
+        try:
+            if self._closing:
+                self._job_dao.mark_failed(job.id, "Server shut down before the job started")
+                return
+            if not self._job_dao.mark_running(job.id):
+                return
+            result = self._execute(job)
+            self._job_dao.mark_succeeded(job.id, result)
+        except Exception as e:
+            self._job_dao.mark_failed(job.id, str(e) or type(e).__name__)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _execute(self, job: Job) -> Dict[str, Any]:
+        params = job.params
+        start_date = _parse_date(params, "start_date")
+        end_date = _parse_date(params, "end_date")
+        transaction_type = _parse_transaction_type(params)
+
+        if job.kind is JobKind.STATISTICS:
+            statistics = self._transaction_manager.get_amount_statistics(start_date, end_date, transaction_type)
+            return {"statistics": statistics, "transaction_count": statistics["count"]}
+
+        if job.kind is JobKind.CATEGORY_SUMMARY:
+            category_summary, transaction_count = self._transaction_manager.get_category_summary(start_date, end_date)
+            return {"category_summary": category_summary, "transaction_count": transaction_count}
+
+        if job.kind is JobKind.FORECAST:
+            forecast, transaction_count = self._transaction_manager.get_monthly_forecast(
+                transaction_type,
+                params["months_to_predict"],
+                start_date,
+                end_date,
+            )
+            return {"forecast": forecast, "transaction_count": transaction_count}
+
+        return self._export(job.id, params["format"], start_date, end_date, transaction_type)
+
+    def _export(
+        self,
+        job_id: int,
+        export_format: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        transaction_type: Optional[TransactionType],
+    ) -> Dict[str, Any]:
+        # Keyset pages rather than one streaming cursor: the cursor would keep
+        # this thread's connection checked out, so the progress updates would
+        # join its transaction and hold the write lock until the export ends
+        total = self._transaction_manager.count_filtered_transactions(start_date, end_date, transaction_type)
+        row_batches = self._reporting_progress(
+            job_id,
+            total,
+            self._transaction_manager.iter_filtered_transaction_pages(start_date, end_date, transaction_type),
+        )
+
+        self._export_dir.mkdir(parents=True, exist_ok=True)
+        file_name = f"job-{job_id}-transactions.{export_format}"
+        path = self._export_dir / file_name
+        try:
+            if export_format == "parquet":
+                with open(path, "wb") as sink:
+                    rows = write_parquet(TRANSACTION_COLUMNS, row_batches, sink)
+            else:
+                with open(path, "w", newline="", encoding="utf-8") as stream:
+                    rows = write_csv(TRANSACTION_COLUMNS, row_batches, stream)
+        except BaseException:
+            # The job fails; a partial file would never be downloaded
+            path.unlink(missing_ok=True)
+            raise
+        self.remove_expired_exports()
+        return {"file": file_name, "format": export_format, "rows": rows}
+
+    def _reporting_progress(self, job_id: int, total: int, row_batches: Iterable[Sequence]) -> Iterator[Sequence]:
+        done = 0
+        reported_at = time.monotonic()
+        for rows in row_batches:
+            yield rows
+            done += len(rows)
+            now = time.monotonic()
+            if total and now - reported_at >= PROGRESS_INTERVAL:
+                self._job_dao.update_progress(job_id, min(done / total, 0.99))
+                reported_at = now
+
+    @staticmethod
+    def _normalize_params(kind: JobKind, params: Mapping[str, Any]) -> Dict[str, Any]:
+        # Parse everything now so a bad request is rejected with 400 instead
+        # of becoming a failed job; keep the JSON-friendly originals
+        if not isinstance(params, Mapping):
+            raise ValueError("params must be a JSON object")
+
+        start_date = _parse_date(params, "start_date")
+        end_date = _parse_date(params, "end_date")
+        if start_date is not None and end_date is not None and start_date > end_date:
+            raise ValueError("start_date must be before or equal to end_date")
+        transaction_type = _parse_transaction_type(params, required=kind is JobKind.FORECAST)
+
+        normalized: Dict[str, Any] = {
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None,
+            "transaction_type": transaction_type.value if transaction_type else None,
+        }
+
+        if kind is JobKind.FORECAST:
+            months_to_predict = params.get("months_to_predict")
+            if isinstance(months_to_predict, bool) or not isinstance(months_to_predict, int) or months_to_predict <= 0:
+                raise ValueError("months_to_predict is required and must be a positive integer")
+            normalized["months_to_predict"] = months_to_predict
+
+        if kind is JobKind.EXPORT:
+            export_format = params.get("format", "csv")
+            if export_format not in JOB_EXPORT_FORMATS:
+                raise ValueError(f"Invalid format. Valid formats: {list(JOB_EXPORT_FORMATS)}")
+            if export_format == "parquet" and not parquet_available():
+                raise ValueError("Parquet export is not available: the pyarrow package is not installed")
+            normalized["format"] = export_format
+
+        return normalized
@@ -0,0 +1,91 @@
+import csv
+import io
+from typing import BinaryIO, Iterable, Iterator, List, Sequence, TextIO
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional
+    pa = None
+    pq = None
+
+# Column order of the exported files; matches transform_to_csv() on the
+# models and the SELECT order of the DAO row iterators.
+TRANSACTION_COLUMNS = ("id", "account_id", "date", "amount", "description", "category", "transaction_type")
+ACCOUNT_COLUMNS = ("id", "name", "account_type", "currency")
+BUDGET_COLUMNS = ("id", "month", "category", "limit_amount")
+
+# Rows buffered per Parquet row group
+PARQUET_ROW_GROUP_SIZE = 65536
+
+def parquet_available() -> bool:
+    return pq is not None
+
+def csv_chunks(columns: Sequence[str], row_batches: Iterable[Sequence]) -> Iterator[str]:
+    """Render the header and then one CSV text chunk per fetched batch of rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    yield buffer.getvalue()
+
+    for rows in row_batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue()
+
+def write_csv(columns: Sequence[str], row_batches: Iterable[Sequence], stream: TextIO) -> int:
+    """Write the rows as CSV to ``stream``. Returns the number of data rows."""
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(columns)
+    count = 0
+    for rows in row_batches:
+        writer.writerows(rows)
+        count += len(rows)
+    return count
+
+def _parquet_schema(columns: Sequence[str]):
+    types = {
+        "id": pa.int64(),
+        "account_id": pa.int64(),
+        "amount": pa.float64(),
+        "limit_amount": pa.float64(),
+    }
+    return pa.schema([(name, types.get(name, pa.string())) for name in columns])
+
+def write_parquet(
+    columns: Sequence[str],
+    row_batches: Iterable[Sequence],
+    sink: BinaryIO,
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+) -> int:
+    """Write the rows as Parquet to ``sink``, one row group every
+    ``row_group_size`` rows. Returns the number of data rows.
+
+    Requires pyarrow; check parquet_available() first.
+    """
+    if pq is None:
+        raise RuntimeError("Parquet export requires the optional pyarrow package")
+
+    schema = _parquet_schema(columns)
+    buffered: List[Sequence] = []
+    count = 0
+
+    def flush() -> None:
+        table = pa.Table.from_pydict(
+            {name: [row[index] for row in buffered] for index, name in enumerate(columns)},
+            schema=schema,
+        )
+        writer.write_table(table, row_group_size=row_group_size)
+        buffered.clear()
+
+    with pq.ParquetWriter(sink, schema) as writer:
+        for rows in row_batches:
+            buffered.extend(rows)
+            count += len(rows)
+            if len(buffered) >= row_group_size:
+                flush()
+        if buffered:
+            flush()
+
+    return count
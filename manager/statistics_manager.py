@@ -1,123 +1,204 @@
-import pandas as pd
-from typing import List, Dict, Any
-from model.transaction import Transaction
-from sklearn.linear_model import LinearRegression
-from utils.enums import TransactionType
-
-def transaction_amount_statistics(transactions: List[Transaction]) -> Dict[str, Any]:
-
-    data = [
-        {
-            "date": t.date,
-            "amount": t.amount,
-            "category": t.category.name,
-            "transaction_type": t.transaction_type.name,
-        }
-        for t in transactions
-    ]
-
-    df = pd.DataFrame(data)
-
-    stats = df["amount"].describe()
+import math
+import numpy as np
+from statistics import NormalDist
+from typing import Callable, List, Dict, Any, Iterable, Mapping, NamedTuple, Optional, Tuple
+from utils.enums import Category, TransactionType
+from utils.metrics import ANALYTICS_STEP_DURATION
+
+# Forecast fitting backends: "numpy" is the built-in closed-form fit;
+# "sklearn" fits with scikit-learn's LinearRegression, imported on first use
+FORECAST_BACKENDS = ("numpy", "sklearn")
+DEFAULT_FORECAST_BACKEND = "numpy"
+# Coverage of the prediction interval reported with each forecast month
+PREDICTION_INTERVAL = 0.95
+
+_EMPTY_STATISTICS = {
+    "count": 0,
+    "mean": None,
+    "median": None,
+    "std": None,
+    "min": None,
+    "max": None,
+}
+
+@ANALYTICS_STEP_DURATION.time("amount_statistics_from_aggregates")
+def amount_statistics_from_aggregates(aggregates: Mapping[str, Any]) -> Dict[str, Any]:
+    """Count, mean, median, sample std, min and max of the amounts, derived
+    from the SQL aggregates returned by TransactionDAO.aggregate_amounts."""
+
+    count = int(aggregates["count"])
+    if count == 0:
+        return dict(_EMPTY_STATISTICS)
+
+    total = float(aggregates["sum"])
+    mean = total / count
+
+    # Sample standard deviation (ddof=1), as pandas' describe() reports it
+    std = None
+    if count > 1:
+        variance = float(aggregates["m2"]) / (count - 1)
+        std = math.sqrt(max(variance, 0.0))
 
     return {
-        "count": int(stats["count"]),
-        "mean": float(stats["mean"]),
-        "median": float(stats["50%"]),
-        "std": float(stats["std"]),
-        "min": float(stats["min"]),
-        "max": float(stats["max"]),
+        "count": count,
+        "mean": mean,
+        "median": float(aggregates["median"]),
+        "std": std,
+        "min": float(aggregates["min"]),
+        "max": float(aggregates["max"]),
     }
 
-def transaction_category_summary(
-    transactions: List[Transaction],
+@ANALYTICS_STEP_DURATION.time("category_summary_from_totals")
+def category_summary_from_totals(
+    totals: Iterable[Tuple[Category, TransactionType, float, int]],
 ) -> Dict[str, Dict[str, float]]:
-
-    data = [
-        {
-            "category": t.category.name,
-            "transaction_type": t.transaction_type.name,
-            "amount": t.amount,
-        }
-        for t in transactions
-    ]
-
-    df = pd.DataFrame(data)
-
-    grouped = (
-        df
-        .groupby(["category", "transaction_type"])["amount"]
-        .sum()
-        .unstack(fill_value=0)
-    )
+    """Income/Expense totals per category name (sorted), built from the
+    (category, transaction_type, total, count) rows of
+    TransactionDAO.sum_by_category_and_type."""
 
     result: Dict[str, Dict[str, float]] = {}
 
-    for category, row in grouped.iterrows():
-        result[category] = {
-            "Income": float(row.get("INCOME", 0)),
-            "Expense": float(row.get("EXPENSE", 0)),
-        }
+    for category, transaction_type, total, _ in totals:
+        entry = result.setdefault(category.name, {"Income": 0.0, "Expense": 0.0})
+        entry[transaction_type.value] += float(total)
+
+    return {category: result[category] for category in sorted(result)}
+
+class LinearFit(NamedTuple):
+    """Least-squares line through (0, y[0]), (1, y[1]), ... plus what the
+    prediction interval needs. ``residual_std`` is None below 3 points."""
+    slope: float
+    intercept: float
+    n: int
+    x_mean: float
+    sxx: float
+    residual_std: Optional[float]
+
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        return self.intercept + self.slope * x
+
+    def interval_half_width(self, x: np.ndarray, coverage: float = PREDICTION_INTERVAL) -> Optional[np.ndarray]:
+        """Half-width of the prediction interval for new observations at x."""
+        if self.residual_std is None:
+            return None
+        t = _t_quantile(0.5 + coverage / 2, self.n - 2)
+        leverage = 1 / self.n + (x - self.x_mean) ** 2 / self.sxx
+        return t * self.residual_std * np.sqrt(1 + leverage)
+
+def fit_linear(y: np.ndarray) -> LinearFit:
+    """Closed-form ordinary least squares of y against 0..n-1."""
+    n = len(y)
+    x = np.arange(n, dtype=float)
+    x_mean = (n - 1) / 2
+    y_mean = float(y.mean())
+    sxx = n * (n * n - 1) / 12
+
+    # A single point has no slope; the line is flat through it
+    slope = float(np.dot(x - x_mean, y - y_mean) / sxx) if n > 1 else 0.0
+    intercept = y_mean - slope * x_mean
+    return LinearFit(slope, intercept, n, x_mean, sxx, _residual_std(x, y, slope, intercept))
+
+def fit_linear_sklearn(y: np.ndarray) -> LinearFit:
+    """Same fit through scikit-learn's LinearRegression."""
+    try:
+        from sklearn.linear_model import LinearRegression
+    except ImportError as e:
+        raise RuntimeError("The sklearn forecast backend requires the optional scikit-learn package") from e
+
+    n = len(y)
+    x = np.arange(n, dtype=float)
+    model = LinearRegression().fit(x.reshape(-1, 1), y)
+    slope = float(model.coef_[0])
+    intercept = float(model.intercept_)
+    sxx = n * (n * n - 1) / 12
+    return LinearFit(slope, intercept, n, (n - 1) / 2, sxx, _residual_std(x, y, slope, intercept))
+
+_FITTERS: Dict[str, Callable[[np.ndarray], LinearFit]] = {
+    "numpy": fit_linear,
+    "sklearn": fit_linear_sklearn,
+}
+
+def _residual_std(x: np.ndarray, y: np.ndarray, slope: float, intercept: float) -> Optional[float]:
+    if len(y) < 3:
+        return None
+    residuals = y - (intercept + slope * x)
+    return math.sqrt(float(np.dot(residuals, residuals)) / (len(y) - 2))
+
+def _t_quantile(p: float, df: int) -> float:
+    """Quantile of Student's t distribution, without scipy: exact for 1 and
+    2 degrees of freedom, Cornish-Fisher expansion around the normal
+    quantile above (relative error below 0.2% at 3, shrinking quickly)."""
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) * math.sqrt(2 / (4 * p * (1 - p)))
+
+    z = NormalDist().inv_cdf(p)
+    z2 = z * z
+    return z + (
+        z * (z2 + 1) / (4 * df)
+        + z * ((5 * z2 + 16) * z2 + 3) / (96 * df ** 2)
+        + z * (((3 * z2 + 19) * z2 + 17) * z2 - 15) / (384 * df ** 3)
+        + z * ((((79 * z2 + 776) * z2 + 1482) * z2 - 1920) * z2 - 945) / (92160 * df ** 4)
+    )
 
-    return result
+def _add_months(month: str, count: int) -> str:
+    year, month_number = map(int, month.split("-"))
+    index = year * 12 + month_number - 1 + count
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
 
-def monthly_amount_forecast_linear(
-    transactions: List[Transaction],
+@ANALYTICS_STEP_DURATION.time("monthly_forecast_from_totals")
+def monthly_forecast_from_totals(
+    monthly_totals: List[Tuple[str, float]],
     transaction_type: TransactionType,
     months_to_predict: int,
+    backend: str = DEFAULT_FORECAST_BACKEND,
 ) -> Dict[str, Any]:
+    """Linear forecast from pre-aggregated ("YYYY-MM", total) pairs sorted by
+    month, e.g. read from the monthly_totals rollup.
+
+    Each forecast month carries the bounds of its PREDICTION_INTERVAL
+    prediction interval (None when fewer than 3 months of history).
+    """
 
     if months_to_predict <= 0:
         raise ValueError("months_to_predict must be > 0")
 
-    if not transactions:
-        return {"history": [], "forecast": []}
+    fitter = _FITTERS.get(backend)
+    if fitter is None:
+        raise ValueError(f"Unknown forecast backend '{backend}'. Valid backends: {list(FORECAST_BACKENDS)}")
 
-    df = pd.DataFrame(
-        [{"date": t.date, "amount": float(t.amount)} for t in transactions]
-    )
-    df["date"] = pd.to_datetime(df["date"])
-
-    # Aggregate monthly totals
-    monthly = (
-        df.assign(month=df["date"].dt.to_period("M"))
-          .groupby("month", as_index=False)["amount"]
-          .sum()
-          .sort_values("month")
-          .reset_index(drop=True)
-    )
+    if not monthly_totals:
+        return {"history": [], "forecast": []}
 
     # Dynamic labels
     base_label = transaction_type.value.lower()
     predicted_label = f"predicted_{base_label}"
 
     history = [
-        {"month": str(row["month"]), base_label: float(row["amount"])}
-        for _, row in monthly.iterrows()
+        {"month": month, base_label: float(amount)}
+        for month, amount in monthly_totals
     ]
 
-    # Regression
-    X = pd.Series(range(len(monthly))).to_numpy().reshape(-1, 1)
-    y = monthly["amount"].to_numpy()
-
-    model = LinearRegression()
-    model.fit(X, y)
+    # Regression on the month index
+    fit = fitter(np.array([amount for _, amount in monthly_totals], dtype=float))
 
-    X_future = pd.Series(
-        range(len(monthly), len(monthly) + months_to_predict)
-    ).to_numpy().reshape(-1, 1)
+    x_future = np.arange(len(monthly_totals), len(monthly_totals) + months_to_predict, dtype=float)
+    y_pred = fit.predict(x_future)
+    half_width = fit.interval_half_width(x_future)
 
-    y_pred = model.predict(X_future)
-
-    last_month = monthly.loc[len(monthly) - 1, "month"]
-    future_months = [str(last_month + i) for i in range(1, months_to_predict + 1)]
-
-    forecast = [
-        {"month": future_months[i], predicted_label: float(y_pred[i])}
-        for i in range(months_to_predict)
-    ]
+    last_month = monthly_totals[-1][0]
+    forecast = []
+    for i in range(months_to_predict):
+        predicted = float(y_pred[i])
+        forecast.append({
+            "month": _add_months(last_month, i + 1),
+            predicted_label: predicted,
+            f"{predicted_label}_lower": predicted - float(half_width[i]) if half_width is not None else None,
+            f"{predicted_label}_upper": predicted + float(half_width[i]) if half_width is not None else None,
+        })
 
     return {
         "history": history,
         "forecast": forecast
-    }
\ No newline at end of file
+    }
@@ -1,5 +1,5 @@
-from typing import List, Optional
-from datetime import date
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+from datetime import date, timedelta
 
 from model.transaction import Transaction
 from utils.enums import Category, TransactionType
@@ -7,11 +7,66 @@ from exceptions.finance_manager_exception import (
     DuplicateIDException,
     NotFoundIDException,
 )
-from database.transaction_dao import TransactionDAO
+from database.transaction_dao import TransactionDAO, DEFAULT_BATCH_SIZE
+from database.monthly_totals_dao import MonthlyTotalsDAO
+from database.table_version_dao import TableVersionDAO
+from utils.cache import LRUCache
+from manager.statistics_manager import (
+    DEFAULT_FORECAST_BACKEND,
+    FORECAST_BACKENDS,
+    amount_statistics_from_aggregates,
+    category_summary_from_totals,
+    monthly_forecast_from_totals,
+)
+
+if TYPE_CHECKING:
+    from manager.analytics_executor import AnalyticsExecutor
+
+def whole_month_range(
+    start_date: Optional[date],
+    end_date: Optional[date],
+) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """Return the inclusive (YYYY-MM, YYYY-MM) month range covered by the
+    dates when they fall on whole months (start on the 1st, end on a month's
+    last day; open ends allowed), else None."""
+    if start_date is not None and start_date.day != 1:
+        return None
+    if end_date is not None and (end_date + timedelta(days=1)).day != 1:
+        return None
+    return (
+        start_date.isoformat()[:7] if start_date is not None else None,
+        end_date.isoformat()[:7] if end_date is not None else None,
+    )
 
 class TransactionManager:
-    def __init__(self, transaction_dao: TransactionDAO) -> None:
+    def __init__(
+        self,
+        transaction_dao: TransactionDAO,
+        monthly_totals_dao: Optional[MonthlyTotalsDAO] = None,
+        cache: Optional[LRUCache] = None,
+        result_cache: Optional[LRUCache] = None,
+        table_version_dao: Optional[TableVersionDAO] = None,
+        forecast_backend: str = DEFAULT_FORECAST_BACKEND,
+        analytics_executor: Optional["AnalyticsExecutor"] = None,
+    ) -> None:
+        if forecast_backend not in FORECAST_BACKENDS:
+            raise ValueError(f"Unknown forecast backend '{forecast_backend}'. Valid backends: {list(FORECAST_BACKENDS)}")
+
         self._transaction_dao = transaction_dao
+        self._monthly_totals_dao = monthly_totals_dao
+        # Read-through cache for get_transaction_by_id, invalidated on writes
+        self._cache = cache
+        # Analytics results keyed by (transactions version, query, filter).
+        # Every write bumps the persisted version, in this process or any
+        # other, so stale results are never looked up again and simply age
+        # out of the LRU. Caching needs both the cache and the version DAO.
+        self._result_cache = result_cache
+        self._table_version_dao = table_version_dao
+        # Fitting backend of get_monthly_forecast (see statistics_manager)
+        self._forecast_backend = forecast_backend
+        # When set, cache misses of the analytics methods are computed in its
+        # worker processes (each running its own executor-less manager)
+        self._analytics_executor = analytics_executor
 
     def create_transaction(
         self,
@@ -22,10 +77,9 @@ class TransactionManager:
         description: str,
         category: Category,
         transaction_type: TransactionType,
-    ) -> None:
-        if self._transaction_dao.exists(transaction_id):
-            raise DuplicateIDException(transaction_id)
-        
+    ) -> Transaction:
+        """Create the transaction and return it as stored. The DAO raises
+        DuplicateIDException if the id is taken."""
         transaction = Transaction(
             transaction_id,
             account_id,
@@ -35,7 +89,37 @@ class TransactionManager:
             category,
             transaction_type,
         )
-        self._transaction_dao.create(transaction)
+        return self._transaction_dao.create(transaction)
+
+    def create_transactions_bulk(
+        self,
+        transactions: List[Transaction],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Tuple[int, str]]:
+        """Insert many transactions in one SQL transaction.
+
+        IDs already stored or repeated in the payload are rejected up front
+        with one bulk lookup. Returns (position in ``transactions``, error)
+        for every row that was not inserted; all other rows are committed.
+        """
+        existing = self._transaction_dao.existing_ids(t.id for t in transactions)
+        errors: List[Tuple[int, str]] = []
+        accepted: List[Transaction] = []
+        positions: List[int] = []
+        seen = set()
+
+        for position, transaction in enumerate(transactions):
+            if transaction.id in existing or transaction.id in seen:
+                errors.append((position, str(DuplicateIDException(transaction.id))))
+                continue
+            seen.add(transaction.id)
+            accepted.append(transaction)
+            positions.append(position)
+
+        failures = self._transaction_dao.create_many(accepted, batch_size)
+        errors.extend((positions[index], error) for index, error in failures)
+        errors.sort()
+        return errors
 
     def modify_transaction(
         self,
@@ -43,28 +127,47 @@ class TransactionManager:
         description: str,
         category: Category,
         transaction_type: Optional[TransactionType],
-    ) -> None:
-        transaction = self._transaction_dao.read(transaction_id)
+    ) -> Transaction:
+        transaction = self._transaction_dao.update_details(
+            transaction_id, description, category, transaction_type
+        )
+        self._invalidate(transaction_id)
         if transaction is None:
             raise NotFoundIDException(transaction_id)
-
-        transaction.description = description
-        if transaction_type is not None:
-            transaction.transaction_type = transaction_type
-        transaction.category = category
-        self._transaction_dao.update(transaction)
+        return transaction
 
     def delete_transaction(self, transaction_id: int) -> None:
         try:
             self._transaction_dao.delete(transaction_id)
         except ValueError:
             raise NotFoundIDException(transaction_id)
+        finally:
+            self._invalidate(transaction_id)
 
     def get_all_transactions(self) -> List[Transaction]:
         return self._transaction_dao.read_all()
 
+    def get_transactions_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+    ) -> Tuple[List[Transaction], Optional[Tuple[date, int]]]:
+        # Fetch one extra row to know whether another page exists
+        transactions = self._transaction_dao.read_page(limit + 1, after)
+        if len(transactions) <= limit:
+            return transactions, None
+
+        transactions = transactions[:limit]
+        last = transactions[-1]
+        return transactions, (last.date, last.id)
+
     def get_transaction_by_id(self, transaction_id: int) -> Transaction:
-        transaction = self._transaction_dao.read(transaction_id)
+        if self._cache is not None:
+            transaction = self._cache.get_or_load(
+                transaction_id, lambda: self._transaction_dao.read(transaction_id)
+            )
+        else:
+            transaction = self._transaction_dao.read(transaction_id)
         if transaction is None:
             raise NotFoundIDException(transaction_id)
         return transaction
@@ -75,4 +178,122 @@ class TransactionManager:
         end_date: Optional[date] = None,
         transaction_type: Optional[TransactionType] = None,
     ) -> List[Transaction]:
-        return self._transaction_dao.read_filtered(start_date, end_date, transaction_type)
\ No newline at end of file
+        return self._transaction_dao.read_filtered(start_date, end_date, transaction_type)
+
+    def iter_filtered_transaction_pages(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> Iterator[list]:
+        return self._transaction_dao.iter_filtered_pages(start_date, end_date, transaction_type)
+
+    def count_filtered_transactions(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> int:
+        return self._transaction_dao.count_filtered(start_date, end_date, transaction_type)
+
+    def get_amount_statistics(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> Dict[str, Any]:
+        def compute() -> Dict[str, Any]:
+            aggregates = self._transaction_dao.aggregate_amounts(start_date, end_date, transaction_type)
+            return amount_statistics_from_aggregates(aggregates)
+
+        return self._cached_result(
+            ("statistics", start_date, end_date, transaction_type),
+            self._offloaded(
+                "get_amount_statistics",
+                compute,
+                start_date=start_date,
+                end_date=end_date,
+                transaction_type=transaction_type,
+            ),
+        )
+
+    def get_category_summary(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[Dict[str, Dict[str, float]], int]:
+        """Per-category Income/Expense totals and the number of transactions
+        they cover, grouped in SQL."""
+        def compute() -> Tuple[Dict[str, Dict[str, float]], int]:
+            months = whole_month_range(start_date, end_date)
+            if months is not None and self._monthly_totals_dao is not None:
+                totals = self._monthly_totals_dao.sum_by_category_and_type(*months)
+            else:
+                totals = self._transaction_dao.sum_by_category_and_type(start_date, end_date)
+            transaction_count = sum(count for _, _, _, count in totals)
+            return category_summary_from_totals(totals), transaction_count
+
+        return self._cached_result(
+            ("category_summary", start_date, end_date),
+            self._offloaded("get_category_summary", compute, start_date=start_date, end_date=end_date),
+        )
+
+    def get_monthly_forecast(
+        self,
+        transaction_type: TransactionType,
+        months_to_predict: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[Dict[str, Any], int]:
+        """Linear forecast of monthly totals and the number of transactions
+        in the history it was fitted on."""
+        def compute() -> Tuple[Dict[str, Any], int]:
+            monthly = self._sum_by_month(start_date, end_date, transaction_type)
+            forecast = monthly_forecast_from_totals(
+                [(month, total) for month, total, _ in monthly],
+                transaction_type,
+                months_to_predict,
+                self._forecast_backend,
+            )
+            return forecast, sum(count for _, _, count in monthly)
+
+        return self._cached_result(
+            ("monthly_forecast", start_date, end_date, transaction_type, months_to_predict),
+            self._offloaded(
+                "get_monthly_forecast",
+                compute,
+                transaction_type=transaction_type,
+                months_to_predict=months_to_predict,
+                start_date=start_date,
+                end_date=end_date,
+            ),
+        )
+
+    def _cached_result(self, key: Tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+        # Results are shared between callers and must not be mutated
+        if self._result_cache is None or self._table_version_dao is None:
+            return compute()
+        version = self._table_version_dao.read("transactions")
+        return self._result_cache.get_or_load((version,) + key, compute)
+
+    def _offloaded(self, method: str, compute: Callable[[], Any], **kwargs) -> Callable[[], Any]:
+        # ``compute`` in-process, or the same method in an executor worker
+        if self._analytics_executor is None:
+            return compute
+        return lambda: self._analytics_executor.run(method, **kwargs)
+
+    def _invalidate(self, transaction_id: int) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(transaction_id)
+
+    def _sum_by_month(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        transaction_type: Optional[TransactionType],
+    ) -> List[Tuple[str, float, int]]:
+        # Whole-month ranges are answered from the rollup, others from the ledger
+        months = whole_month_range(start_date, end_date)
+        if months is not None and self._monthly_totals_dao is not None:
+            return self._monthly_totals_dao.sum_by_month(*months, transaction_type)
+        return self._transaction_dao.sum_by_month(start_date, end_date, transaction_type)
\ No newline at end of file
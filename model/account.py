@@ -2,7 +2,7 @@ from abc import abstractmethod
 from dataclasses import dataclass
 from typing import List
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Account:
     _id: int
     _name: str
@@ -1,16 +1,16 @@
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from typing import ClassVar, List
 
 from model.account import Account
 from utils.enums import AccountType, Currency
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class BankAccount(Account):
-    _accountType: AccountType = field(init=False, default=AccountType.BANK)
+    _accountType: ClassVar[AccountType] = AccountType.BANK
     _currency: Currency
 
     def __init__(self, id: int, name: str, currency: Currency):
-        super().__init__(id, name)
+        Account.__init__(self, id, name)
         self._currency = currency
 
     @property
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
+from typing import List
 from utils.enums import Category
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Budget:
     _id: int
     _month: str
@@ -34,4 +35,12 @@ class Budget:
         return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash(self.id)
\ No newline at end of file
+        return hash(self.id)
+
+    def transform_to_csv(self) -> List[str]:
+        return [
+            str(self.id),
+            self.month,
+            self.category.value,
+            str(self.limit_amount),
+        ]
\ No newline at end of file
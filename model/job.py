@@ -0,0 +1,68 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from utils.enums import JobKind, JobStatus
+
+@dataclass(eq=False, slots=True)
+class Job:
+    _id: int
+    _kind: JobKind
+    _params: Dict[str, Any]
+    _status: JobStatus = field(default=JobStatus.QUEUED)
+    _progress: float = field(default=0.0)
+    _result: Optional[Any] = field(default=None)
+    _error: Optional[str] = field(default=None)
+    _created_at: Optional[str] = field(default=None)
+    _started_at: Optional[str] = field(default=None)
+    _finished_at: Optional[str] = field(default=None)
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def kind(self) -> JobKind:
+        return self._kind
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        return self._params
+
+    @property
+    def status(self) -> JobStatus:
+        return self._status
+
+    @property
+    def progress(self) -> float:
+        return self._progress
+
+    @property
+    def result(self) -> Optional[Any]:
+        return self._result
+
+    @property
+    def error(self) -> Optional[str]:
+        return self._error
+
+    @property
+    def created_at(self) -> Optional[str]:
+        return self._created_at
+
+    @property
+    def started_at(self) -> Optional[str]:
+        return self._started_at
+
+    @property
+    def finished_at(self) -> Optional[str]:
+        return self._finished_at
+
+    @property
+    def finished(self) -> bool:
+        return self._status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Job):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import date
+from typing import List
 from utils.enums import Category, TransactionType
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     _id: int
     _account_id: int
@@ -58,4 +59,15 @@ class Transaction:
         return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash(self.id)
\ No newline at end of file
+        return hash(self.id)
+
+    def transform_to_csv(self) -> List[str]:
+        return [
+            str(self.id),
+            str(self.account_id),
+            self.date.isoformat(),
+            str(self.amount),
+            self.description,
+            self.category.value,
+            self.transaction_type.value,
+        ]
\ No newline at end of file
@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app_state import AppState
+
+@pytest.fixture
+def app_state(tmp_path):
+    state = AppState(tmp_path / "test.db")
+    yield state
+    state.close()
+
+@pytest.fixture
+def app(app_state):
+    from api import ApiConnection
+
+    app = ApiConnection(app_state).app
+    yield app
+    app.config['job_manager'].close()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
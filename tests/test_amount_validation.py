@@ -0,0 +1,68 @@
+from datetime import date
+
+import pytest
+
+from database.row_decoders import to_cents
+from model.transaction import Transaction
+
+def transaction(transaction_id, amount):
+    return {
+        'id': transaction_id,
+        'account_id': 1,
+        'date': '2024-03-01',
+        'amount': amount,
+        'category': 'Food',
+        'transaction_type': 'Expense',
+    }
+
+@pytest.mark.parametrize('amount', ['nan', 'inf', '-inf', '1e400', 1e300])
+def test_create_rejects_non_finite_amount(client, amount):
+    response = client.post('/api/transactions', json=transaction(1, amount))
+
+    assert response.status_code == 400
+    assert 'Invalid amount' in response.get_json()['error']
+    assert client.get('/api/transactions/1').status_code == 404
+
+def test_bulk_reports_non_finite_amount_per_row(client):
+    response = client.post('/api/transactions/bulk', json=[
+        transaction(1, 10.5),
+        transaction(2, 'nan'),
+        transaction(3, '1e400'),
+        transaction(4, 20),
+    ])
+
+    assert response.status_code == 207
+    body = response.get_json()
+    assert [(error['index'], error['id']) for error in body['errors']] == [(1, 2), (2, 3)]
+    assert client.get('/api/transactions/1').status_code == 200
+    assert client.get('/api/transactions/4').status_code == 200
+
+@pytest.mark.parametrize('amount', [float('nan'), float('inf'), 1e300])
+def test_to_cents_rejects_unstorable_amount(amount):
+    with pytest.raises(ValueError):
+        to_cents(amount)
+
+def test_create_many_skips_rows_to_cents_rejects(app_state):
+    rows = [Transaction(i, 1, date(2024, 1, 1), amount) for i, amount in enumerate([1.0, float('nan'), 2.0], 1)]
+
+    failures = app_state.transaction_dao.create_many(rows)
+
+    assert [position for position, _ in failures] == [1]
+    assert sorted(t.id for t in app_state.transaction_dao.read_all()) == [1, 3]
+
+@pytest.mark.parametrize('amount, cents', [
+    (12.345, 1235),
+    (1.005, 101),
+    (2.675, 268),
+    (-1.005, -101),
+    (0.125, 13),
+    (10.5, 1050),
+])
+def test_to_cents_rounds_half_cents_up(amount, cents):
+    assert to_cents(amount) == cents
+
+def test_create_rounds_half_cent_amount(client):
+    response = client.post('/api/transactions', json=transaction(1, 12.345))
+
+    assert response.status_code == 201
+    assert client.get('/api/transactions/1').get_json()['transaction']['amount'] == 12.35
@@ -0,0 +1,31 @@
+import sqlite3
+
+import pytest
+
+from database import DatabaseConnection
+
+def test_failed_commit_is_rolled_back_before_release(tmp_path):
+    path = tmp_path / "busy.db"
+    # Rollback journal: a commit needs an exclusive lock, so an open reader
+    # makes it fail with SQLITE_BUSY once the busy timeout runs out
+    db = DatabaseConnection(path, pool_size=1, pragmas={"journal_mode": "DELETE", "busy_timeout": 50})
+    with db as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+
+    reader = sqlite3.connect(path)
+    reader.execute("BEGIN")
+    reader.execute("SELECT * FROM t").fetchall()
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        with db as conn:
+            conn.execute("INSERT INTO t VALUES (2)")
+    reader.rollback()
+    reader.close()
+
+    # pool_size=1: the same connection comes back, without the failed write
+    with db as conn:
+        assert not conn.in_transaction
+        assert [row[0] for row in conn.execute("SELECT x FROM t")] == [1]
+    with db as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+    db.close()
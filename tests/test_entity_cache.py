@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from api import ApiConnection
+
+TTL = 0.05
+
+@pytest.fixture
+def workers(app_state):
+    # Two API processes over one database, as gunicorn runs them: each has
+    # its own managers and caches, which see the other's writes once the
+    # cached entry expires
+    apps = [ApiConnection(app_state, entity_cache_ttl=TTL).app for _ in range(2)]
+    yield [app.test_client() for app in apps]
+    for app in apps:
+        app.config['job_manager'].close()
+
+def test_account_update_in_one_worker_is_seen_by_the_other(workers):
+    first, second = workers
+    first.post('/api/accounts', json={'id': 1, 'name': 'Old', 'account_type': 'Bank', 'currency': 'EUR'})
+    assert second.get('/api/accounts/1').get_json()['account']['name'] == 'Old'
+
+    assert first.put('/api/accounts/1', json={'name': 'New'}).status_code == 200
+    time.sleep(TTL * 2)
+
+    assert second.get('/api/accounts/1').get_json()['account']['name'] == 'New'
+
+def test_transaction_delete_in_one_worker_is_seen_by_the_other(workers):
+    first, second = workers
+    first.post('/api/transactions', json={
+        'id': 1, 'account_id': 1, 'date': '2024-03-01', 'amount': 5, 'category': 'Food',
+    })
+    assert second.get('/api/transactions/1').status_code == 200
+
+    assert first.delete('/api/transactions/1').status_code == 200
+    time.sleep(TTL * 2)
+
+    assert second.get('/api/transactions/1').status_code == 404
+
+def test_budget_update_in_one_worker_is_seen_by_the_other(workers):
+    first, second = workers
+    first.post('/api/budgets', json={'id': 1, 'month': '2024-03', 'category': 'Food', 'limit_amount': 100})
+    assert second.get('/api/budgets/1').get_json()['budget']['limit_amount'] == 100
+
+    assert first.put('/api/budgets/1', json={'limit_amount': 250}).status_code == 200
+    time.sleep(TTL * 2)
+
+    assert second.get('/api/budgets/1').get_json()['budget']['limit_amount'] == 250
+
+def test_repeated_get_is_served_from_the_cache(app, client):
+    client.post('/api/accounts', json={'id': 1, 'name': 'A', 'account_type': 'Wallet', 'currency': 'USD'})
+    client.get('/api/accounts/1')
+    client.get('/api/accounts/1')
+
+    stats = app.config['caches']['accounts'].stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+
+
+def test_update_evicts_the_cached_entry(app, client):
+    client.post('/api/accounts', json={'id': 1, 'name': 'Old', 'account_type': 'Bank', 'currency': 'EUR'})
+    assert client.get('/api/accounts/1').get_json()['account']['name'] == 'Old'
+
+    assert client.put('/api/accounts/1', json={'name': 'New'}).status_code == 200
+
+    assert client.get('/api/accounts/1').get_json()['account']['name'] == 'New'
+    assert app.config['caches']['accounts'].stats()['invalidations'] == 1
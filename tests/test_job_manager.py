@@ -0,0 +1,115 @@
+import csv
+import os
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+
+import manager.job_manager as job_manager_module
+from database import BudgetDAO, DatabaseConnection, JobDAO
+from manager.job_manager import JobManager
+from manager.transaction_manager import TransactionManager
+from model.budget import Budget
+from model.transaction import Transaction
+from utils.enums import Category, JobKind, JobStatus, TransactionType
+
+ROWS = 5000
+
+def wait_for(job_manager, job_id, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        job = job_manager.get_job(job_id)
+        if job.status in (JobStatus.SUCCEEDED, JobStatus.FAILED) or time.monotonic() > deadline:
+            return job
+        time.sleep(0.01)
+
+def test_export_progress_is_visible_and_writes_proceed_mid_export(app_state, tmp_path, monkeypatch):
+    app_state.transaction_dao.create_many([
+        Transaction(i, 1, date(2020, 1, 1) + timedelta(days=i % 900), float(i), "", Category.OTHER, TransactionType.EXPENSE)
+        for i in range(1, ROWS + 1)
+    ])
+    monkeypatch.setattr(job_manager_module, "PROGRESS_INTERVAL", 0)
+
+    # Another server process: its own connections, a short busy timeout
+    other_db = DatabaseConnection(app_state.db.db_path, pool_size=1, pragmas={"journal_mode": "WAL", "busy_timeout": 200})
+    observed = {}
+
+    def poll_from_other_process():
+        try:
+            with other_db as conn:
+                observed["progress"] = conn.execute(
+                    "SELECT progress FROM jobs WHERE status = 'running'"
+                ).fetchone()[0]
+            BudgetDAO(other_db).create(Budget(1, "2024-01", Category.FOOD, 100.0))
+            observed["write"] = "ok"
+        except Exception as e:
+            observed["write"] = repr(e)
+
+    write_csv = job_manager_module.write_csv
+
+    def write_csv_and_poll(columns, row_batches, stream):
+        def batches():
+            for index, rows in enumerate(row_batches):
+                if index == 3:
+                    # Three pages done and reported; poll as a client would
+                    poller = threading.Thread(target=poll_from_other_process)
+                    poller.start()
+                    poller.join()
+                yield rows
+        return write_csv(columns, batches(), stream)
+
+    monkeypatch.setattr(job_manager_module, "write_csv", write_csv_and_poll)
+    job_manager = JobManager(
+        app_state.job_dao,
+        TransactionManager(app_state.transaction_dao, app_state.monthly_totals_dao),
+        export_dir=tmp_path / "jobs",
+    )
+    try:
+        job = wait_for(job_manager, job_manager.submit_job(JobKind.EXPORT, {"format": "csv"}).id)
+    finally:
+        job_manager.close()
+        other_db.close()
+
+    assert job.status is JobStatus.SUCCEEDED, job.error
+    assert 0 < observed["progress"] < 1
+    assert observed["write"] == "ok"
+    assert job.result["rows"] == ROWS
+    with open(tmp_path / "jobs" / job.result["file"], newline="") as stream:
+        ids = [int(row["id"]) for row in csv.DictReader(stream)]
+    assert sorted(ids) == list(range(1, ROWS + 1))
+
+def test_pages_match_streaming_rows(app_state):
+    app_state.transaction_dao.create_many([
+        Transaction(i, 1, date(2024, 1, 1) + timedelta(days=i % 7), float(i), "", Category.FOOD,
+                    TransactionType.INCOME if i % 3 else TransactionType.EXPENSE)
+        for i in range(1, 101)
+    ])
+    dao = app_state.transaction_dao
+    filters = (date(2024, 1, 2), date(2024, 1, 6), TransactionType.INCOME)
+
+    streamed = [tuple(row) for rows in dao.iter_filtered_rows(*filters) for row in rows]
+    paged = [tuple(row) for rows in dao.iter_filtered_pages(*filters, page_size=7) for row in rows]
+
+    assert paged == streamed
+    assert len(paged) > 7
+
+def test_export_files_live_next_to_the_database_and_expire(app_state):
+    job_manager = JobManager(
+        app_state.job_dao,
+        TransactionManager(app_state.transaction_dao, app_state.monthly_totals_dao),
+        export_retention=60,
+    )
+    try:
+        job = wait_for(job_manager, job_manager.submit_job(JobKind.EXPORT, {"format": "csv"}).id)
+        path = job_manager.get_export_path(job.id)
+        assert path.parent == app_state.db.db_path.parent / "test-jobs"
+
+        # Written longer ago than the retention period
+        os.utime(path, (time.time() - 120, time.time() - 120))
+        assert job_manager.remove_expired_exports() == 1
+        assert not path.exists()
+        with pytest.raises(ValueError):
+            job_manager.get_export_path(job.id)
+    finally:
+        job_manager.close()
@@ -0,0 +1,69 @@
+import sqlite3
+
+import pytest
+
+import wsgi
+from app_state import AppState
+from database import DatabaseConnection, MigrationRunner
+from exceptions.finance_manager_exception import SchemaOutOfDateException
+
+def test_check_only_app_state_refuses_unmigrated_database(tmp_path):
+    path = tmp_path / "new.db"
+
+    with pytest.raises(SchemaOutOfDateException, match="manage.py migrate"):
+        AppState(path, migrate=False)
+
+    # Checking is read-only: not even the version table was created
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT name FROM sqlite_master").fetchall() == []
+
+def test_check_only_app_state_accepts_migrated_database(tmp_path):
+    path = tmp_path / "migrated.db"
+    AppState(path).close()
+
+    state = AppState(path, migrate=False)
+    try:
+        assert MigrationRunner(state.db).pending() == []
+    finally:
+        state.close()
+
+def test_workers_only_check_after_server_migrated(tmp_path, monkeypatch):
+    monkeypatch.setenv("PF_DB_PATH", str(tmp_path / "server.db"))
+    monkeypatch.setenv("PF_ANALYTICS_WORKERS", "0")
+
+    with pytest.raises(SchemaOutOfDateException):
+        wsgi.create_app()
+
+    applied = wsgi.migrate_database()
+    assert [m.version for m in applied] == [m.version for m in MigrationRunner(None).discover()]
+    assert wsgi.migrate_database() == []
+
+    app = wsgi.create_app()
+    try:
+        assert app.test_client().get('/api/accounts').status_code == 200
+    finally:
+        wsgi.close_app(app)
+
+def test_pending_lists_unapplied_migrations(tmp_path):
+    db = DatabaseConnection(tmp_path / "partial.db", pool_size=1)
+    runner = MigrationRunner(db)
+    first = runner.discover()[0]
+    runner._apply(first)
+    try:
+        assert [m.version for m in runner.pending()] == [m.version for m in runner.discover()[1:]]
+    finally:
+        db.close()
+
+def test_run_inside_open_transaction_leaves_it_uncommitted(tmp_path):
+    AppState(tmp_path / "shared.db").close()
+    db = DatabaseConnection(tmp_path / "shared.db", pool_size=1)
+    try:
+        with pytest.raises(RuntimeError, match="open transaction"):
+            with db as conn:
+                conn.execute("INSERT INTO accounts (id, name, account_type, currency) VALUES (1, 'A', 'Bank', 'EUR')")
+                MigrationRunner(db).run()
+
+        with db as conn:
+            assert conn.execute("SELECT COUNT(*) FROM accounts").fetchone()[0] == 0
+    finally:
+        db.close()
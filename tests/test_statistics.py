@@ -0,0 +1,55 @@
+import statistics
+from datetime import date
+
+import pytest
+
+from database import DatabaseConnection
+from manager.statistics_manager import amount_statistics_from_aggregates
+from model.transaction import Transaction
+from utils.enums import Category, TransactionType
+
+def insert_amounts(app_state, amounts):
+    app_state.transaction_dao.create_many([
+        Transaction(i, 1, date(2024, 1, 1 + i % 28), amount, "", Category.OTHER, TransactionType.EXPENSE)
+        for i, amount in enumerate(amounts, 1)
+    ])
+
+def test_std_of_large_close_amounts_is_stable(app_state):
+    cents = [1, 2, 3, 4, 6]
+    insert_amounts(app_state, [10_000_000_000 + c / 100 for c in cents])
+
+    result = amount_statistics_from_aggregates(app_state.transaction_dao.aggregate_amounts())
+
+    # Stored amounts are exact cents; the naive sum-of-squares formula is
+    # off by orders of magnitude here
+    assert result["std"] == pytest.approx(statistics.stdev(cents) / 100, rel=1e-6)
+    assert result["median"] == pytest.approx(10_000_000_000.03)
+
+def test_statistics_match_python(app_state):
+    amounts = [12.5, 99.99, 0.01, 42.0, 7.25, 1000.0]
+    insert_amounts(app_state, amounts)
+
+    result = amount_statistics_from_aggregates(app_state.transaction_dao.aggregate_amounts())
+
+    assert result["count"] == 6
+    assert result["mean"] == pytest.approx(statistics.mean(amounts))
+    assert result["median"] == pytest.approx(statistics.median(amounts))
+    assert result["std"] == pytest.approx(statistics.stdev(amounts))
+
+def test_snapshot_does_not_see_concurrent_insert(app_state, tmp_path):
+    insert_amounts(app_state, [1.0, 2.0])
+    writer = DatabaseConnection(tmp_path / "test.db", pool_size=1)
+    try:
+        with app_state.db.snapshot() as conn:
+            before = conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+            with writer as other:
+                other.execute(
+                    "INSERT INTO transactions (id, account_id, day, amount_cents, description, category, transaction_type)"
+                    " VALUES (3, 1, 19723, 300, '', 'Other', 'Expense')"
+                )
+            after = conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+    finally:
+        writer.close()
+
+    assert before == after == 2
+    assert app_state.transaction_dao.count_filtered() == 3
@@ -0,0 +1,17 @@
+import sqlite3
+from datetime import date
+
+from model.transaction import Transaction
+from utils.enums import Category, TransactionType
+
+def test_read_filtered_leaves_connection_row_factory(app_state):
+    dao = app_state.transaction_dao
+    dao.create(Transaction(1, 1, date(2024, 1, 5), 12.5, "a", Category.FOOD, TransactionType.EXPENSE))
+    dao.create(Transaction(2, 1, date(2024, 2, 5), 100.0, "b", Category.OTHER, TransactionType.INCOME))
+
+    transactions = dao.read_filtered()
+
+    assert sorted(t.amount for t in transactions) == [12.5, 100.0]
+    with app_state.db as conn:
+        assert conn.row_factory is sqlite3.Row
+        assert isinstance(conn.execute("SELECT id FROM transactions").fetchone(), sqlite3.Row)
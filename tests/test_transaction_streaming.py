@@ -0,0 +1,28 @@
+import json
+from datetime import date, timedelta
+
+from model.transaction import Transaction
+from utils.enums import Category, TransactionType
+
+ROWS = 2500
+
+def test_ndjson_download_holds_no_connection_between_pages(app, app_state):
+    app_state.transaction_dao.create_many([
+        Transaction(i, 1, date(2020, 1, 1) + timedelta(days=i % 900), float(i), "", Category.OTHER, TransactionType.EXPENSE)
+        for i in range(1, ROWS + 1)
+    ])
+    client = app.test_client()
+
+    response = client.get('/api/transactions?format=ndjson', buffered=False)
+    chunks = iter(response.response)
+    lines = next(chunks).splitlines()
+
+    # A slow client mid-download: the pool has no connection checked out
+    assert app_state.db.pool_stats()['in_use'] == 0
+
+    for chunk in chunks:
+        lines += chunk.splitlines()
+    response.close()
+    ids = [json.loads(line)['id'] for line in lines]
+    assert sorted(ids) == list(range(1, ROWS + 1))
+    assert len(ids) == len(set(ids))
@@ -19,4 +19,16 @@ class TransactionType(Enum):
 
 class Currency(Enum):
     USD = "USD"
-    EUR = "EUR"
\ No newline at end of file
+    EUR = "EUR"
+
+class JobKind(Enum):
+    STATISTICS = "statistics"
+    CATEGORY_SUMMARY = "category_summary"
+    FORECAST = "forecast"
+    EXPORT = "export"
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
@@ -0,0 +1,40 @@
+import os
+from typing import Optional
+
+# Serving settings read from the environment (see README, "Running in production")
+ENV_PREFIX = "PF_"
+
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off", "")
+
+def env_str(name: str, default: Optional[str] = None) -> Optional[str]:
+    return os.environ.get(ENV_PREFIX + name, default)
+
+def env_int(name: str, default: int) -> int:
+    value = env_str(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{ENV_PREFIX}{name} must be an integer, got '{value}'") from None
+
+def env_float(name: str, default: float) -> float:
+    value = env_str(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{ENV_PREFIX}{name} must be a number, got '{value}'") from None
+
+def env_bool(name: str, default: bool = False) -> bool:
+    value = env_str(name)
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    if normalized in _TRUE:
+        return True
+    if normalized in _FALSE:
+        return False
+    raise ValueError(f"{ENV_PREFIX}{name} must be a boolean (1/0, true/false), got '{value}'")
@@ -0,0 +1,122 @@
+"""Production entry point.
+
+    gunicorn -c gunicorn.conf.py "wsgi:create_app()"
+    python wsgi.py                      # waitress (e.g. on Windows)
+
+``python main.py`` stays the development server.
+"""
+import signal
+
+from flask import Flask
+
+from api import ApiConnection
+from app_state import AppState
+from database import DatabaseConnection, MigrationRunner
+from database.connection_pool import DEFAULT_POOL_SIZE
+from manager.job_manager import DEFAULT_JOB_EXPORT_RETENTION, DEFAULT_JOB_WORKERS
+from manager.analytics_executor import (
+    AnalyticsExecutor,
+    DEFAULT_ANALYTICS_MAX_PENDING,
+    DEFAULT_ANALYTICS_TIMEOUT,
+    DEFAULT_ANALYTICS_WORKERS,
+)
+from utils import metrics
+from utils.env import env_bool, env_float, env_int, env_str
+
+DEFAULT_HOST = "0.0.0.0"
+DEFAULT_PORT = 5000
+DEFAULT_THREADS = 4
+# Seconds a worker may serve a single-item GET from its entity cache after
+# another worker changed the row
+DEFAULT_ENTITY_CACHE_TTL = 2.0
+
+def migrate_database() -> list:
+    """Apply the pending schema migrations to PF_DB_PATH and return them.
+
+    Runs once per server start, before any worker exists (gunicorn's
+    on_starting hook, or serve()): a migration that rebuilds a large table
+    holds the write lock for longer than the workers' busy timeout, so they
+    must not run it concurrently. Its connection is closed again so none is
+    inherited by the forked workers.
+    """
+    db = DatabaseConnection(env_str("DB_PATH"), pool_size=1)
+    try:
+        return MigrationRunner(db).run()
+    finally:
+        db.close()
+
+def create_app() -> Flask:
+    """Build the application with its own AppState and connection pool.
+
+    Called once per worker process, after the fork (gunicorn runs the
+    factory in each worker unless preload_app is set), so pooled SQLite
+    connections are never shared between processes. The schema must already
+    be migrated (see migrate_database); a worker only checks its version and
+    refuses to start if migrations are pending. The pool is sized for
+    the worker's threads; every DAO call holds one connection. Statistics,
+    category summaries and forecasts run in the worker's own analytics
+    process pool (PF_ANALYTICS_WORKERS=0 computes them on the request thread).
+    """
+    # Before the pool opens connections, which are instrumented only if enabled
+    metrics.set_enabled(env_bool("METRICS", True))
+
+    threads = env_int("THREADS", DEFAULT_THREADS)
+    app_state = AppState(
+        db_path=env_str("DB_PATH"),
+        pool_size=env_int("POOL_SIZE", max(DEFAULT_POOL_SIZE, threads)),
+        migrate=False,
+    )
+    analytics_workers = env_int("ANALYTICS_WORKERS", DEFAULT_ANALYTICS_WORKERS)
+    analytics_executor = None
+    if analytics_workers > 0:
+        analytics_executor = AnalyticsExecutor.for_database(
+            app_state.db,
+            max_workers=analytics_workers,
+            max_pending=env_int("ANALYTICS_MAX_PENDING", DEFAULT_ANALYTICS_MAX_PENDING),
+            timeout=env_float("ANALYTICS_TIMEOUT", DEFAULT_ANALYTICS_TIMEOUT),
+        )
+    return ApiConnection(
+        app_state,
+        analytics_executor,
+        job_workers=env_int("JOB_WORKERS", DEFAULT_JOB_WORKERS),
+        job_export_retention=env_float("JOB_EXPORT_RETENTION", DEFAULT_JOB_EXPORT_RETENTION),
+        entity_cache_ttl=env_float("ENTITY_CACHE_TTL", DEFAULT_ENTITY_CACHE_TTL),
+    ).app
+
+def close_app(app: Flask) -> None:
+    """Wait for running background jobs, then close the app's analytics
+    workers and connection pool. Connections still checked out by in-flight
+    requests are closed when they are released."""
+    app.config['job_manager'].close()
+    analytics_executor = app.config['analytics_executor']
+    if analytics_executor is not None:
+        analytics_executor.close()
+    app.config['database'].close()
+
+def serve() -> None:
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        raise SystemExit(
+            "waitress is not installed. Install it (pip install waitress) or run "
+            "gunicorn -c gunicorn.conf.py \"wsgi:create_app()\""
+        ) from None
+
+    # Stop on SIGTERM like on Ctrl+C, so the pool is closed below. waitress
+    # does not drain in-flight requests; use gunicorn where that matters.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    migrate_database()
+    app = create_app()
+    try:
+        waitress_serve(
+            app,
+            host=env_str("HOST", DEFAULT_HOST),
+            port=env_int("PORT", DEFAULT_PORT),
+            threads=env_int("THREADS", DEFAULT_THREADS),
+        )
+    finally:
+        close_app(app)
+
+if __name__ == "__main__":
+    serve()